@@ -4,4 +4,6 @@ from pygame.color import Color
 
 # C'est pour les couleurs qu'utilise pygame
 RGBAOutput = Tuple[int, int, int, int]
-ColorValue = Union[Color, int, str, Tuple[int, int, int], RGBAOutput, Sequence[int]]
\ No newline at end of file
+ColorValue = Union[Color, int, str, Tuple[int, int, int], RGBAOutput, Sequence[int]]
+# C'est pour les touches des actions, une seule touche ou une liste de touches alternatives
+KeybindValue = Union[int, Sequence[int]]
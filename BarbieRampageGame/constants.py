@@ -9,6 +9,11 @@ GAME_VERSION = "V0.5"
 
 # Le nombre d'images par seconde
 FPS = 60
+# Images par seconde des écrans où rien ne bouge, comme les menus
+MENU_FPS = 30
+# Images par seconde des écrans où rien ne bouge quand le joueur n'a rien fait depuis IDLE_DELAY millisecondes
+IDLE_FPS = 10
+IDLE_DELAY = 3000
 
 # Dénominateur pour les calculs de la taille des entités
 SPRITE_SCALING = 1/35
@@ -45,6 +50,21 @@ TILE_TYPES = TILE_TYPES_WITHOUT_PLAYER_AND_ENEMIES + PLAYER_AND_ENEMIES_TILE_TYP
 # Les constantes in-game
 GRAVITY = 0.75
 
+# Vitesse de défilement de l'arrière-plan par rapport au monde
+BACKGROUND_SCROLL_FACTOR = 0.2
+
+# Temps maximal en secondes que les ennemis peuvent passer à réfléchir à chaque frame
+AI_FRAME_BUDGET = 0.002
+# Nombre d'ennemis qui réfléchissent à chaque frame pendant un enregistrement ou une rediffusion, pour que la réflexion ne dépende pas de la vitesse de la machine
+AI_FRAME_THINK_COUNT = 4
+
+# Nombre de colonnes en dehors de l'écran où les ennemis et les objets sont créés et au-delà desquelles ils sont retirés
+SPAWN_MARGIN_COLUMNS = 8
+DESPAWN_MARGIN_COLUMNS = 16
+
+# Facteur de réduction utilisé pour flouter l'image figée du jeu derrière les menus
+FROZEN_BACKGROUND_BLUR_FACTOR = 4
+
 WORLD_LIST = ["level1", "level Joel", "level4"]
 
 #### Les chemins vers les fichiers ####
@@ -76,12 +96,22 @@ TILES_TEXTURES_LOCATION = path.join(TEXTURES_ROOT, "tiles/")
 
 BACKGROUND_TEXTURES_LOCATION = path.join(TEXTURES_ROOT, "background/")
 
+# Manifeste qui décrit les animations, généré avec "python -m utils.animation_manifest"
+ANIMATION_MANIFEST_LOCATION = path.join(TEXTURES_ROOT, "animations.json")
+# Dossiers des textures qui ne contiennent pas d'animations
+NON_ANIMATED_TEXTURE_FOLDERS = ["tiles", "gui", "background", "weapons"]
+
 PS2P_FONT_LOCATION = path.join(FONTS_ROOT, "Press_Start_2P/PressStart2P-REGULAR.ttf")
 
 # Les sons
 WEAPON_CROSS_SOUND_LOCATION = path.join(SOUNDS_ROOT, "son_test.wav")
 BLASTER_SOUND_LOCATION = path.join(SOUNDS_ROOT, "blaster.wav")
 
+# Nombre de canaux du mixer réservés aux effets sonores
+SOUND_EFFECT_CHANNELS = 12
+# Distance à laquelle un son n'est plus entendu, en largeurs d'écran depuis le milieu de l'écran
+SOUND_HEARING_DISTANCE_FACTOR = 1
+
 SUPERSHY_MUSIC = path.join(SOUNDS_ROOT, "nj_supershy.wav" )
 BARBIE_GIRL_MUSIC = path.join(SOUNDS_ROOT, "barbie_girl.wav")
 DANCE_THE_NIGHT_MUSIC = path.join(SOUNDS_ROOT, "dance_the_night.mp3")
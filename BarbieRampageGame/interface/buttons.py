@@ -31,6 +31,8 @@ class Button():
         self.update_time = pygame.time.get_ticks()
         
         self.clickable = True
+        
+        self.input_states = UserInputStates.get_instance()
     
     def set_clickability_state(self, state: bool):
         """Change l'accès au bouton
@@ -77,17 +79,17 @@ class Button():
         action = False
         
         if self.clickable:
-            # Position de la souris
-            mpos = pygame.mouse.get_pos()
+            # État de la souris pendant la frame
+            inputs = self.input_states.snapshot
 
             # Vérifie si la souris a clické sur le bouton
-            if self.rect.collidepoint(mpos):
-                if pygame.mouse.get_pressed()[0] == 1 and self.clicked == False:
+            if self.rect.collidepoint(inputs.mouse_pos):
+                if inputs.mouse_buttons[0] and self.clicked == False:
                     action = True
                     self.clicked = True
                     self.set_clicked_img()
 
-                if pygame.mouse.get_pressed()[0] == 0:
+                if not inputs.mouse_buttons[0]:
                     self.clicked = False
         
         return action
@@ -182,7 +184,7 @@ class DropDown():
             int: index de l'option choisie, -1 si aucune option n'a été choisie
         """
         # Position de la souris
-        mpos = pygame.mouse.get_pos()
+        mpos = self.input_states.snapshot.mouse_pos
         # Si la souris est se trouve sur le menu
         self.menu_active = self.rect.collidepoint(mpos)
         
@@ -247,14 +249,14 @@ class InputBox(ActivableUI):
             event (pygame.event.Event): évènement de pygame
         """
         self.clicked = False
-        mpos = pygame.mouse.get_pos()
         
         if self.is_off:
             return
         
-        if self.input_states.mouse_single_pressed():
+        # Le clic est lu dans son évènement pour n'être traité qu'une seule fois
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Si l'utilisateur a cliqué sur l'entrée de texte
-            if self.rect.collidepoint(mpos):
+            if self.rect.collidepoint(event.pos):
                 # Fais basculer l'état du l'entrée
                 self.active = not self.active
             else:
@@ -3,8 +3,7 @@
 import pygame, os, sys
 
 from constants import *
-from world import World
-import utils, menus, interface, weapon, inventory
+import utils, interface, scenes
 
 print(f"Bienvenue dans le jeu Barbie Rampage!\nVersion: {GAME_VERSION}\nPar la CMD-squad\n")
 
@@ -31,7 +30,7 @@ screen = pygame.display.set_mode((game_settings.screen_width, game_settings.scre
 pygame.display.set_caption(f"{GAME_NAME} {GAME_VERSION}")
 
 # Met en place l'horloge
-clock = pygame.time.Clock()
+frame_pacer = utils.FramePacer()
 
 # Tous les assets du jeu, c'est-à-dire les images, les sons, les polices, etc...
 assets = utils.Assets(game_settings)
@@ -39,6 +38,24 @@ assets.set_volume(game_settings.volume)
 
 # Pour les imputs du joueur
 user_inputs_utils = utils.UserInputStates.get_instance()
+user_inputs_utils.set_action_map(game_settings.action_map)
+
+# Horloge de la simulation, elle n'avance que pendant la partie
+simulation_clock = utils.SimulationClock.get_instance()
+# Toutes les animations sont avancées ensemble avec le temps de la simulation
+animation_system = utils.AnimationSystem.get_instance()
+
+# Enregistrement ou rediffusion des entrées, la graine des générateurs aléatoires est gardée pour que la partie soit reproductible
+random_service = utils.RandomService.get_instance()
+if game_settings.replay_file:
+    random_service.seed(user_inputs_utils.start_replay(game_settings.replay_file))
+elif game_settings.do_record_inputs:
+    user_inputs_utils.start_recording(game_settings.action_map.get_bound_keys(), random_service.master_seed)
+
+# Mesure le temps passé dans chaque étape de la boucle
+frame_profiler = utils.FrameProfiler(game_settings.do_profile_frames)
+# Session de profilage démarrée et arrêtée avec F9
+profiling_session = utils.ProfilingSession(pygame.K_F9)
 
 ### Fonctions ###
 
@@ -56,231 +73,85 @@ def timer_minute(time_milisec: int) -> str:
     hour = min // 60
     return f"{hour:02}:{min - hour * 60:02}:{sec - min * 60:02}"
 
-def change_music():
-    """Change la musique du jeu
-    """
-    global current_music_index
-    current_music_index = (current_music_index + 1) % len(GAME_MUSICS)
-    
-    pygame.mixer.music.load(GAME_MUSICS[current_music_index])
-    pygame.mixer.music.set_volume(game_settings.volume)
-    pygame.mixer.music.play(loops = -1, start = 0.0, fade_ms = 0)
-
-def spawn_player(inventory: inventory.Inventory = None, do_regenerate: bool = True):
-    """Fais réapparaître le joueur et réinitialise le monde
-
-    Args:
-        inventory (Inventory, optional): inventaire du joueur. None par défaut
-        do_regenerate (bool, optional): si le monde doit être régénéré. True par défaut
-    
-    Returns:
-        Player: joueur recréé
-    """
-    death_menu.reset_animation(game_settings.screen_width)
-    if do_regenerate:
-        world.restart_level(assets, game_settings)
-    else:
-        change_music()
-    player = world.process_data(assets, inventory)
-    world.set_debug_display(game_settings.do_draw_hitboxes)
-    
-    # Création des éléments de l'interface
-    player.create_health_bar(10, game_settings.screen_width // 18, assets)
-    player.create_kill_counter(10, int(game_settings.screen_width * 5/45), assets, world)
-    player.create_bullet_counter(10, int(game_settings.screen_width * 33/45), assets)
-    
-    return player
-
-
 ### Initialisation des variables ###
 
-# Création des menus
-start_menu = menus.StartMenu(assets, game_settings)
-death_menu = menus.DeathMenu(assets, game_settings)
-pause_menu = menus.PauseMenu(assets, game_settings)
-inventory_menu = menus.InventoryMenu(assets, game_settings)
-settings_menu = menus.SettingsMenu(assets, game_settings)
-talented_tree_menu = menus.SkillMenu(assets, game_settings)
-weapons_menu = menus.WeaponsMenu(assets, game_settings)
-skins_menu = menus.SkinsMenu(assets, game_settings)
-trophies_menu = menus.TrophiesMenu(assets, game_settings)
-
-overlay = menus.Overlay(assets)
-
-# Initialisation du monde et du joueur
-world = World()
-world.first_level(assets, game_settings)
-
-player = spawn_player()
-
-player_inventory = player.inventory
-
-# Debug
-
-# Variables pour la boucle
-run = True
-game_loading = True
-pause = False
-settings_choice = False
-inventory_choice = False
-talented_tree_choice = False
-trophies_choice = False
-skins_choice = False
-weapons_choice = False
-inventory_active = False
+# Le monde, le joueur et les menus partagés par les scènes
+game = scenes.GameContext(assets, game_settings, frame_profiler)
 
+# Pile des scènes, seule la scène du haut est mise à jour
+scene_stack = utils.SceneStack(game_settings.do_blur_paused_game)
+scene_stack.push(scenes.StartScene(game))
 
 current_time = pygame.time.get_ticks()
+# Entrées de la frame précédente, elles indiquent au contrôleur du rythme des images si le joueur est actif
+inputs = user_inputs_utils.snapshot
 
 # Boucle qui va permettre de faire tourner le jeu
-while run:  
+while scene_stack.is_running:
 
-    # Fait en sorte que le jeu tourne à un nombre limité de FPS
-    clock.tick(FPS)
+    # Fait en sorte que le jeu tourne à un nombre limité de FPS, réduit sur les écrans où rien ne bouge
+    frame_time = frame_pacer.tick(scene_stack.top, len(inputs.events) > 0)
+    frame_profiler.begin_frame()
+    
+    # Avance la simulation et les animations, d'un pas fixe pendant un enregistrement ou une rediffusion pour que la rediffusion refasse la même partie
+    is_deterministic = user_inputs_utils.is_recording or user_inputs_utils.is_replaying
+    simulation_time = 1000 / FPS if is_deterministic else frame_time
+    if scene_stack.top.advances_simulation:
+        simulation_clock.advance(simulation_time)
+    if scene_stack.top.advances_animations:
+        animation_system.advance(simulation_time)
+    frame_profiler.end_phase("timers")
+    
+    # Lecture des entrées de la frame
+    inputs = user_inputs_utils.begin_frame()
     
     current_time = pygame.time.get_ticks()
     
-    if game_loading:
-        game_loading = not start_menu.draw(screen, True)['start']
-    else:
-        
-        # Affiche les éléments à afficher à l'écran
-        world.draw(screen)
-        player.draw(screen)
-        world.update_groups()
-        world.draw_sprite_groups(screen)
-        
-        # Met à jour le joueur
-        player.update()
-        
-        # Affiche les éléments de l'interface
-        player.health_bar.draw(screen)
-        player.kill_counter.draw(screen)
-        player.bullet_counter.draw(screen)
-        overlay.draw(screen, world)
-        
-        # Gestion de certains menus
-        
-        if pause:
-            if settings_choice:
-                settings_buttons = settings_menu.draw(screen)
-                settings_choice = not settings_buttons['back']
-                if not settings_choice:
-                    settings_menu.set_menu_off()
-            else:
-                # Gestion du menu pause
-                pause_buttons = pause_menu.draw(screen)
-                if pause_buttons['quit'] or settings_menu.do_restart:
-                    run = False
-                elif pause_buttons['settings']:
-                    settings_choice = True
-                elif pause_buttons['back']:
-                    pause = False
-        else:
-            player.move(world, game_settings)
-             # Faire bouger les ennemis
-            for enemy in world.enemy_group:
-                enemy.ai(world)
-        
-        if not player.is_alive:
-            if death_menu.draw(screen, True)['respawn']:
-                player = spawn_player(player_inventory)
-        
-        elif player.is_ready_to_go_to_next_level:
-            world.go_to_next_level(assets, game_settings)
-            player = spawn_player(player_inventory, False)
-            
-        if inventory_active:
-            if talented_tree_choice :
-                talented_tree_buttons = talented_tree_menu.draw(screen)
-                if not talented_tree_choice:
-                    talented_tree_menu.set_menu_off()
-            elif trophies_choice :
-                trophies_buttons = trophies_menu.draw(screen)
-                if not trophies_choice:
-                    trophies_menu.set_menu_off()
-            elif skins_choice :
-                skins_buttons = skins_menu.draw(screen)
-                if not skins_choice:
-                    skins_menu.set_menu_off()
-            elif weapons_choice :
-                weapons_buttons = weapons_menu.draw(screen)
-                if not weapons_choice:
-                    weapons_menu.set_menu_off()
-            else: 
-                inventory_buttons = inventory_menu.draw(screen)
-                if inventory_buttons['talented tree']:
-                    talented_tree_choice = True
-                elif inventory_buttons['trophies']:
-                    trophies_choice = True
-                elif inventory_buttons['skins']:
-                    skins_choice = True
-                elif inventory_buttons['weapons']:
-                    weapons_choice = True
-           
+    # Met à jour et affiche la scène active
+    scene_stack.run(screen, inputs)
     
     if game_settings.do_draw_game_time:
         # Afficher le temps actuel à l'écran
         interface.draw_text(screen, "game time: ", assets.default_font, COLOR_DARK, 5, 5, False)
         interface.draw_text(screen, timer_minute(current_time), assets.default_font, COLOR_DARK, 15, 25, False)
     
+    if game_settings.do_draw_fps:
+        # Afficher les images par seconde visées et réelles
+        frame_pacer.draw(screen, assets.default_font)
+    
+    # Affiche les statistiques de la frame précédente
+    frame_profiler.draw(screen, assets.default_font)
+    frame_profiler.end_phase("ui")
+    
 
-    for event in pygame.event.get():
+    for event in inputs.events:
         user_inputs_utils.process_events(event)
         
         # Faire quitter la boucle si l'utilisateur quitte le jeu
         if event.type == pygame.QUIT:
-            run = False
-        
-        # Quand des touches sont pressées
-        if event.type == pygame.KEYDOWN:
-            
-            if event.key == pygame.K_RETURN:
-                if game_loading:
-                    # Lancer le jeu si la touche 'enter' est pressée
-                    game_loading = False
-                elif not player.is_alive:
-                    # Faire réapparaître le joueur si la touche 'enter' est pressée
-                    player = spawn_player(player_inventory)
-            if event.key == pygame.K_ESCAPE:
-                if (not game_loading) and player.is_alive:
-                    if settings_choice:
-                        settings_choice = False
-                    else:
-                        # Activer ou désactiver le menu pause
-                        pause = not pause
-            
-            if event.key == pygame.K_TAB:
-                if (not game_loading) and player.is_alive:
-                    player.shoot(world.bullet_group)
-            
-            if event.key == pygame.K_a:
-                player_inventory.swap_weapons()
+            scene_stack.quit()
+    frame_profiler.end_phase("events")
 
-            if event.key == pygame.K_i:
-                if (not game_loading) and player.is_alive:
-                    if talented_tree_choice:
-                        talented_tree_choice = False
-                    elif trophies_choice:
-                        trophies_choice = False
-                    elif skins_choice:
-                        skins_choice = False
-                    elif weapons_choice:
-                        weapons_choice = False
-                    else: 
-                        inventory_active = not inventory_active
-                    
-            if event.key == pygame.K_e:
-                player.check_collectibles(world)
+    # Les changements de volume de l'image sont appliqués en une seule fois
+    assets.sound_manager.update()
 
     # Mise à jour de l'écran à chaque tour de boucle
     pygame.display.update()
+    frame_profiler.end_phase("display")
+    frame_profiler.end_frame()
 
 # Sauvegarde des paramètres
 game_settings.save_settings()
+# Sauvegarde des entrées enregistrées
+user_inputs_utils.stop_recording()
+# Sauvegarde des mesures des dernières frames
+if frame_profiler.enabled:
+    frame_profiler.dump_csv()
+if profiling_session.is_running:
+    profiling_session.stop()
 # Fermeture du programme
 pygame.quit()
 
-if settings_menu.do_restart:
+if game.settings_menu.do_restart:
     # Redémarrer le jeu si l'utilisateur a choisi de redémarrer
     os.execl(sys.executable, sys.executable, *sys.argv)
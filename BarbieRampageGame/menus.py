@@ -1,4 +1,4 @@
-import pygame, random, os
+import pygame
 
 from constants import *
 import interface as gui
@@ -43,17 +43,19 @@ class PauseMenu(gui.Menu):
         self.semi_transparent_background.fill(self.background_color)
         
     
-    def draw(self, screen: pygame.Surface) -> dict[str, bool]:
+    def draw(self, screen: pygame.Surface, do_draw_background: bool = True) -> dict[str, bool]:
         """Affiche les images et les boutons à l'écran et renvoie les noms des boutons qui ont été cliqués
 
         Args:
             screen (pygame.Surface): écran sur lequel le menu doit s'afficher
+            do_draw_background (bool, optional): si le background à moitié transparent doit être affiché, False s'il est déjà dans l'image figée du jeu. True par défaut
 
         Returns:
             dict[str, bool]: noms des boutons avec la valeur true s'ils ont été cliqués
         """
         # Affiche le background à moitié transparent
-        screen.blit(self.semi_transparent_background, (0, 0))
+        if do_draw_background:
+            screen.blit(self.semi_transparent_background, (0, 0))
 
         clicked_buttons = super().draw(screen, False)
         
@@ -194,7 +196,7 @@ class Overlay(gui.Menu):
         """
         super().draw(screen, False)
         
-        collided_collectibles = pygame.sprite.spritecollide(world.player, world.collectible_group, False)
+        collided_collectibles = world.get_collectibles_near(world.player.rect)
         
         for collectible in collided_collectibles:
             if not collectible.collected:
@@ -212,15 +214,14 @@ class DeathMenu(gui.Menu):
         """
         super().__init__(COLOR_DARK)
         
-        # Valeur du temps pour l'animation
-        self.update_time = pygame.time.get_ticks()
-        
-        self.death_animation = self.load_death_animation(f"{TEXTURES_ROOT}deathscreen/falling/", f"{TEXTURES_ROOT}deathscreen/landing/")
-        self.frame_index = 0
-        self.barbie_head_rect = self.death_animation['falling'][0].get_rect()
+        death_animation = self.load_death_animation(f"{TEXTURES_ROOT}deathscreen/falling/", f"{TEXTURES_ROOT}deathscreen/landing/")
+        # Lecteur de l'animation de la tête, elle reste sur la dernière image de l'atterrissage
+        self.head_animator = utils.Animator(death_animation, 'falling', 50)
+        self.barbie_head_rect = death_animation['falling'].frames[0].get_rect()
         
         # Intervalle en pourcent pour le positionnement aléatoire de la tête sur l'axe horizontal
         self.RANDOM_RANGE = (20, 70)
+        self.random = utils.RandomService.get_instance().get_stream("menus")
         
         self.reset_animation(settings.screen_width)
         
@@ -231,7 +232,7 @@ class DeathMenu(gui.Menu):
         self.add_text_button('respawn', "PRESS ENTER TO RESPAWN T^T", assets.default_font_bigger, COLOR_HOT_PINK, settings.screen_width//2, settings.screen_height * 0.9, 1, True)
     
     
-    def load_death_animation(self, falling_texture_location: str, landing_texture_location: str) -> dict[str, list[pygame.Surface]]:
+    def load_death_animation(self, falling_texture_location: str, landing_texture_location: str) -> dict[str, utils.AnimationClip]:
         """Charge l'animation de la tête qui tombe
 
         Args:
@@ -239,62 +240,36 @@ class DeathMenu(gui.Menu):
             landing_texture_location (str): position des textures qui représentent la tête qui attérrit
 
         Returns:
-            dict[str, list[pygame.Surface]]: dictionnaire qui contient les listes d'image de l'animation
+            dict[str, utils.AnimationClip]: animations de la tête, l'atterrissage ne boucle pas
         """
         animation_dict = {}
+        manifest = utils.AnimationManifest.get_instance()
         
         scale = 2.5
         
-        animation_dict['falling'] = []
-		# Compte le nombre d'image qu'il y a dans le dossier
-        falling_number_of_frames = len(os.listdir(falling_texture_location))
-        for i in range(falling_number_of_frames):
-            # Charge l'image dans la mémoire
-            img = pygame.image.load(f"{falling_texture_location}{i}.png").convert_alpha()
-            # Converti l'image pour qu'elle soit de la taille voulue
-            img = pygame.transform.scale(img, (int(img.get_width() * scale), int(img.get_height() * scale)))
-            animation_dict['falling'].append(img)
-            
-        animation_dict['landing'] = []
-        # Compte le nombre d'image qu'il y a dans le dossier
-        falling_number_of_frames = len(os.listdir(landing_texture_location))
-        for i in range(falling_number_of_frames):
-            # Charge l'image dans la mémoire
-            img = pygame.image.load(f"{landing_texture_location}{i}.png").convert_alpha()
-            # Converti l'image pour qu'elle soit de la taille voulue
-            img = pygame.transform.scale(img, (int(img.get_width() * scale), int(img.get_height() * scale)))
-            animation_dict['landing'].append(img)
+        for name, texture_location, loop in (('falling', falling_texture_location, True), ('landing', landing_texture_location, False)):
+            frames = []
+            # Le manifeste donne les images de l'animation sans parcourir son dossier
+            for frame_location in manifest.get_frame_locations(texture_location):
+                # Charge l'image dans la mémoire
+                img = pygame.image.load(frame_location).convert_alpha()
+                # Converti l'image pour qu'elle soit de la taille voulue
+                img = pygame.transform.scale(img, (int(img.get_width() * scale), int(img.get_height() * scale)))
+                frames.append(img)
+            animation_dict[name] = utils.Assets.create_animation_clip(frames, texture_location, loop)
 
         return animation_dict
 
     
     def update_death_animation(self) -> pygame.Surface:
-        """Met à jour l'animation de mort (la tête qui tombe)
+        """Met à jour l'animation de mort (la tête qui tombe), l'animation est avancée par le système d'animation
 
         Returns:
             pygame.Surface: image à afficher pour l'animation
         """
-        
-        ANIMATION_COOLDOWN = 50
-        
         self.move_barbie_head()
         
-        # Met à jour l'image en fonction de la frame actuelle
-        image = self.death_animation[self.head_actual_state][self.frame_index]
-        
-        # Vérifie si assez de temps est passé depuis la dernière mise à jour
-        if pygame.time.get_ticks() - self.update_time > ANIMATION_COOLDOWN:
-            self.update_time = pygame.time.get_ticks()
-            self.frame_index += 1
-
-        # Si l'animation est terminée, remise de la première image
-        if self.frame_index >= len(self.death_animation[self.head_actual_state]):
-            if self.head_actual_state == 'landing':
-                self.frame_index = len(self.death_animation[self.head_actual_state]) - 1
-            else:
-                self.frame_index = 0
-        
-        return image
+        return self.head_animator.image
     
     
     def move_barbie_head(self):
@@ -307,6 +282,7 @@ class DeathMenu(gui.Menu):
         if self.barbie_head_rect.bottom + dy > self.buttons_to_draw['respawn'].rect.top:
             dy = self.buttons_to_draw['respawn'].rect.top - self.barbie_head_rect.bottom
             self.head_actual_state = 'landing'
+            self.head_animator.play(self.head_actual_state)
             self.head_vel_y = 0
         else:
             self.head_vel_y += GRAVITY
@@ -339,14 +315,14 @@ class DeathMenu(gui.Menu):
         Args:
             screen_width (int): hauteur de l'écran en pixel
         """
-        self.frame_index = 0
         self.head_actual_state = 'falling'
+        self.head_animator.play(self.head_actual_state, True)
         
         # Vitesse de la tête sur l'axe des abscisses
         self.head_vel_y = 14
         
         # Positionnement de la tête de Barbie avec la position des abscisses aléatoire
-        random_postion = random.randint(self.RANDOM_RANGE[0], self.RANDOM_RANGE[1]) / 100
+        random_postion = self.random.randint(self.RANDOM_RANGE[0], self.RANDOM_RANGE[1]) / 100
         self.barbie_head_rect.bottomleft = (screen_width * random_postion, 0)
         
 
@@ -375,17 +351,19 @@ class InventoryMenu(gui.Menu):
         self.add_button("skins", manteau_style_image, manteau_style_image, settings.screen_width//2, settings.screen_height * 0.6, 2, True)
         self.add_button("weapons", ar_b4rb13_image, ar_b4rb13_image, settings.screen_width//2, settings.screen_height * 0.8, 2, True)
     
-    def draw(self, screen: pygame.Surface) -> dict[str, bool]:
+    def draw(self, screen: pygame.Surface, do_draw_background: bool = True) -> dict[str, bool]:
         """Affiche les images et les boutons à l'écran et renvoie les noms des boutons qui ont été cliqués
 
         Args:
             screen (pygame.Surface): écran sur lequel le menu doit s'afficher
+            do_draw_background (bool, optional): si le background à moitié transparent doit être affiché, False s'il est déjà dans l'image figée du jeu. True par défaut
 
         Returns:
             dict[str, bool]: noms des boutons avec la valeur true s'ils ont été cliqués
         """
         # Affiche le background à moitié transparent
-        screen.blit(self.semi_transparent_background, (0, 0))
+        if do_draw_background:
+            screen.blit(self.semi_transparent_background, (0, 0))
 
         clicked_buttons = super().draw(screen, False)
         
@@ -416,17 +394,19 @@ class SkillMenu(gui.Menu):
         self.semi_transparent_background.fill(self.background_color)
         
     
-    def draw(self, screen: pygame.Surface) -> dict[str, bool]:
+    def draw(self, screen: pygame.Surface, do_draw_background: bool = True) -> dict[str, bool]:
         """Affiche les images et les boutons à l'écran et renvoie les noms des boutons qui ont été cliqués
 
         Args:
             screen (pygame.Surface): écran sur lequel le menu doit s'afficher
+            do_draw_background (bool, optional): si le background à moitié transparent doit être affiché, False s'il est déjà dans l'image figée du jeu. True par défaut
 
         Returns:
             dict[str, bool]: noms des boutons avec la valeur true s'ils ont été cliqués
         """
         # Affiche le background à moitié transparent
-        screen.blit(self.semi_transparent_background, (0, 0))
+        if do_draw_background:
+            screen.blit(self.semi_transparent_background, (0, 0))
 
         clicked_buttons = super().draw(screen, False)
         
@@ -457,17 +437,19 @@ class TrophiesMenu(gui.Menu):
         self.semi_transparent_background.fill(self.background_color)
         
     
-    def draw(self, screen: pygame.Surface) -> dict[str, bool]:
+    def draw(self, screen: pygame.Surface, do_draw_background: bool = True) -> dict[str, bool]:
         """Affiche les images et les boutons à l'écran et renvoie les noms des boutons qui ont été cliqués
 
         Args:
             screen (pygame.Surface): écran sur lequel le menu doit s'afficher
+            do_draw_background (bool, optional): si le background à moitié transparent doit être affiché, False s'il est déjà dans l'image figée du jeu. True par défaut
 
         Returns:
             dict[str, bool]: noms des boutons avec la valeur true s'ils ont été cliqués
         """
         # Affiche le background à moitié transparent
-        screen.blit(self.semi_transparent_background, (0, 0))
+        if do_draw_background:
+            screen.blit(self.semi_transparent_background, (0, 0))
 
         clicked_buttons = super().draw(screen, False)
         
@@ -498,17 +480,19 @@ class SkinsMenu(gui.Menu):
         self.semi_transparent_background.fill(self.background_color)
         
     
-    def draw(self, screen: pygame.Surface) -> dict[str, bool]:
+    def draw(self, screen: pygame.Surface, do_draw_background: bool = True) -> dict[str, bool]:
         """Affiche les images et les boutons à l'écran et renvoie les noms des boutons qui ont été cliqués
 
         Args:
             screen (pygame.Surface): écran sur lequel le menu doit s'afficher
+            do_draw_background (bool, optional): si le background à moitié transparent doit être affiché, False s'il est déjà dans l'image figée du jeu. True par défaut
 
         Returns:
             dict[str, bool]: noms des boutons avec la valeur true s'ils ont été cliqués
         """
         # Affiche le background à moitié transparent
-        screen.blit(self.semi_transparent_background, (0, 0))
+        if do_draw_background:
+            screen.blit(self.semi_transparent_background, (0, 0))
 
         clicked_buttons = super().draw(screen, False)
         
@@ -540,17 +524,19 @@ class WeaponsMenu(gui.Menu):
         self.semi_transparent_background.fill(self.background_color)
         
     
-    def draw(self, screen: pygame.Surface) -> dict[str, bool]:
+    def draw(self, screen: pygame.Surface, do_draw_background: bool = True) -> dict[str, bool]:
         """Affiche les images et les boutons à l'écran et renvoie les noms des boutons qui ont été cliqués
 
         Args:
             screen (pygame.Surface): écran sur lequel le menu doit s'afficher
+            do_draw_background (bool, optional): si le background à moitié transparent doit être affiché, False s'il est déjà dans l'image figée du jeu. True par défaut
 
         Returns:
             dict[str, bool]: noms des boutons avec la valeur true s'ils ont été cliqués
         """
         # Affiche le background à moitié transparent
-        screen.blit(self.semi_transparent_background, (0, 0))
+        if do_draw_background:
+            screen.blit(self.semi_transparent_background, (0, 0))
 
         clicked_buttons = super().draw(screen, False)
         
@@ -0,0 +1,359 @@
+import pygame
+
+from constants import *
+from world import World
+import utils, menus, inventory
+
+# Classe qui contient ce que les scènes du jeu partagent : le monde, le joueur et les menus
+class GameContext():
+    def __init__(self, assets: utils.Assets, settings: utils.Settings, frame_profiler: utils.FrameProfiler):
+        """Crée les menus, le monde et le joueur
+
+        Args:
+            assets (Assets): classe qui contient les assets du jeu
+            settings (Settings): classe qui contient les paramètres du jeu
+            frame_profiler (FrameProfiler): mesure du temps passé dans chaque étape de la boucle
+        """
+        self.assets = assets
+        self.settings = settings
+        self.frame_profiler = frame_profiler
+
+        # Musique jouée actuellement
+        self.current_music_index = 0
+
+        # Création des menus
+        self.start_menu = menus.StartMenu(assets, settings)
+        self.death_menu = menus.DeathMenu(assets, settings)
+        self.pause_menu = menus.PauseMenu(assets, settings)
+        self.inventory_menu = menus.InventoryMenu(assets, settings)
+        self.settings_menu = menus.SettingsMenu(assets, settings)
+        self.talented_tree_menu = menus.SkillMenu(assets, settings)
+        self.weapons_menu = menus.WeaponsMenu(assets, settings)
+        self.skins_menu = menus.SkinsMenu(assets, settings)
+        self.trophies_menu = menus.TrophiesMenu(assets, settings)
+
+        self.overlay = menus.Overlay(assets)
+
+        # Initialisation du monde et du joueur
+        self.world = World()
+        self.world.set_bullet_batching(settings.do_batch_bullets)
+        self.world.first_level(assets, settings)
+
+        self.player = self.spawn_player()
+        self.player_inventory = self.player.inventory
+
+    def change_music(self):
+        """Change la musique du jeu
+        """
+        self.current_music_index = (self.current_music_index + 1) % len(GAME_MUSICS)
+
+        pygame.mixer.music.load(GAME_MUSICS[self.current_music_index])
+        pygame.mixer.music.set_volume(self.settings.volume)
+        pygame.mixer.music.play(loops = -1, start = 0.0, fade_ms = 0)
+
+    def spawn_player(self, inventory: inventory.Inventory = None, do_regenerate: bool = True):
+        """Fais réapparaître le joueur et réinitialise le monde
+
+        Args:
+            inventory (Inventory, optional): inventaire du joueur. None par défaut
+            do_regenerate (bool, optional): si le monde doit être régénéré. True par défaut
+
+        Returns:
+            Player: joueur recréé
+        """
+        self.death_menu.reset_animation(self.settings.screen_width)
+        if do_regenerate:
+            self.world.restart_level(self.assets, self.settings)
+        else:
+            self.change_music()
+        player = self.world.process_data(self.assets, inventory)
+        self.world.set_debug_display(self.settings.do_draw_hitboxes)
+
+        # Création des éléments de l'interface
+        player.create_health_bar(10, self.settings.screen_width // 18, self.assets)
+        player.create_kill_counter(10, int(self.settings.screen_width * 5/45), self.assets, self.world)
+        player.create_bullet_counter(10, int(self.settings.screen_width * 33/45), self.assets)
+
+        self.player = player
+        return player
+
+# Scène de l'écran de démarrage
+class StartScene(utils.Scene):
+    is_static = True
+
+    def __init__(self, game: GameContext):
+        """Crée la scène de l'écran de démarrage
+
+        Args:
+            game (GameContext): monde, joueur et menus du jeu
+        """
+        super().__init__()
+        self.game = game
+
+    def run(self, screen: pygame.Surface, inputs: utils.InputSnapshot):
+        """Affiche le menu de démarrage et lance la partie quand le joueur le demande
+
+        Args:
+            screen (pygame.Surface): écran sur lequel la scène est affichée
+            inputs (InputSnapshot): état des entrées de la frame
+        """
+        start_clicked = self.game.start_menu.draw(screen, True)['start']
+        self.game.frame_profiler.end_phase("menus")
+
+        if start_clicked or inputs.was_pressed('confirm'):
+            self.stack.replace(GameplayScene(self.game))
+
+# Scène de la partie, le monde et le joueur ne sont mis à jour que quand elle est active
+class GameplayScene(utils.Scene):
+    advances_simulation = True
+    advances_animations = True
+
+    def __init__(self, game: GameContext):
+        """Crée la scène de la partie
+
+        Args:
+            game (GameContext): monde, joueur et menus du jeu
+        """
+        super().__init__()
+        self.game = game
+
+    def run(self, screen: pygame.Surface, inputs: utils.InputSnapshot):
+        """Met à jour et affiche le monde et le joueur, puis traite les actions du joueur
+
+        Args:
+            screen (pygame.Surface): écran sur lequel la scène est affichée
+            inputs (InputSnapshot): état des entrées de la frame
+        """
+        game = self.game
+        world = game.world
+        player = game.player
+        frame_profiler = game.frame_profiler
+
+        # Affiche les éléments à afficher à l'écran
+        world.draw(screen)
+        player.draw(screen)
+        frame_profiler.end_phase("draw_world")
+        world.update_groups()
+        frame_profiler.end_phase("update_groups")
+        world.draw_sprite_groups(screen)
+        frame_profiler.end_phase("draw_sprites")
+
+        # Met à jour le joueur
+        player.update()
+        frame_profiler.end_phase("player_update")
+
+        # Affiche les éléments de l'interface
+        self.draw_interface(screen)
+        frame_profiler.end_phase("ui")
+
+        player.move(world, game.settings)
+        frame_profiler.end_phase("player_move")
+        # Faire bouger les ennemis
+        world.update_enemies_ai()
+        frame_profiler.end_phase("ai")
+
+        if not player.is_alive:
+            self.stack.push(DeathScene(game))
+            return
+
+        if player.is_ready_to_go_to_next_level:
+            world.go_to_next_level(game.assets, game.settings)
+            player = game.spawn_player(game.player_inventory, False)
+
+        # Actions du joueur, lues dans l'état des entrées de la frame
+        if inputs.was_pressed('shoot'):
+            player.shoot(world.get_bullet_container())
+
+        if inputs.was_pressed('swap_weapons'):
+            game.player_inventory.swap_weapons()
+
+        if inputs.was_pressed('interact'):
+            player.check_collectibles(world)
+
+        if inputs.was_pressed('pause'):
+            self.stack.push(PauseScene(game))
+        elif inputs.was_pressed('inventory'):
+            self.stack.push(InventoryScene(game))
+
+    def draw_interface(self, screen: pygame.Surface):
+        """Affiche la barre de vie, les compteurs et l'overlay
+
+        Args:
+            screen (pygame.Surface): écran sur lequel l'interface est affichée
+        """
+        player = self.game.player
+        player.health_bar.draw(screen)
+        player.kill_counter.draw(screen)
+        player.bullet_counter.draw(screen)
+        self.game.overlay.draw(screen, self.game.world)
+
+    def draw_frozen(self, screen: pygame.Surface):
+        """Affiche le monde, le joueur et l'interface sans les mettre à jour
+
+        Args:
+            screen (pygame.Surface): surface sur laquelle la partie est affichée
+        """
+        self.game.world.draw(screen)
+        self.game.player.draw(screen)
+        self.game.world.draw_sprite_groups(screen)
+        self.draw_interface(screen)
+
+# Scène de l'écran de mort, elle est ajoutée par-dessus la partie
+class DeathScene(utils.Scene):
+    # Seule l'animation de la tête avance, l'horloge de la simulation reste arrêtée pour que les évènements programmés du monde figé n'arrivent pas
+    advances_animations = True
+
+    def __init__(self, game: GameContext):
+        """Crée la scène de l'écran de mort
+
+        Args:
+            game (GameContext): monde, joueur et menus du jeu
+        """
+        super().__init__()
+        self.game = game
+
+    def run(self, screen: pygame.Surface, inputs: utils.InputSnapshot):
+        """Affiche le menu de mort et fait réapparaître le joueur quand il le demande
+
+        Args:
+            screen (pygame.Surface): écran sur lequel la scène est affichée
+            inputs (InputSnapshot): état des entrées de la frame
+        """
+        respawn_clicked = self.game.death_menu.draw(screen, True)['respawn']
+        self.game.frame_profiler.end_phase("menus")
+
+        if respawn_clicked or inputs.was_pressed('confirm'):
+            self.game.spawn_player(self.game.player_inventory)
+            self.stack.pop()
+
+# Scène du menu pause, affichée par-dessus l'image figée de la partie
+class PauseScene(utils.Scene):
+    is_overlay = True
+    is_static = True
+
+    def __init__(self, game: GameContext):
+        """Crée la scène du menu pause
+
+        Args:
+            game (GameContext): monde, joueur et menus du jeu
+        """
+        super().__init__()
+        self.game = game
+        # L'image figée est assombrie une seule fois avec la couleur du menu
+        self.frozen_background_color = game.pause_menu.background_color
+
+    def run(self, screen: pygame.Surface, inputs: utils.InputSnapshot):
+        """Affiche le menu pause et traite ses boutons
+
+        Args:
+            screen (pygame.Surface): écran sur lequel la scène est affichée
+            inputs (InputSnapshot): état des entrées de la frame
+        """
+        pause_buttons = self.game.pause_menu.draw(screen, False)
+        self.game.frame_profiler.end_phase("menus")
+
+        if pause_buttons['quit'] or self.game.settings_menu.do_restart:
+            self.stack.quit()
+        elif pause_buttons['settings']:
+            self.stack.push(SettingsScene(self.game))
+        elif pause_buttons['back'] or inputs.was_pressed('pause'):
+            self.stack.pop()
+        elif inputs.was_pressed('inventory'):
+            self.stack.push(InventoryScene(self.game))
+
+# Scène du menu des paramètres, il cache entièrement l'écran
+class SettingsScene(utils.Scene):
+    is_static = True
+
+    def __init__(self, game: GameContext):
+        """Crée la scène du menu des paramètres
+
+        Args:
+            game (GameContext): monde, joueur et menus du jeu
+        """
+        super().__init__()
+        self.game = game
+
+    def run(self, screen: pygame.Surface, inputs: utils.InputSnapshot):
+        """Affiche le menu des paramètres et revient au menu pause quand il est fermé
+
+        Args:
+            screen (pygame.Surface): écran sur lequel la scène est affichée
+            inputs (InputSnapshot): état des entrées de la frame
+        """
+        settings_buttons = self.game.settings_menu.draw(screen)
+        self.game.frame_profiler.end_phase("menus")
+
+        if settings_buttons['back'] or inputs.was_pressed('pause'):
+            self.stack.pop()
+
+    def on_exit(self):
+        """Désactive les curseurs du menu quand il est fermé
+        """
+        self.game.settings_menu.set_menu_off()
+
+# Scène de l'inventaire, affichée par-dessus l'image figée de la partie
+class InventoryScene(utils.Scene):
+    is_overlay = True
+    is_static = True
+
+    def __init__(self, game: GameContext):
+        """Crée la scène de l'inventaire
+
+        Args:
+            game (GameContext): monde, joueur et menus du jeu
+        """
+        super().__init__()
+        self.game = game
+        self.frozen_background_color = game.inventory_menu.background_color
+
+    def run(self, screen: pygame.Surface, inputs: utils.InputSnapshot):
+        """Affiche l'inventaire et ouvre ses sous-menus
+
+        Args:
+            screen (pygame.Surface): écran sur lequel la scène est affichée
+            inputs (InputSnapshot): état des entrées de la frame
+        """
+        inventory_buttons = self.game.inventory_menu.draw(screen, False)
+        self.game.frame_profiler.end_phase("menus")
+
+        if inventory_buttons['talented tree']:
+            self.stack.push(InventorySubMenuScene(self.game, self.game.talented_tree_menu))
+        elif inventory_buttons['trophies']:
+            self.stack.push(InventorySubMenuScene(self.game, self.game.trophies_menu))
+        elif inventory_buttons['skins']:
+            self.stack.push(InventorySubMenuScene(self.game, self.game.skins_menu))
+        elif inventory_buttons['weapons']:
+            self.stack.push(InventorySubMenuScene(self.game, self.game.weapons_menu))
+        elif inputs.was_pressed('inventory') or inputs.was_pressed('pause'):
+            self.stack.pop()
+
+# Scène d'un sous-menu de l'inventaire, elle revient à l'inventaire quand elle est fermée
+class InventorySubMenuScene(utils.Scene):
+    is_overlay = True
+    is_static = True
+
+    def __init__(self, game: GameContext, menu):
+        """Crée la scène d'un sous-menu de l'inventaire
+
+        Args:
+            game (GameContext): monde, joueur et menus du jeu
+            menu (gui.Menu): sous-menu affiché
+        """
+        super().__init__()
+        self.game = game
+        self.menu = menu
+        self.frozen_background_color = menu.background_color
+
+    def run(self, screen: pygame.Surface, inputs: utils.InputSnapshot):
+        """Affiche le sous-menu
+
+        Args:
+            screen (pygame.Surface): écran sur lequel la scène est affichée
+            inputs (InputSnapshot): état des entrées de la frame
+        """
+        self.menu.draw(screen, False)
+        self.game.frame_profiler.end_phase("menus")
+
+        if inputs.was_pressed('inventory') or inputs.was_pressed('pause'):
+            self.stack.pop()
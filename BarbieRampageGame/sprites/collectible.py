@@ -3,7 +3,6 @@ import abc as abstract
 
 from constants import *
 import utils
-import random
 import weapon
 
 
@@ -22,12 +21,18 @@ class Collectible(pygame.sprite.Sprite, abstract.ABC):
             """
         super().__init__()
         
+        # Horloge de la simulation, utilisée pour les animations
+        self.clock = utils.SimulationClock.get_instance()
+        
         self.size_factor = tile_size * SPRITE_SCALING
         self.y_velocity = 0
         self.initial_x = x
         
         self.collected = False
         
+        # Un objet posé sur le sol s'endort, il n'a plus besoin de gravité ni de collisions
+        self.is_sleeping = False
+        
         if do_default_load_image:
             self.image = assets.get_scaled_image(image_path, image_path, scale * self.size_factor)
         
@@ -42,7 +47,10 @@ class Collectible(pygame.sprite.Sprite, abstract.ABC):
             world (world.World): monde dans lequel se trouve l'objet
         """
         self.scroll(world)
-        self.interact_with_world(world)
+        
+        if not self.is_sleeping:
+            self.interact_with_world(world)
+            world.update_collectible_position(self)
     
     def interact_with_world(self, world):
         """Fait interagir l'objet avec le monde
@@ -52,16 +60,25 @@ class Collectible(pygame.sprite.Sprite, abstract.ABC):
         """
         self.apply_gravity()
         
-        for tile in world.obstacle_list:
-            if pygame.sprite.collide_rect(self, tile):
-                if self.y_velocity > 0:
-                    self.y = tile.rect.top - self.rect.height
-                    self.y_velocity = 0
-                elif self.y_velocity < 0:
-                    self.y = tile.rect.bottom
-                    self.y_velocity = 0
+        contact = world.sweep_rect(self.rect, 0, self.y_velocity)
+        self.rect.y += contact.delta_y
         
-        self.rect.y += self.y_velocity
+        if contact.normal_y < 0:
+            # L'objet est posé sur le sol, il peut s'endormir
+            self.y_velocity = 0
+            self.fall_asleep()
+        elif contact.normal_y > 0:
+            self.y_velocity = 0
+    
+    def fall_asleep(self):
+        """Endort l'objet, la gravité et les collisions ne sont plus calculées
+        """
+        self.is_sleeping = True
+    
+    def set_collected(self):
+        """Met l'objet dans l'état ramassé, utilisé quand le monde recrée un objet qui avait déjà été ramassé
+        """
+        self.collected = True
 
     def draw(self, screen: pygame.Surface):
         """Affiche l'objet sur l'écran
@@ -111,45 +128,23 @@ class ItemBox(Collectible):
         image_path = f"{COLLECTIBLES_TEXTURES_LOCATION}box/{item_type}/"
         super().__init__(x, y, image_path, assets, tile_size, scale, False)
 
-        # Valeur du temps pour l'animation de la box
-        self.update_time = pygame.time.get_ticks()
-
         self.ANIMATION_TYPES = ['Close', 'Open']
-        self.animation_cooldown = animation_cooldown
         
         scale = 1.5 * self.size_factor
-        # Dictionnaire dans lequel il y a les frames des différentes animations
-        self.animation_dict = assets.load_animation(self.ANIMATION_TYPES, image_path, scale)
-        # Index de la frame actuelle de l'animation
-        self.frame_index = 0
-
+        # Lecteur des animations de la box, l'ouverture reste sur sa dernière image
+        animation_clips = assets.get_animation_clips(self.ANIMATION_TYPES, image_path, scale, [self.ANIMATION_TYPES[1]])
         # Met la box en position fermée
-        self.action = self.ANIMATION_TYPES[0]
+        self.animator = utils.Animator(animation_clips, self.ANIMATION_TYPES[0], animation_cooldown)
         # Met l'image correspondant à son action
-        self.image = self.animation_dict[self.action][self.frame_index]
+        self.image = self.animator.image
         
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
 
     def update_animation(self):
-        """Met à jour l'animation de la box"""
-
-        # Met à jour l'image en fonction de la frame actuelle
-        self.image = self.animation_dict[self.action][self.frame_index]
-
-        # Vérifie si assez de temps est passé depuis la dernière mise à jour
-        if pygame.time.get_ticks() - self.update_time > self.animation_cooldown:
-            self.update_time = pygame.time.get_ticks()
-            self.frame_index += 1
-
-            # Si l'animation est terminée, remise de la première image
-            if self.frame_index >= len(self.animation_dict[self.action]):
-                if self.action == self.ANIMATION_TYPES[1]:
-                    self.frame_index = len(self.animation_dict[self.action]) - 1
-                    
-                else:
-                    self.frame_index = 0
+        """Met à jour l'image de la box, l'animation est avancée par le système d'animation"""
+        self.image = self.animator.image
     
     def update(self, world):
         """Met à jour la box
@@ -167,11 +162,18 @@ class ItemBox(Collectible):
             player (Player): Joueur qui interagit avec la box
         """
         if (not self.collected) and pygame.sprite.collide_rect(player, self):
-            self.action = self.ANIMATION_TYPES[1]
-            self.frame_index = 0
+            self.animator.play(self.ANIMATION_TYPES[1])
             self.add_item_to_player(player)
             self.collected = True
     
+    def set_collected(self):
+        """Met la box dans l'état ramassé, elle reste ouverte
+        """
+        super().set_collected()
+        self.animator.play(self.ANIMATION_TYPES[1])
+        self.animator.set_frame(-1)
+        self.image = self.animator.image
+    
     @abstract.abstractmethod
     def add_item_to_player(self, player):
         """Ajoute un item au joueur
@@ -223,7 +225,7 @@ class HealthBox(ItemBox):
         player.add_health(25)
 
 class WeaponCrate(ItemBox):
-    def __init__(self, x: int, y: int, assets: utils.Assets, tile_size: int, scale: float = 1):
+    def __init__(self, x: int, y: int, assets: utils.Assets, tile_size: int, weapon_registry: weapon.WeaponRegistry, scale: float = 1):
         """Crée une caisse d'armes
 
         Args:
@@ -231,11 +233,12 @@ class WeaponCrate(ItemBox):
             y (int): position en ordonnée
             assets (utils.Assets): assets utilisés par le jeu
             tile_size (int): taille d'une tuile
+            weapon_registry (weapon.WeaponRegistry): registre des armes déjà chargées
             scale (float, optional): facteur de redimensionnement. 1 par défaut.
         """
         super().__init__(x, y, assets, tile_size, "Weapon", scale, animation_cooldown=100)
-        self.assets = assets
-        self.tile_size = tile_size
+        self.weapon_registry = weapon_registry
+        self.random = utils.RandomService.get_instance().get_stream("collectibles")
     
     def add_item_to_player(self, player):
         """Donne une arme au joueur
@@ -243,9 +246,8 @@ class WeaponCrate(ItemBox):
         Args:
             player (Player): joueur à qui donner une arme
         """
-        self.weapons = [weapon.Arb4rb13, weapon.GunP450, weapon.GunP90]
-        random_weapon = random.choice(self.weapons)
-        player.set_weapon(random_weapon(self.assets, self.tile_size, 1))
+        random_weapon = self.random.choice(weapon.CRATE_WEAPONS)
+        player.set_weapon(self.weapon_registry.create(random_weapon))
 
 class FinishLevelFlag(Collectible):
     def __init__(self, x: int, y: int, assets: utils.Assets, tile_size: int, scale: float = 1):
@@ -263,10 +265,9 @@ class FinishLevelFlag(Collectible):
         super().__init__(x, y, image_path, assets, tile_size, scale, True)
         
         scale = 1.5 * self.size_factor
-        #self.animation_dict = assets.load_animation(['Flag'], image_path, scale)
-        #self.frame_index = 0
+        #self.animator = utils.Animator(assets.get_animation_clips(['Flag'], image_path, scale), 'Flag', 200)
         
-        #self.image = self.animation_dict['Flag'][self.frame_index]
+        #self.image = self.animator.image
         
         #self.rect = self.image.get_rect()
         #self.rect.x = x
@@ -282,15 +283,8 @@ class FinishLevelFlag(Collectible):
         #self.update_animation()
     
     def update_animation(self):
-        """Met à jour l'animation du drapeau"""
-        self.image = self.animation_dict['Flag'][self.frame_index]
-        
-        if pygame.time.get_ticks() - self.update_time > 200:
-            self.update_time = pygame.time.get_ticks()
-            self.frame_index += 1
-            
-            if self.frame_index >= len(self.animation_dict['Flag']):
-                self.frame_index = 0
+        """Met à jour l'image du drapeau, l'animation est avancée par le système d'animation"""
+        self.image = self.animator.image
     
     def on_collect_action(self, player):
         """Méthode qui permet au joueur d'interagir avec le drapeau
@@ -38,16 +38,15 @@ class IntelligentDummy(IntelligentEnemy):
         """
         super().__init__(x, y, tile_size, assets, ENEMIES_TEXTURES_LOCATION + "dummy/dummy.png", speed = speed, scale = scale)
 
-    def ai(self, world):
+    def act(self, world):
         """Méthode qui permet de déplacer l'ennemi vers le joueur
 
         Args:
-            world (World): _description_
+            world (World): monde dans lequel l'ennemi se déplace
         """
-        if self.can_see_player(world):
-            move_right = world.player.rect.x > (self.rect.right + 3 * self.size_factor)
-            move_left = world.player.rect.right < (self.rect.x - 3 * self.size_factor)
-            self.move(world, move_right, move_left)
+        if self.sees_player:
+            move_right, move_left, do_jump = self.get_chase_movement(world, 3 * self.size_factor)
+            self.move(world, move_right, move_left, do_jump)
         else:
             self.move_around(world)
 
@@ -65,25 +64,24 @@ class KenEnemy(IntelligentEnemy):
         ANIMATION_LIST = ['Idle', 'Attack', 'Dead']
         super().__init__(x, y, tile_size, assets, ENEMIES_TEXTURES_LOCATION + "ken/", speed = 2, scale = scale, animation_list = ANIMATION_LIST)
         
-        self.last_attack_time = pygame.time.get_ticks()
+        self.last_attack_time = self.clock.time
         self.ken_could_attack = False
         self.ken_is_attacking = False
         
-        self.animation_cooldown = 50
+        self.animator.frame_duration = 50
         
         self.ATTACK_COOLDOWN = 1500
         self.damage_time = 1200
     
-    def ai(self, world):
+    def act(self, world):
         """Méthode qui permet de déplacer Ken vers le joueur
         
         Args:
             world (World): monde dans lequel Ken se déplace
         """
-        if self.can_see_player(world):
-            move_right = world.player.rect.x > (self.rect.right + 2 * self.size_factor)
-            move_left = world.player.rect.right < (self.rect.x - 2 * self.size_factor)
-            self.move(world, move_right, move_left)
+        if self.sees_player:
+            move_right, move_left, do_jump = self.get_chase_movement(world, 2 * self.size_factor)
+            self.move(world, move_right, move_left, do_jump)
             
             if self.player_in_attack_range(world):
                 self.attack(world)
@@ -114,7 +112,7 @@ class KenEnemy(IntelligentEnemy):
         
         self.ATTACK_COOLDOWN = 1200
         
-        ken_could_attack = (pygame.time.get_ticks() - self.last_attack_time) > self.ATTACK_COOLDOWN
+        ken_could_attack = (self.clock.time - self.last_attack_time) > self.ATTACK_COOLDOWN
 
         if ken_could_attack and self.is_alive:
             
@@ -127,7 +125,20 @@ class KenEnemy(IntelligentEnemy):
         """
         self.update_action('Attack')
         self.ken_is_attacking = True
-        self.last_attack_time = pygame.time.get_ticks()
+        self.last_attack_time = self.clock.time
+        
+        # Les dégâts sont infligés par l'horloge de la simulation à la fin du coup
+        self.clock.call_later(self.damage_time, self.end_attack)
+    
+    def end_attack(self):
+        """Méthode qui inflige les dégâts de l'attaque de Ken si le joueur est toujours à portée
+        """
+        # Ken a pu mourir ou être retiré du niveau pendant l'attaque
+        if self.ken_is_attacking and self.is_alive and self.alive():
+            if self.player_in_attack_range(self.world):
+                self.world.player.health -= 15
+        
+        self.ken_is_attacking = False
 
     def attack_rect(self):
         """Méthode qui permet de définir la zone d'attaque de Ken
@@ -156,19 +167,6 @@ class KenEnemy(IntelligentEnemy):
         
         return self.is_alive
 
-    def update(self):
-        """Met à jour Ken
-        """
-        super().update()
-        
-        if self.ken_is_attacking:
-            if (pygame.time.get_ticks() - self.last_attack_time) > self.damage_time:
-                
-                if self.player_in_attack_range(self.world):
-                    self.world.player.health -= 15
-                
-                self.ken_is_attacking = False
-    
     def draw(self, screen: pygame.Surface):
         """Affiche Ken à l'écran
 
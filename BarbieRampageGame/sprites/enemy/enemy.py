@@ -1,4 +1,4 @@
-import pygame, random, math
+import pygame, math
 import abc as abstract
 
 from constants import *
@@ -45,12 +45,9 @@ class Enemy(Entity):
         """
         
         if self.animation_list:
-            self.animation_dict = assets.load_animation(self.animation_list, self.texture_location, scale * self.size_factor)
-            self.animation_index = 0
-            self.animation_action = self.animation_list[0]
-            self.image = self.animation_dict[self.animation_action][self.animation_index]
-            self.animation_update_time = pygame.time.get_ticks()
-            self.animation_cooldown = 100
+            # Les animations sont partagées par tous les ennemis du même type
+            self.animator = utils.Animator(assets.get_animation_clips(self.animation_list, self.texture_location, scale * self.size_factor), self.animation_list[0], 100)
+            self.image = self.animator.image
             
         else:
             self.image = assets.load_scaled_image(self.texture_location, scale * self.size_factor)
@@ -71,40 +68,6 @@ class Enemy(Entity):
         """
         return self.rect.y + (self.rect.height // 4)
         
-    def check_collides_with_world(self, dx: int, dy: int, world) -> tuple[int, int]:
-        """Vérifie les collisions de l'ennemi avec les obstacles du monde
-
-        Args:
-            dx (int): distance de déplacement sur l'axe horizontal
-            dy (int): distance de déplacement sur l'axe vertical
-            world (World): monde dans lequel le joueur se déplace
-        
-        Returns:
-            tuple[int, int]: les distances de déplacement ajustées en fonction des collisions
-        """
-        for tile in world.obstacle_list:
-            next_x_position = self.hitbox.x + dx
-            next_y_position = self.hitbox.y + dy + 1
-            
-            # Vérifie les collisions sur l'axe horizontal
-            if tile.rect.colliderect(next_x_position, self.hitbox.y, self.hitbox.width, self.hitbox.height):
-                offset_between_tile = tile.rect.left - self.hitbox.x
-                dx = offset_between_tile - self.hitbox.width  * self.direction
-            # Vérifie les collisions sur l'axe vertical
-            if tile.rect.colliderect(self.hitbox.x, next_y_position, self.hitbox.width, self.hitbox.height):
-                # Vérifie si l'ennemi est en dessous d'une platforme
-                if self.vel_y < 0:
-                    self.vel_y = 0
-                    dy = tile.rect.bottom - self.rect.top
-                # Vérifie si l'ennemi touche le sol
-                elif self.vel_y >= 0:
-                    self.vel_y = 0
-                    self.in_air = False
-                    self.jump = False
-                    dy = tile.rect.top - self.rect.bottom
-        
-        return dx, dy
-    
     def check_collides(self, dx: int, dy: int, world) -> tuple[int, int]:
         """Vérifie les collisions de l'ennemi
 
@@ -163,10 +126,28 @@ class Enemy(Entity):
         super().move_entity_position(dx, dy, world)
         
         self.relative_initial_x += world.scroll.screen_scroll
+        
+        world.update_enemy_position(self)
     
     def ai(self, world):
         """Méthode qui permet de déplacer l'ennemi de manière autonome
 
+        Args:
+            world (World): monde dans lequel l'ennemi se déplace
+        """
+        self.think(world)
+        self.act(world)
+    
+    def think(self, world):
+        """Méthode qui prend les décisions coûteuses de l'ennemi, elle n'est pas forcément appelée à chaque frame
+
+        Args:
+            world (World): monde dans lequel l'ennemi se déplace
+        """
+    
+    def act(self, world):
+        """Méthode qui déplace l'ennemi en fonction de ses dernières décisions, elle est appelée à chaque frame
+
         Args:
             world (World): monde dans lequel l'ennemi se déplace
         """
@@ -178,31 +159,19 @@ class Enemy(Entity):
         Args:
             new_action (str): nouvelle action de l'ennemi
         """
-        if self.animation_list and (new_action != self.animation_action):
-            assert new_action in self.animation_list, f"Action {new_action} not in {self.animation_list}"
-            self.animation_action = new_action
-            self.animation_index = 0
-            
-            self.animation_update_time = pygame.time.get_ticks()
+        if self.animation_list:
+            self.animator.play(new_action)
     
     def update_animation(self):
-        """Méthode qui permet de mettre à jour l'animation de l'ennemi
+        """Méthode qui permet de mettre à jour l'image de l'ennemi, l'animation est avancée par le système d'animation
         """
-        if self.animation_list:
-            self.image = self.animation_dict[self.animation_action][self.animation_index]
+        if self.animation_list and (self.animator.image is not self.image):
+            self.image = self.animator.image
             
             new_rect = self.image.get_rect()
             new_rect.center = self.rect.center
             self.rect = new_rect
-            self.mask = pygame.mask.from_surface(self.image)
-            
-            if (pygame.time.get_ticks() - self.animation_update_time) > self.animation_cooldown:
-                self.animation_index += 1
-
-                if self.animation_index >= len(self.animation_dict[self.animation_action]):
-                    self.animation_index = 0
-                
-                self.animation_update_time = pygame.time.get_ticks()
+            self.mask = self.animator.mask
     
     def update(self):
         """Méthode qui permet de mettre à jour l'ennemi
@@ -295,18 +264,170 @@ class IntelligentEnemy(MovingEnemy):
         
         self.moving_around_direction = 1
         
-        self.moving_time = pygame.time.get_ticks()
+        self.moving_time = self.clock.time
         
         self.MOVEMENT_CHANGING_DELAY = 3000
+        # Probabilité de faire demi-tour à chaque réflexion une fois le délai passé
+        self.MOVEMENT_CHANGING_PROBABILITY = 1 / 31
+        self.random = utils.RandomService.get_instance().get_stream("enemies")
+        
+        # Vitesse du saut de l'ennemi, avant le redimensionnement
+        self.JUMP_SPEED = 14
+        
+        # Limites de saut et de chute de l'ennemi, elles choisissent son graphe de navigation
+        self.navigation_limits = self.get_navigation_limits(tile_size)
+        # Graphe de navigation du niveau, gardé pour ne pas le chercher à chaque étape du chemin
+        self.navigation_graph = None
+        
+        # Résultat de la dernière perception de l'ennemi
+        self.sees_player = False
+        
+        # Chemin suivi pour rejoindre le joueur, avec l'étape en cours et la case visée
+        self.path = None
+        self.path_step = 0
+        self.path_goal = None
+    
+    def think(self, world):
+        """Méthode qui fait percevoir le joueur à l'ennemi et choisit la direction de sa ronde ou le chemin vers le joueur
+        
+        Args:
+            world (World): monde dans lequel l'ennemi se déplace
+        """
+        self.sees_player = self.can_see_player(world)
+        
+        if self.sees_player:
+            self.plan_path(world)
+        else:
+            self.path = None
+            self.path_goal = None
+            self.choose_moving_around_direction()
+    
+    def get_navigation_limits(self, tile_size: int) -> tuple[int, int, int]:
+        """Méthode qui calcule les limites de saut et de chute de l'ennemi en cases
+        
+        Args:
+            tile_size (int): taille des tuiles
+        
+        Returns:
+            tuple[int, int, int]: lignes qu'un saut permet de monter, colonnes de vide qu'un saut permet de franchir et lignes dont l'ennemi peut tomber
+        """
+        jump_speed = self.JUMP_SPEED * self.size_factor
+        gravity = GRAVITY * self.size_factor
+        
+        # Hauteur maximale du saut et durée pendant laquelle l'ennemi reste en l'air
+        jump_height = jump_speed ** 2 / (2 * gravity)
+        air_time = 2 * jump_speed / gravity
+        
+        max_jump_rows = int(jump_height // tile_size)
+        # Une colonne est retirée car l'ennemi saute depuis le milieu de la dernière case de la plateforme
+        max_jump_columns = max(0, int(self.speed * air_time // tile_size) - 1)
+        # L'ennemi ne tombe que dans les vides que predict_void ne prend pas pour un précipice
+        max_fall_rows = max(1, int(self.hitbox.height * 5 // tile_size) - 1)
+        
+        return max_jump_rows, max_jump_columns, max_fall_rows
+    
+    def get_navigation_graph(self, world):
+        """Méthode qui récupère le graphe de navigation qui correspond aux capacités de saut de l'ennemi, il est gardé après la première recherche
+        
+        Args:
+            world (World): monde dans lequel l'ennemi se déplace
+        
+        Returns:
+            NavigationGraph: graphe de navigation du niveau
+        """
+        if self.navigation_graph is None:
+            self.navigation_graph = world.get_navigation_graph(*self.navigation_limits)
+        
+        return self.navigation_graph
+    
+    def plan_path(self, world):
+        """Méthode qui calcule le chemin vers le joueur, il n'est recalculé que si le joueur change de case ou si l'ennemi s'est perdu
+        
+        Args:
+            world (World): monde dans lequel l'ennemi se déplace
+        """
+        goal_cell = world.get_ground_cell(world.player.hitbox)
+        
+        if (goal_cell == self.path_goal) and (self.path is not None):
+            return
+        
+        start_cell = world.get_standing_cell(self.hitbox)
+        if start_cell is None:
+            start_cell = world.get_ground_cell(self.hitbox)
+        
+        self.path_goal = goal_cell
+        self.path_step = 0
+        
+        if (goal_cell is None) or (start_cell is None):
+            self.path = None
+        else:
+            self.path = self.get_navigation_graph(world).find_path(start_cell, goal_cell)
+    
+    def follow_path(self, world) -> tuple[int, bool]:
+        """Méthode qui donne la direction à prendre pour suivre le chemin vers le joueur
+        
+        Args:
+            world (World): monde dans lequel l'ennemi se déplace
+        
+        Returns:
+            tuple[int, bool]: direction à prendre, None si le chemin est fini ou s'il n'y en a pas, et si l'ennemi doit sauter
+        """
+        if (not self.path) or (self.path_step >= len(self.path)):
+            return None, False
+        
+        link = self.path[self.path_step]
+        column = world.get_column(self.hitbox.centerx)
+        standing_cell = world.get_standing_cell(self.hitbox)
+        
+        # En l'air ou au bord d'une plateforme, l'ennemi continue vers l'arrivée du lien
+        if self.in_air or (standing_cell is None):
+            return (1 if link.to_column >= column else -1), False
+        
+        segment = self.get_navigation_graph(world).get_segment(*standing_cell)
+        
+        # L'ennemi est arrivé sur la plateforme suivante, il passe à l'étape d'après
+        if segment.index == link.to_segment:
+            self.path_step += 1
+            return self.follow_path(world)
+        
+        # L'ennemi n'est plus sur le chemin, il sera recalculé à sa prochaine réflexion
+        if segment.index != link.from_segment:
+            self.path = None
+            return None, False
+        
+        if column != link.from_column:
+            return (1 if link.from_column > column else -1), False
+        
+        return link.direction, link.kind == "jump"
+    
+    def get_chase_movement(self, world, stop_distance: float) -> tuple[bool, bool, bool]:
+        """Méthode qui calcule le déplacement de l'ennemi qui poursuit le joueur
+        
+        Args:
+            world (World): monde dans lequel l'ennemi se déplace
+            stop_distance (float): distance à laquelle l'ennemi s'arrête devant le joueur
+        
+        Returns:
+            tuple[bool, bool, bool]: si l'ennemi doit aller à droite, à gauche et s'il doit sauter
+        """
+        direction, do_jump = self.follow_path(world)
+        
+        # Sur la même plateforme que le joueur ou sans chemin, l'ennemi va tout droit vers lui
+        if direction is None:
+            move_right = world.player.rect.x > (self.rect.right + stop_distance)
+            move_left = world.player.rect.right < (self.rect.x - stop_distance)
+            return move_right, move_left, False
+        
+        return direction == 1, direction == -1, do_jump
     
     @abstract.abstractmethod
-    def ai(self, world):
-        """Méthode qui permet de déplacer l'ennemi de manière autonome
+    def act(self, world):
+        """Méthode qui déplace l'ennemi en fonction de ses dernières décisions
         
         Args:
             world (World): monde dans lequel l'ennemi se déplace
         """
-        return super().ai(world)
+        return super().act(world)
     
     def can_see_player(self, world) -> bool:
         """Métode qui permet de vérifier si l'ennemi peut voir le joueur
@@ -325,10 +446,8 @@ class IntelligentEnemy(MovingEnemy):
         if distance <= sight_distance:
             self.viewline = ((self.rect.centerx, self.get_head_y()), (world.player.rect.centerx, world.player.get_head_y()))
             
-            for tile in world.obstacle_list:
-                if tile.rect.clipline(self.viewline[0], self.viewline[1]):
-                    return False
-            return True
+            # La ligne de vue est partagée avec les ennemis qui regardent depuis la même case
+            return world.is_player_visible_from(self.viewline[0][0], self.viewline[0][1])
         
         self.viewline = None
         
@@ -358,12 +477,11 @@ class IntelligentEnemy(MovingEnemy):
         return attack_rect.colliderect(world.player.rect)
         
         
-    def move_around(self, world, distance: int = 400):
-        """Méthode qui permet de faire déplacer l'ennemi autour d'un point
+    def choose_moving_around_direction(self, distance: int = 400):
+        """Méthode qui choisit la direction de la ronde de l'ennemi autour de son point de départ
 
         Args:
-            world (World): monde dans lequel l'ennemi se déplace
-            distance (int, optional): distance autour du point. 100 par défaut.
+            distance (int, optional): distance autour du point. 400 par défaut.
         """
         last_moving_around_direction = self.moving_around_direction
     
@@ -376,26 +494,37 @@ class IntelligentEnemy(MovingEnemy):
             self.moving_around_direction = -1
 
         # Vérifie si l'ennemi doit changer de direction de manière aléatoire
-        elif pygame.time.get_ticks() - self.moving_time > self.MOVEMENT_CHANGING_DELAY:
-            random_list = [self.moving_around_direction] * 30 + [-self.moving_around_direction]
-            self.moving_around_direction = random.choice(random_list)
-        
-        if self.predict_void(self.moving_around_direction * self.speed, 0, world):
-            self.moving_around_direction = -self.moving_around_direction
+        elif self.clock.time - self.moving_time > self.MOVEMENT_CHANGING_DELAY:
+            if utils.RandomService.bernoulli(self.random, self.MOVEMENT_CHANGING_PROBABILITY):
+                self.moving_around_direction = -self.moving_around_direction
         
         # Vérifie si la direction de l'ennemi a changé
         if last_moving_around_direction != self.moving_around_direction:
-            self.moving_time = pygame.time.get_ticks()
+            self.moving_time = self.clock.time
+    
+    def move_around(self, world):
+        """Méthode qui permet de faire déplacer l'ennemi autour d'un point dans la direction choisie lors de sa dernière réflexion
+
+        Args:
+            world (World): monde dans lequel l'ennemi se déplace
+        """
+        # L'ennemi fait demi-tour devant le vide, ce test est fait à chaque frame pour qu'il ne tombe pas entre deux réflexions.
+        # Le vide n'est cherché que si l'ennemi est au bord de sa plateforme
+        if world.is_ledge_ahead(self.hitbox, self.moving_around_direction) and \
+            self.predict_void(self.moving_around_direction * self.speed, 0, world):
+            self.moving_around_direction = -self.moving_around_direction
+            self.moving_time = self.clock.time
         
         self.move(world, self.moving_around_direction == 1, self.moving_around_direction == -1)
     
-    def move(self, world, move_right: bool = False, move_left: bool = False):
+    def move(self, world, move_right: bool = False, move_left: bool = False, do_jump: bool = False):
         """Méthode qui permet de déplacer l'ennemi
 
         Args:
             world (World): monde dans lequel l'ennemi se déplace
             move_right (bool, optional): si l'ennemi doit se déplacer vers la droite. False par défaut.
             move_left (bool, optional): si l'ennemi doit se déplacer vers la gauche. False par défaut.
+            do_jump (bool, optional): si l'ennemi doit sauter, par exemple pour suivre son chemin. False par défaut.
         """
         dx = 0
         dy = 0
@@ -416,9 +545,9 @@ class IntelligentEnemy(MovingEnemy):
             
             # Vérifie si l'ennemi doit sauter
             if (not self.jump) and (not self.in_air) and \
-                (self.predict_collides(dx, dy, world) or self.predict_void(dx, dy, world)):
+                (do_jump or self.predict_collides(dx, dy, world) or self.predict_void(dx, dy, world)):
                 
-                self.vel_y = -14 * self.size_factor
+                self.vel_y = -self.JUMP_SPEED * self.size_factor
                 self.jump = True
                 self.in_air = True
             
@@ -442,16 +571,10 @@ class IntelligentEnemy(MovingEnemy):
         Returns:
             bool: si l'ennemi va rentrer en collision avec un obstacle dans le prochain déplacement
         """
-        next_x_position = self.hitbox.x + dx
-        next_y_position = self.hitbox.y + dy
-        
-        for tile in world.obstacle_list:
-            
-            # Vérifie les collisions sur l'axe horizontal
-            if tile.rect.colliderect(next_x_position, next_y_position, self.hitbox.width, self.hitbox.height):
-                return True
+        next_hitbox = self.hitbox.move(dx, dy)
         
-        return False
+        # Les murs sont précalculés par le monde, il n'y a pas besoin de parcourir toutes les tuiles
+        return world.rect_hits_obstacle(next_hitbox)
     
     def predict_void(self, dx, dy, world) -> bool:
         """Vérifie si l'ennemi va tomber dans le vide
@@ -467,15 +590,10 @@ class IntelligentEnemy(MovingEnemy):
         next_x_position = self.hitbox.x + dx
         next_y_position = self.hitbox.y + dy + self.apply_gravity(self.vel_y)
         
-        tile_collide = True
-        for tile in world.obstacle_list:
-            
-            # Vérifie si l'ennemi va tomber dans un vide de 5 fois sa taille
-            if tile.rect.colliderect(next_x_position, next_y_position, self.hitbox.width, self.hitbox.height * 5):
-                tile_collide = False
-                break
+        # Vérifie si l'ennemi va tomber dans un vide de 5 fois sa taille à l'aide des sols précalculés par le monde
+        fall_rect = pygame.Rect(next_x_position, next_y_position, self.hitbox.width, self.hitbox.height * 5)
         
-        return tile_collide
+        return not world.rect_has_ground(fall_rect)
     
     def draw(self, screen: pygame.Surface):
         super().draw(screen)
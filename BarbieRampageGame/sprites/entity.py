@@ -18,6 +18,9 @@ class Entity(pygame.sprite.Sprite, abstract.ABC):
         """
         super().__init__()
         
+        # Horloge de la simulation, utilisée pour les animations et les délais
+        self.clock = utils.SimulationClock.get_instance()
+        
         self.size_factor = tile_size * SPRITE_SCALING
         
         self.health = max_health
@@ -91,25 +94,19 @@ class Entity(pygame.sprite.Sprite, abstract.ABC):
         Returns:
             tuple[int, int]: les distances de déplacement ajustées en fonction des collisions
         """
-        for tile in world.obstacle_list:
-            next_x_position = self.hitbox.x + delta_x
-            next_y_position = self.hitbox.y + delta_y + 1
-            
-            # Vérifie les collisions sur l'axe horizontal
-            if tile.rect.colliderect(next_x_position, self.hitbox.y, self.hitbox.width, self.hitbox.height):
-                delta_x = 0
-            # Vérifie les collisions sur l'axe vertical
-            if tile.rect.colliderect(self.hitbox.x, next_y_position, self.hitbox.width, self.hitbox.height):
-                # Vérifie si l'entité est en dessous d'une platforme
-                if self.vel_y < 0:
-                    self.vel_y = 0
-                    delta_y = tile.rect.bottom - self.rect.top
-                # Vérifie si l'entité touche le sol
-                elif self.vel_y >= 0:
-                    self.vel_y = 0
-                    self.in_air = False
-                    self.jump = False
-                    delta_y = tile.rect.top - self.rect.bottom
+        # Le déplacement est balayé case par case, une entité rapide ne peut pas traverser une tuile
+        contact = world.sweep_rect(self.hitbox, delta_x, delta_y)
+        delta_x = contact.delta_x
+        delta_y = contact.delta_y
+        
+        # Vérifie si l'entité est en dessous d'une platforme
+        if contact.normal_y > 0:
+            self.vel_y = 0
+        # Vérifie si l'entité touche le sol
+        elif contact.normal_y < 0:
+            self.vel_y = 0
+            self.in_air = False
+            self.jump = False
         
         return delta_x, delta_y
     
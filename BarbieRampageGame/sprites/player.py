@@ -19,6 +19,8 @@ class Player(Entity):
         """
         #self.ANIMATION_TYPES = ['Idle', 'Run', 'Jump', 'Death']
         self.ANIMATION_TYPES = ['Idle', 'Idle_has_weapon', 'Run', 'Run_has_weapon', 'Jump', 'Jump_has_weapon']
+        # Temps d'affichage de chaque image des animations, divisé par deux quand le joueur court
+        self.NORMAL_ANIMATION_COOLDOWN = 100
         super().__init__(x, y, 100, tile_size, assets, speed = 5, scale = 1.5)
         
         # Valeurs de départ pour les kills et les balles
@@ -30,9 +32,6 @@ class Player(Entity):
         # Variables pour l'état du joueur
         self.is_running = False # Si le joueur est en train de courir
 
-        # Valeur du temps pour l'animation du joueur
-        self.update_time = pygame.time.get_ticks()
-        
         # Crée la hitbox exacte du joueur
         self.mask = pygame.mask.from_surface(self.image)
         
@@ -57,15 +56,11 @@ class Player(Entity):
         Returns:
             pygame.Rect: rectangle de l'entité
         """
-        # Dictionnaire dans lequel il y a les frames des différentes animations du joueur
-        self.animation_dict = assets.load_animation(self.ANIMATION_TYPES, f"{PLAYER_TEXTURES_LOCATION}default", scale * self.size_factor)
-        # Index de la frame actuelle du joueur
-        self.frame_index = 0
-        
-        # Met le joueur en position Idle
-        self.action = self.ANIMATION_TYPES[0]
+        # Lecteur des animations du joueur, il commence en position Idle
+        animation_clips = assets.get_animation_clips(self.ANIMATION_TYPES, f"{PLAYER_TEXTURES_LOCATION}default", scale * self.size_factor)
+        self.animator = utils.Animator(animation_clips, self.ANIMATION_TYPES[0], self.NORMAL_ANIMATION_COOLDOWN)
         # Met l'image correspondant à son action
-        self.image = self.animation_dict[self.action][self.frame_index]
+        self.image = self.animator.image
         # Crée le rectangle du joueur
         rect = self.image.get_rect()
         rect.center = (x, y)
@@ -185,18 +180,18 @@ class Player(Entity):
         dx, dy = 0, 0
         self.is_running = False
         
-        # Les touches entrées par l'utilisateur
-        input_key = pygame.key.get_pressed()
+        # Les entrées de l'utilisateur, les actions sont déjà résolues depuis les touches des paramètres
+        inputs = utils.UserInputStates.get_instance().snapshot
         
         if self.is_alive:
             # Mouvement à gauche
-            if input_key[settings.keybinds['move_left']]:
+            if inputs.is_held('move_left'):
                 dx -= self.speed
                 self.is_running = True
                 self.flip = True
                 self.direction = -1
             # Mouvement à droite
-            if input_key[settings.keybinds['move_right']]:
+            if inputs.is_held('move_right'):
                 dx += self.speed
                 self.is_running = True
                 self.flip = False
@@ -206,7 +201,7 @@ class Player(Entity):
                     self.is_running = False
 
             # Sauts
-            if input_key[settings.keybinds['move_jump']] and self.jump == False and self.in_air == False:
+            if inputs.is_held('move_jump') and self.jump == False and self.in_air == False:
                 self.vel_y = -14 * self.size_factor
                 self.jump = True
                 self.in_air = True
@@ -283,8 +278,7 @@ class Player(Entity):
     def update_animation(self):
         """Met à jour l'animation du joueur"""
         
-        NORMAL_ANIMATION_COOLDOWN = 100
-        animation_cooldown = NORMAL_ANIMATION_COOLDOWN
+        animation_cooldown = self.NORMAL_ANIMATION_COOLDOWN
         
         has_weapon = self.weapon_holder.has_weapon()
         
@@ -305,28 +299,16 @@ class Player(Entity):
             else:
                 self.update_action(self.ANIMATION_TYPES[2]) # "Run"
             
-            animation_cooldown = NORMAL_ANIMATION_COOLDOWN // 2
+            animation_cooldown = self.NORMAL_ANIMATION_COOLDOWN // 2
         else:
             if has_weapon:
                 self.update_action(self.ANIMATION_TYPES[1]) # "Idle_has_weapon"
             else:
                 self.update_action(self.ANIMATION_TYPES[0]) # "Idle"
         
-        # Met à jour l'image en fonction de la frame actuelle
-        self.image = self.animation_dict[self.action][self.frame_index]
-
-        # Vérifie si assez de temps est passé depuis la dernière mise à jour
-        if (pygame.time.get_ticks() - self.update_time) > animation_cooldown:
-            self.frame_index += 1
-
-	        # Si l'animation est terminée, remise de la première image
-            if self.frame_index >= len(self.animation_dict[self.action]):
-                #if self.action == self.ANIMATION_TYPES[3]:
-                #    self.frame_index = len(self.animation_dict[self.action]) - 1
-                #else:
-                    self.frame_index = 0
-
-            self.update_time = pygame.time.get_ticks()
+        # Met à jour l'image, l'animation est avancée par le système d'animation
+        self.animator.frame_duration = animation_cooldown
+        self.image = self.animator.image
 
     def update_action(self, new_action: str):
         """Met à jour l'action que le joueur est en train d'effectuer
@@ -334,13 +316,8 @@ class Player(Entity):
         Args:
             new_action (str): nom de l'action qu'il fait (dans la liste ANIMATION_TYPES)
         """
-        # Vérifie si la nouvelle action est différente de celle d'avant
-        if new_action != self.action:
-            assert new_action in self.ANIMATION_TYPES, f"Action {new_action} not in {self.ANIMATION_TYPES}"
-            self.action = new_action
-            # Remet à zéro les variables de l'animation
-            self.frame_index = 0
-            self.update_time = pygame.time.get_ticks()
+        # L'animation ne recommence que si la nouvelle action est différente de celle d'avant
+        self.animator.play(new_action)
 
     def update(self):
         """Méthode qui doit être appelée à chaque frame pour mettre à jour les caractéristiques du joueur"""
@@ -358,7 +335,7 @@ class Player(Entity):
         Args:
             world (world.World): Monde dans lequel le joueur se trouve
         """
-        collectibles_in_range = pygame.sprite.spritecollide(self, world.collectible_group, False)
+        collectibles_in_range = world.get_collectibles_near(self.rect)
         for collectible in collectibles_in_range:
             collectible.on_collect_action(self)
         
@@ -415,6 +392,8 @@ class WeaponHolder():
         Args:
             weapon (weapon.Weapon): arme à équiper
         """
+        if self.has_weapon():
+            self.weapon.drop()
         self.weapon = weapon
         
         self.weapon.place_weapon(1, right_coordinates[0], right_coordinates[1])
@@ -494,4 +473,6 @@ class WeaponHolder():
     
     def kill(self):
         """Enlève l'arme que le joueur a équipé"""
+        if self.has_weapon():
+            self.weapon.drop()
         self.weapon = None
@@ -1,4 +1,14 @@
 # Initialisation du module utils
 from .setting import Settings
+from .action_map import ActionMap
 from .asset import Assets
-from .user_inputs import UserInputStates
\ No newline at end of file
+from .sound import SoundManager, SoundEffect
+from .user_inputs import UserInputStates, InputSnapshot
+from .input_replay import InputRecorder, InputReplayer
+from .rng import RandomService
+from .clock import SimulationClock, Timer
+from .animation import AnimationClip, Animator, AnimationSystem
+from .animation_manifest import AnimationManifest
+from .profiler import FrameProfiler, ProfilingSession
+from .scene import Scene, SceneStack
+from .frame_pacing import FramePacer
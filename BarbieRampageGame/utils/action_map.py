@@ -0,0 +1,65 @@
+from _common import KeybindValue
+
+# Classe qui associe chaque touche aux actions du jeu, la table est compilée une seule fois à partir des touches des paramètres
+class ActionMap():
+    def __init__(self, keybinds: dict[str, KeybindValue]):
+        """Crée la table des actions
+
+        Args:
+            keybinds (dict[str, KeybindValue]): touche de chaque action, ou liste de touches pour avoir des touches alternatives
+        """
+        self.compile(keybinds)
+
+    def compile(self, keybinds: dict[str, KeybindValue]):
+        """Recrée la table des actions à partir des touches
+
+        Args:
+            keybinds (dict[str, KeybindValue]): touche de chaque action, ou liste de touches pour avoir des touches alternatives
+        """
+        # Actions de chaque touche, une touche peut déclencher plusieurs actions
+        self.key_actions = {}
+
+        for action, keys in keybinds.items():
+            keys = tuple(keys) if isinstance(keys, (list, tuple)) else (keys,)
+            for key in keys:
+                self.key_actions[key] = self.key_actions.get(key, ()) + (action,)
+
+        # Paires (touche, actions) parcourues pour lire l'état des touches maintenues
+        self.key_action_items = tuple(self.key_actions.items())
+
+    def get_bound_keys(self) -> list[int]:
+        """Renvoie toutes les touches associées à une action
+
+        Returns:
+            list[int]: touches associées à une action
+        """
+        return [key for key, _ in self.key_action_items]
+
+    def get_held_actions(self, key_states) -> frozenset:
+        """Renvoie les actions dont une touche est maintenue
+
+        Args:
+            key_states (ScancodeWrapper | KeyStates): état des touches, indexé par les constantes des touches de pygame
+
+        Returns:
+            frozenset: noms des actions maintenues
+        """
+        held_actions = set()
+        for key, actions in self.key_action_items:
+            if key_states[key]:
+                held_actions.update(actions)
+        return frozenset(held_actions)
+
+    def get_pressed_actions(self, pressed_keys: frozenset) -> frozenset:
+        """Renvoie les actions dont une touche vient d'être enfoncée
+
+        Args:
+            pressed_keys (frozenset): touches enfoncées pendant la frame
+
+        Returns:
+            frozenset: noms des actions déclenchées
+        """
+        pressed_actions = set()
+        for key in pressed_keys:
+            pressed_actions.update(self.key_actions.get(key, ()))
+        return frozenset(pressed_actions)
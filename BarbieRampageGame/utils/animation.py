@@ -0,0 +1,163 @@
+import pygame, weakref
+
+# Classe qui contient les images d'une animation, partagées par tous les sprites qui la jouent
+class AnimationClip():
+    __slots__ = ('frames', 'loop', 'durations', 'masks')
+
+    def __init__(self, frames: list[pygame.Surface], loop: bool = True, durations: list[float] = None):
+        """Crée une animation
+
+        Args:
+            frames (list[pygame.Surface]): images de l'animation
+            loop (bool, optional): si l'animation recommence une fois terminée, sinon elle reste sur sa dernière image. True par défaut
+            durations (list[float], optional): temps d'affichage de chaque image en millisecondes, si None c'est la durée du lecteur qui est utilisée. None par défaut
+        """
+        self.frames = frames
+        self.loop = loop
+        self.durations = durations
+        # Masques des images, créés la première fois qu'ils sont demandés
+        self.masks = [None] * len(frames)
+
+    def get_mask(self, frame_index: int) -> pygame.mask.Mask:
+        """Renvoie le masque d'une image de l'animation, il n'est calculé qu'une seule fois
+
+        Args:
+            frame_index (int): index de l'image
+
+        Returns:
+            pygame.mask.Mask: masque de l'image
+        """
+        mask = self.masks[frame_index]
+        if mask is None:
+            mask = pygame.mask.from_surface(self.frames[frame_index])
+            self.masks[frame_index] = mask
+        return mask
+
+# Classe qui joue les animations d'un sprite, elle est avancée par AnimationSystem
+class Animator():
+    __slots__ = ('clips', 'clip_name', 'clip', 'frame_index', 'elapsed_time', 'frame_duration', '__weakref__')
+
+    def __init__(self, clips: dict[str, AnimationClip], clip_name: str, frame_duration: float = 100):
+        """Crée le lecteur d'animations d'un sprite et l'ajoute au système d'animation
+
+        Args:
+            clips (dict[str, AnimationClip]): animations que le sprite peut jouer, rangées par nom
+            clip_name (str): nom de l'animation jouée au départ
+            frame_duration (float, optional): temps d'affichage de chaque image en millisecondes. 100 par défaut
+        """
+        self.clips = clips
+        self.clip_name = clip_name
+        self.clip = clips[clip_name]
+        self.frame_index = 0
+        self.elapsed_time = 0
+        self.frame_duration = frame_duration
+
+        AnimationSystem.get_instance().add(self)
+
+    @property
+    def image(self) -> pygame.Surface:
+        """Image actuelle de l'animation"""
+        return self.clip.frames[self.frame_index]
+
+    @property
+    def is_finished(self) -> bool:
+        """Si l'animation ne boucle pas et est arrivée sur sa dernière image"""
+        return (not self.clip.loop) and (self.frame_index == len(self.clip.frames) - 1)
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Masque de l'image actuelle de l'animation"""
+        return self.clip.get_mask(self.frame_index)
+
+    def play(self, clip_name: str, restart: bool = False):
+        """Change l'animation jouée, elle reprend à sa première image
+
+        Args:
+            clip_name (str): nom de l'animation
+            restart (bool, optional): si l'animation doit recommencer quand elle est déjà jouée. False par défaut
+        """
+        if (clip_name == self.clip_name) and not restart:
+            return
+
+        assert clip_name in self.clips, f"Action {clip_name} not in {list(self.clips.keys())}"
+        self.clip_name = clip_name
+        self.clip = self.clips[clip_name]
+        self.frame_index = 0
+        self.elapsed_time = 0
+
+    def set_frame(self, frame_index: int):
+        """Place l'animation sur une image donnée, un index négatif part de la fin
+
+        Args:
+            frame_index (int): index de l'image
+        """
+        self.frame_index = frame_index % len(self.clip.frames)
+        self.elapsed_time = 0
+
+    def advance(self, delta_time: float):
+        """Fait avancer l'animation
+
+        Args:
+            delta_time (float): temps écoulé en millisecondes
+        """
+        self.elapsed_time += delta_time
+        durations = self.clip.durations
+        
+        if durations is None:
+            # Toutes les images durent le même temps, le nombre d'images passées se calcule directement
+            if self.elapsed_time < self.frame_duration:
+                return
+            
+            steps = int(self.elapsed_time // self.frame_duration)
+            self.elapsed_time -= steps * self.frame_duration
+            
+            frame_count = len(self.clip.frames)
+            if self.clip.loop:
+                self.frame_index = (self.frame_index + steps) % frame_count
+            else:
+                self.frame_index = min(self.frame_index + steps, frame_count - 1)
+        else:
+            # Chaque image a sa propre durée, donnée par le manifeste
+            last_index = len(durations) - 1
+            while self.elapsed_time >= durations[self.frame_index]:
+                if self.frame_index == last_index and not self.clip.loop:
+                    self.elapsed_time = 0
+                    return
+                
+                self.elapsed_time -= durations[self.frame_index]
+                self.frame_index = 0 if self.frame_index == last_index else self.frame_index + 1
+
+# Classe qui fait avancer toutes les animations du jeu en une seule passe
+class AnimationSystem():
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        """Méthode pour donner une instance unique de la classe AnimationSystem
+        """
+        if AnimationSystem.__instance == None:
+            AnimationSystem.__instance = AnimationSystem()
+        return AnimationSystem.__instance
+
+    def __init__(self):
+        """Crée le système d'animation
+        """
+        # Les lecteurs disparaissent d'eux-mêmes quand leur sprite n'existe plus
+        self.animators = weakref.WeakSet()
+
+    def add(self, animator: Animator):
+        """Ajoute un lecteur d'animations à la passe
+
+        Args:
+            animator (Animator): lecteur à ajouter
+        """
+        self.animators.add(animator)
+
+    def advance(self, delta_time: float):
+        """Fait avancer toutes les animations
+
+        Args:
+            delta_time (float): temps écoulé en millisecondes
+        """
+        for animator in self.animators:
+            animator.advance(delta_time)
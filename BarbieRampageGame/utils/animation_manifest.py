@@ -0,0 +1,142 @@
+import os
+import json
+
+from constants import *
+
+# Classe qui donne le nombre d'images et les durées de chaque animation sans parcourir les dossiers des textures
+class AnimationManifest():
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        """Méthode pour donner une instance unique de la classe AnimationManifest
+        """
+        if AnimationManifest.__instance == None:
+            AnimationManifest.__instance = AnimationManifest()
+        return AnimationManifest.__instance
+
+    def __init__(self, manifest_location: str = ANIMATION_MANIFEST_LOCATION):
+        """Charge le manifeste des animations
+
+        Args:
+            manifest_location (str, optional): chemin du manifeste. ANIMATION_MANIFEST_LOCATION par défaut
+        """
+        self.manifest_location = manifest_location
+        self.clips = {}
+
+        if os.path.exists(manifest_location):
+            with open(manifest_location, 'r') as manifestfile:
+                self.clips = json.load(manifestfile)
+        else:
+            print("Animation manifest not found, animation folders will be scanned")
+
+    @staticmethod
+    def get_clip_key(clip_location: str) -> str:
+        """Renvoie le nom d'une animation dans le manifeste, c'est son dossier relatif au dossier des textures
+
+        Args:
+            clip_location (str): dossier des images de l'animation
+
+        Returns:
+            str: nom de l'animation dans le manifeste
+        """
+        return os.path.relpath(os.path.normpath(clip_location), os.path.normpath(TEXTURES_ROOT)).replace(os.sep, "/")
+
+    @staticmethod
+    def scan_clip(clip_location: str) -> dict:
+        """Parcourt le dossier d'une animation pour trouver ses images
+
+        Args:
+            clip_location (str): dossier des images de l'animation
+
+        Returns:
+            dict: description de l'animation, None si le dossier ne contient pas d'images numérotées
+        """
+        file_names = [file_name for file_name in os.listdir(clip_location) if file_name.endswith(".png")]
+        if (not file_names) or not all(file_name[:-4].isdigit() for file_name in file_names):
+            return None
+
+        # Les images sont nommées 00.png, 01.png, etc... ou 0.png, 1.png, etc...
+        file_format = "{:02}.png" if "00.png" in file_names else "{}.png"
+
+        frame_count = 0
+        while file_format.format(frame_count) in file_names:
+            frame_count += 1
+        if frame_count == 0:
+            return None
+
+        return {
+            'frames': frame_count,
+            'file_format': file_format,
+            'durations': None
+        }
+
+    def get_clip(self, clip_location: str) -> dict:
+        """Renvoie la description d'une animation, le dossier n'est parcouru que si elle n'est pas dans le manifeste
+
+        Args:
+            clip_location (str): dossier des images de l'animation
+
+        Returns:
+            dict: nombre d'images, format du nom des fichiers et durée de chaque image en millisecondes (None pour utiliser celle du sprite)
+
+        Raises:
+            FileNotFoundError: si l'animation n'est pas dans le manifeste et que son dossier ne contient pas d'images numérotées
+        """
+        key = self.get_clip_key(clip_location)
+
+        if key not in self.clips:
+            print(f"Animation '{key}' is not in the manifest, scanning its folder")
+            clip = self.scan_clip(clip_location)
+            if clip is None:
+                raise FileNotFoundError(f"No numbered PNG frames (0.png, 1.png... or 00.png, 01.png...) found in animation folder '{clip_location}'")
+            self.clips[key] = clip
+
+        return self.clips[key]
+
+    def get_frame_locations(self, clip_location: str) -> list[str]:
+        """Renvoie les chemins des images d'une animation, dans l'ordre
+
+        Args:
+            clip_location (str): dossier des images de l'animation
+
+        Returns:
+            list[str]: chemins des images
+        """
+        clip = self.get_clip(clip_location)
+        return [os.path.join(clip_location, clip['file_format'].format(i)) for i in range(clip['frames'])]
+
+    def generate(self, textures_root: str = TEXTURES_ROOT):
+        """Recrée le manifeste à partir des dossiers des textures, les durées déjà écrites à la main sont gardées
+
+        Args:
+            textures_root (str, optional): dossier des textures. TEXTURES_ROOT par défaut
+        """
+        clips = {}
+
+        for directory, _, _ in sorted(os.walk(textures_root)):
+            key = self.get_clip_key(directory)
+            if key.split("/")[0] in NON_ANIMATED_TEXTURE_FOLDERS:
+                continue
+
+            clip = self.scan_clip(directory)
+            if clip is None:
+                continue
+
+            previous_clip = self.clips.get(key)
+            if previous_clip is not None:
+                if previous_clip.get('durations') and len(previous_clip['durations']) == clip['frames']:
+                    clip['durations'] = previous_clip['durations']
+
+            clips[key] = clip
+
+        self.clips = clips
+
+        with open(self.manifest_location, 'w') as manifestfile:
+            manifestfile.write(json.dumps(clips, indent=4))
+
+        print(f"Animation manifest saved in '{os.path.abspath(self.manifest_location)}' with {len(clips)} animations")
+
+if __name__ == "__main__":
+    # Pour régénérer le manifeste après avoir ajouté ou modifié des animations : python -m utils.animation_manifest
+    AnimationManifest().generate()
@@ -1,6 +1,9 @@
 import pygame
 
 from constants import *
+from .animation import AnimationClip
+from .animation_manifest import AnimationManifest
+from .sound import SoundManager
 
 # Classe qui gère les assets du jeu
 class Assets():
@@ -13,25 +16,29 @@ class Assets():
         
         # Dictionnaire dans lequel se trouve les images qui se font charger de l'extérieur de la classe
         self.saved_external_images = {}
+        # Animations déjà chargées, rangées par dossier, noms et facteur de redimensionnement
+        self.saved_animation_clips = {}
         
         ### Polices d'écriture ###
         self.default_font = pygame.font.Font(PS2P_FONT_LOCATION, 15)
         self.default_font_bigger = pygame.font.Font(PS2P_FONT_LOCATION, 22)
 
         ### Les sons ###
-        self.weapon_cross_sound = pygame.mixer.Sound(WEAPON_CROSS_SOUND_LOCATION)
-        self.blaster_sound = pygame.mixer.Sound(BLASTER_SOUND_LOCATION)
+        # Les effets sonores sont joués par le gestionnaire de sons qui limite le nombre de canaux utilisés
+        self.sound_manager = SoundManager(settings.screen_width, SOUND_EFFECT_CHANNELS, settings.volume)
+        # Le tir est plus prioritaire que le clic de l'arme vide
+        self.sound_manager.add_sound("blaster", BLASTER_SOUND_LOCATION, priority=1, max_instances=4)
+        self.sound_manager.add_sound("weapon_cross", WEAPON_CROSS_SOUND_LOCATION, priority=0, max_instances=1)
         
         settings.set_assets(self)
         
     def set_volume(self, volume: float):
-        """Change le volume de la musique
+        """Change le volume des effets sonores, il est appliqué une seule fois par image par le gestionnaire de sons
 
         Args:
-            volume (float): volume de la musique
+            volume (float): volume des effets sonores
         """
-        self.weapon_cross_sound.set_volume(volume)
-        self.blaster_sound.set_volume(volume)
+        self.sound_manager.set_volume(volume)
 
     def load_image(self, texture_location: str, width: int, height: int) -> pygame.Surface:
         """Charge une image
@@ -121,7 +128,7 @@ class Assets():
         return self.saved_external_images[name]
     
     def load_animation(self, animation_types: list[str], texture_location: str, scale: float) -> dict[str, list[pygame.Surface]]:
-        """Charge une animation, les images doivent être nommées de 00, 01, 02, etc...
+        """Charge une animation, ses images sont données par le manifeste des animations
 
         Args:
             animation_types (list[str]): liste qui contient les noms des animations
@@ -132,15 +139,61 @@ class Assets():
             dict[str, list[Surface]]: dictionnaire qui contient les listes d'images à afficher pour animer
         """
         animation_dict = {}
+        manifest = AnimationManifest.get_instance()
         
         for animation in animation_types:
-            animation_dict[animation] = []
-            # Compte le nombre d'image qu'il y a dans le dossier
-            number_of_frames = len(os.listdir(f"{texture_location}/{animation}"))
-            for i in range(number_of_frames):
-                # Charge l'image et la redimensionne
-                img = self.load_scaled_image(f"{texture_location}/{animation}/{i:02}.png", scale)
-                # Ajoute l'image à la liste des images de l'animation
-                animation_dict[animation].append(img)
+            # Le manifeste donne les images de l'animation sans parcourir son dossier
+            animation_dict[animation] = [self.load_scaled_image(frame_location, scale) for frame_location in manifest.get_frame_locations(f"{texture_location}/{animation}")]
         
         return animation_dict
+    
+    def get_animation_clips(self, animation_types: list[str], texture_location: str, scale: float, non_looping_types: list[str] = ()) -> dict[str, AnimationClip]:
+        """Renvoie les animations voulues, elles ne sont chargées qu'une seule fois et partagées par tous les sprites
+
+        Args:
+            animation_types (list[str]): liste qui contient les noms des animations
+            texture_location (str): chemin vers les textures
+            scale (int or float): facteur de redimensionnement
+            non_looping_types (list[str], optional): noms des animations qui restent sur leur dernière image une fois terminées. () par défaut
+
+        Returns:
+            dict[str, AnimationClip]: animations rangées par nom
+        """
+        key = (texture_location, tuple(animation_types), round(scale, 6), tuple(non_looping_types))
+        
+        if key not in self.saved_animation_clips:
+            self.saved_animation_clips[key] = self.load_animation_clips(animation_types, texture_location, scale, non_looping_types)
+        
+        return self.saved_animation_clips[key]
+    
+    @staticmethod
+    def create_animation_clip(frames: list[pygame.Surface], clip_location: str, loop: bool = True) -> AnimationClip:
+        """Crée une animation à partir de ses images, avec les durées du manifeste
+
+        Args:
+            frames (list[pygame.Surface]): images déjà redimensionnées
+            clip_location (str): dossier des images de l'animation
+            loop (bool, optional): si l'animation recommence une fois terminée. True par défaut
+
+        Returns:
+            AnimationClip: animation créée
+        """
+        clip = AnimationManifest.get_instance().get_clip(clip_location)
+        
+        return AnimationClip(frames, loop, clip['durations'])
+    
+    def load_animation_clips(self, animation_types: list[str], texture_location: str, scale: float, non_looping_types: list[str] = ()) -> dict[str, AnimationClip]:
+        """Charge des animations avec leurs durées
+
+        Args:
+            animation_types (list[str]): liste qui contient les noms des animations
+            texture_location (str): chemin vers les textures
+            scale (int or float): facteur de redimensionnement
+            non_looping_types (list[str], optional): noms des animations qui restent sur leur dernière image une fois terminées. () par défaut
+
+        Returns:
+            dict[str, AnimationClip]: animations rangées par nom
+        """
+        animation_dict = self.load_animation(animation_types, texture_location, scale)
+        
+        return {name: self.create_animation_clip(frames, f"{texture_location}/{name}", name not in non_looping_types) for name, frames in animation_dict.items()}
@@ -0,0 +1,78 @@
+import heapq, itertools, typing
+
+# Classe qui représente un évènement programmé sur l'horloge de la simulation
+class Timer():
+    __slots__ = ('due_time', 'callback', 'args', 'is_cancelled')
+
+    def __init__(self, due_time: float, callback: typing.Callable, args: tuple):
+        """Crée un évènement programmé
+
+        Args:
+            due_time (float): temps de la simulation auquel l'évènement doit arriver, en millisecondes
+            callback (typing.Callable): méthode appelée quand l'évènement arrive
+            args (tuple): arguments donnés à la méthode
+        """
+        self.due_time = due_time
+        self.callback = callback
+        self.args = args
+        self.is_cancelled = False
+
+    def cancel(self):
+        """Annule l'évènement, il ne sera pas déclenché
+        """
+        self.is_cancelled = True
+
+# Classe qui donne le temps de la simulation et déclenche les évènements programmés
+class SimulationClock():
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        """Méthode pour donner une instance unique de la classe SimulationClock
+        """
+        if SimulationClock.__instance == None:
+            SimulationClock.__instance = SimulationClock()
+        return SimulationClock.__instance
+
+    def __init__(self):
+        """Crée l'horloge de la simulation, elle n'avance que quand le jeu tourne
+        """
+        # Temps de la simulation en millisecondes, à lire à la place de pygame.time.get_ticks
+        self.time = 0
+        # File de priorité des évènements, rangés par temps puis par ordre de programmation
+        self.timers = []
+        self.timer_counter = itertools.count()
+
+    def call_later(self, delay: float, callback: typing.Callable, *args) -> Timer:
+        """Programme un évènement
+
+        Args:
+            delay (float): temps en millisecondes avant que l'évènement arrive
+            callback (typing.Callable): méthode appelée quand l'évènement arrive
+            *args: arguments donnés à la méthode
+
+        Returns:
+            Timer: évènement programmé, il peut être annulé
+        """
+        timer = Timer(self.time + delay, callback, args)
+        heapq.heappush(self.timers, (timer.due_time, next(self.timer_counter), timer))
+        return timer
+
+    def advance(self, delta_time: float):
+        """Fait avancer la simulation et déclenche dans l'ordre les évènements arrivés à échéance
+
+        Args:
+            delta_time (float): temps écoulé en millisecondes
+        """
+        self.time += delta_time
+
+        timers = self.timers
+        while timers and timers[0][0] <= self.time:
+            timer = heapq.heappop(timers)[2]
+            if not timer.is_cancelled:
+                timer.callback(*timer.args)
+
+    def clear_timers(self):
+        """Annule tous les évènements programmés, par exemple quand le niveau est rechargé
+        """
+        self.timers = []
@@ -0,0 +1,80 @@
+import pygame
+
+from constants import *
+
+# Classe qui choisit le nombre d'images par seconde selon la scène affichée, pour ne pas occuper le processeur sur les écrans où rien ne bouge
+class FramePacer():
+    def __init__(self, fps: int = FPS, menu_fps: int = MENU_FPS, idle_fps: int = IDLE_FPS, idle_delay: int = IDLE_DELAY):
+        """Crée le contrôleur du rythme des images
+
+        Args:
+            fps (int, optional): images par seconde pendant la partie. FPS par défaut
+            menu_fps (int, optional): images par seconde des écrans où rien ne bouge. MENU_FPS par défaut
+            idle_fps (int, optional): images par seconde des écrans où rien ne bouge quand le joueur ne fait rien. IDLE_FPS par défaut
+            idle_delay (int, optional): temps sans entrée en millisecondes avant de passer à idle_fps. IDLE_DELAY par défaut
+        """
+        self.clock = pygame.time.Clock()
+
+        self.fps = fps
+        self.menu_fps = menu_fps
+        self.idle_fps = idle_fps
+        self.idle_delay = idle_delay
+
+        # Images par seconde visées pour la dernière frame, et si l'attente était précise
+        self.target_fps = fps
+        self.is_precise = False
+        self.last_input_time = pygame.time.get_ticks()
+
+    @property
+    def actual_fps(self) -> float:
+        """Images par seconde réellement affichées, moyenne des dernières frames"""
+        return self.clock.get_fps()
+
+    def get_target_fps(self, scene, has_input: bool) -> int:
+        """Choisit le nombre d'images par seconde pour une scène
+
+        Args:
+            scene (Scene): scène active
+            has_input (bool): si le joueur a fait quelque chose pendant la frame précédente
+
+        Returns:
+            int: images par seconde visées
+        """
+        now = pygame.time.get_ticks()
+        if has_input:
+            self.last_input_time = now
+
+        if not scene.is_static:
+            return self.fps
+        if now - self.last_input_time > self.idle_delay:
+            return self.idle_fps
+        return self.menu_fps
+
+    def tick(self, scene, has_input: bool) -> int:
+        """Attend la prochaine frame
+
+        Args:
+            scene (Scene): scène active
+            has_input (bool): si le joueur a fait quelque chose pendant la frame précédente
+
+        Returns:
+            int: temps écoulé depuis la frame précédente en millisecondes
+        """
+        self.target_fps = self.get_target_fps(scene, has_input)
+
+        # tick_busy_loop attend activement pour être précis, il n'est utilisé que quand la simulation avance
+        self.is_precise = scene.advances_simulation
+        if self.is_precise:
+            return self.clock.tick_busy_loop(self.target_fps)
+        return self.clock.tick(self.target_fps)
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font, y: int = 5):
+        """Affiche les images par seconde visées et réelles en haut à droite de l'écran
+
+        Args:
+            screen (pygame.Surface): écran sur lequel afficher les images par seconde
+            font (pygame.font.Font): police utilisée
+            y (int, optional): position du haut du texte sur l'axe vertical. 5 par défaut
+        """
+        text = font.render(f"fps {self.actual_fps:5.1f}/{self.target_fps}", False, COLOR_DARK)
+        screen.blit(text, (screen.get_width() - text.get_width() - 5, y))
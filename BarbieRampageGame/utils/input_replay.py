@@ -0,0 +1,144 @@
+import pygame
+import os
+import time
+import json
+import gzip
+
+from constants import *
+
+# Types des évènements enregistrés et attributs gardés pour chacun
+RECORDED_EVENT_ATTRIBUTES = {
+    pygame.QUIT: (),
+    pygame.KEYDOWN: ('key', 'mod', 'unicode'),
+    pygame.KEYUP: ('key', 'mod'),
+    pygame.MOUSEBUTTONDOWN: ('pos', 'button'),
+    pygame.MOUSEBUTTONUP: ('pos', 'button'),
+    pygame.MOUSEMOTION: ('pos', 'rel', 'buttons')
+}
+
+# Classe qui remplace le résultat de pygame.key.get_pressed pendant une rediffusion
+class KeyStates():
+    def __init__(self, pressed_keys: set[int]):
+        """Crée l'état des touches d'une frame
+
+        Args:
+            pressed_keys (set[int]): touches pressées
+        """
+        self.pressed_keys = pressed_keys
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed_keys
+
+# Classe qui enregistre les entrées du joueur frame par frame
+class InputRecorder():
+    def __init__(self, tracked_keys: list[int], seed: int):
+        """Commence un enregistrement des entrées
+
+        Args:
+            tracked_keys (list[int]): touches dont l'état est enregistré à chaque frame
+            seed (int): graine principale des générateurs aléatoires, pour que la rediffusion refasse les mêmes tirages
+        """
+        self.tracked_keys = list(tracked_keys)
+        self.seed = seed
+
+        # Chaque ligne est [état des touches, évènements, nombre de frames identiques à la suite]
+        self.frames = []
+
+    def record_frame(self, key_states, events: list[pygame.event.Event]):
+        """Enregistre les entrées d'une frame
+
+        Args:
+            key_states (ScancodeWrapper): état des touches renvoyé par pygame.key.get_pressed
+            events (list[pygame.event.Event]): évènements de la frame
+        """
+        # L'état des touches suivies tient dans un seul entier
+        key_mask = 0
+        for i, key in enumerate(self.tracked_keys):
+            if key_states[key]:
+                key_mask |= 1 << i
+
+        recorded_events = []
+        for event in events:
+            if event.type in RECORDED_EVENT_ATTRIBUTES:
+                recorded_events.append([event.type] + [getattr(event, attribute) for attribute in RECORDED_EVENT_ATTRIBUTES[event.type]])
+
+        # Les frames sans évènement qui se répètent sont regroupées
+        if (not recorded_events) and self.frames and (not self.frames[-1][1]) and (self.frames[-1][0] == key_mask):
+            self.frames[-1][2] += 1
+        else:
+            self.frames.append([key_mask, recorded_events, 1])
+
+    def save(self) -> str:
+        """Sauvegarde l'enregistrement dans un fichier compressé
+
+        Returns:
+            str: chemin du fichier créé
+        """
+        replays_location = os.path.join(SAVE_ROOT, "replays")
+        if not os.path.isdir(replays_location):
+            os.makedirs(replays_location)
+
+        file_location = os.path.join(replays_location, time.strftime("replay_%Y%m%d_%H%M%S.rec"))
+
+        with gzip.open(file_location, 'wt') as replayfile:
+            replayfile.write(json.dumps({'version': GAME_VERSION, 'seed': self.seed, 'tracked_keys': self.tracked_keys}) + "\n")
+            for frame in self.frames:
+                replayfile.write(json.dumps(frame, separators=(',', ':')) + "\n")
+
+        print(f"Inputs saved in '{os.path.abspath(file_location)}'")
+        return file_location
+
+# Classe qui rejoue les entrées d'un enregistrement frame par frame
+class InputReplayer():
+    def __init__(self, file_location: str):
+        """Charge un enregistrement des entrées
+
+        Args:
+            file_location (str): chemin du fichier créé par InputRecorder
+        """
+        with gzip.open(file_location, 'rt') as replayfile:
+            header = json.loads(replayfile.readline())
+            self.frames = [json.loads(line) for line in replayfile if line.strip()]
+
+        self.seed = header['seed']
+        self.tracked_keys = header['tracked_keys']
+
+        self.frame_index = 0
+        self.repeat_index = 0
+
+        print(f"Replaying inputs from '{os.path.abspath(file_location)}'")
+
+    @property
+    def is_finished(self) -> bool:
+        """Si toutes les frames ont été rejouées"""
+        return self.frame_index >= len(self.frames)
+
+    def next_frame(self) -> tuple[KeyStates, list[pygame.event.Event]]:
+        """Renvoie les entrées de la frame suivante
+
+        Returns:
+            tuple[KeyStates, list[pygame.event.Event]]: état des touches et évènements de la frame
+        """
+        if self.is_finished:
+            return KeyStates(set()), [pygame.event.Event(pygame.QUIT)]
+
+        key_mask, recorded_events, repeat = self.frames[self.frame_index]
+
+        pressed_keys = {key for i, key in enumerate(self.tracked_keys) if key_mask & (1 << i)}
+
+        # Les évènements ne sont rejoués qu'à la première frame d'une répétition
+        events = []
+        if self.repeat_index == 0:
+            for event_type, *values in recorded_events:
+                attributes = dict(zip(RECORDED_EVENT_ATTRIBUTES[event_type], values))
+                for name in ('pos', 'rel', 'buttons'):
+                    if name in attributes:
+                        attributes[name] = tuple(attributes[name])
+                events.append(pygame.event.Event(event_type, attributes))
+
+        self.repeat_index += 1
+        if self.repeat_index >= repeat:
+            self.frame_index += 1
+            self.repeat_index = 0
+
+        return KeyStates(pressed_keys), events
@@ -0,0 +1,299 @@
+import pygame
+import os
+import sys
+import time
+import csv
+import cProfile
+import threading
+from collections import deque, Counter
+
+from constants import *
+from .user_inputs import UserInputStates
+
+def get_profiles_location() -> str:
+    """Renvoie le dossier dans lequel les mesures de performances sont sauvegardées, il est créé s'il n'existe pas
+
+    Returns:
+        str: chemin du dossier
+    """
+    profiles_location = os.path.join(SAVE_ROOT, "profiles")
+    if not os.path.isdir(profiles_location):
+        os.makedirs(profiles_location)
+
+    return profiles_location
+
+# Classe qui mesure le temps passé dans chaque étape de la boucle du jeu
+class FrameProfiler():
+    # Limites des colonnes des histogrammes en millisecondes, la dernière colonne contient tout ce qui dépasse
+    HISTOGRAM_BINS_MS = [0.25, 0.5, 1, 2, 4, 8, 16, 33]
+
+    def __init__(self, enabled: bool = False, window: int = 300):
+        """Initialise le profileur de frames
+
+        Args:
+            enabled (bool, optional): si les mesures sont faites. False par défaut
+            window (int, optional): nombre de frames gardées pour les statistiques. 300 par défaut
+        """
+        self.enabled = enabled
+        self.window = window
+
+        # Durées de chaque étape pour les dernières frames, en millisecondes
+        self.phase_times = {}
+        # Durée totale des dernières frames
+        self.frame_times = deque(maxlen=window)
+        # Détail des dernières frames, pour l'export en CSV
+        self.frames = deque(maxlen=window)
+
+        self.frame_count = 0
+        self.frame_start_time = 0
+        self.phase_start_time = 0
+        self.current_frame = {}
+
+    def set_enabled(self, enabled: bool):
+        """Active ou désactive les mesures
+
+        Args:
+            enabled (bool): si les mesures doivent être faites
+        """
+        self.enabled = enabled
+
+    def begin_frame(self):
+        """Commence les mesures d'une nouvelle frame
+        """
+        if not self.enabled:
+            return
+
+        self.frame_start_time = time.perf_counter()
+        self.phase_start_time = self.frame_start_time
+        self.current_frame = {}
+
+    def end_phase(self, phase_name: str):
+        """Termine une étape de la frame, sa durée est le temps écoulé depuis l'étape précédente
+
+        Args:
+            phase_name (str): nom de l'étape
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        duration = (now - self.phase_start_time) * 1000
+        self.phase_start_time = now
+
+        # Une étape peut être terminée plusieurs fois dans la même frame, ses durées sont additionnées
+        self.current_frame[phase_name] = self.current_frame.get(phase_name, 0) + duration
+
+    def end_frame(self):
+        """Termine la frame et range ses mesures dans les statistiques glissantes
+        """
+        if not self.enabled:
+            return
+
+        frame_time = (time.perf_counter() - self.frame_start_time) * 1000
+        self.frame_times.append(frame_time)
+
+        for phase_name, duration in self.current_frame.items():
+            if phase_name not in self.phase_times:
+                self.phase_times[phase_name] = deque(maxlen=self.window)
+            self.phase_times[phase_name].append(duration)
+
+        self.frames.append((self.frame_count, frame_time, self.current_frame))
+        self.frame_count += 1
+
+    def get_statistics(self, durations: deque) -> tuple[float, float, float]:
+        """Calcule les statistiques d'une liste de durées
+
+        Args:
+            durations (deque): durées en millisecondes
+
+        Returns:
+            tuple[float, float, float]: moyenne, 95e centile et maximum
+        """
+        if not durations:
+            return 0, 0, 0
+
+        sorted_durations = sorted(durations)
+        percentile_index = min(len(sorted_durations) - 1, int(len(sorted_durations) * 0.95))
+
+        return sum(sorted_durations) / len(sorted_durations), sorted_durations[percentile_index], sorted_durations[-1]
+
+    def get_histogram(self, durations: deque) -> list[int]:
+        """Range des durées dans les colonnes de l'histogramme
+
+        Args:
+            durations (deque): durées en millisecondes
+
+        Returns:
+            list[int]: nombre de durées dans chaque colonne
+        """
+        histogram = [0] * (len(self.HISTOGRAM_BINS_MS) + 1)
+
+        for duration in durations:
+            bin_index = len(self.HISTOGRAM_BINS_MS)
+            for i, limit in enumerate(self.HISTOGRAM_BINS_MS):
+                if duration < limit:
+                    bin_index = i
+                    break
+            histogram[bin_index] += 1
+
+        return histogram
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font, x: int = 5, y: int = 50):
+        """Affiche les statistiques de chaque étape et leur histogramme par-dessus le jeu
+
+        Args:
+            screen (pygame.Surface): écran sur lequel afficher les statistiques
+            font (pygame.font.Font): police utilisée
+            x (int, optional): position du coin haut gauche sur l'axe horizontal. 5 par défaut
+            y (int, optional): position du coin haut gauche sur l'axe vertical. 50 par défaut
+        """
+        if not self.enabled:
+            return
+
+        line_height = font.get_linesize()
+        bar_width = 3
+        histogram_x = x + font.size("m" * 34)[0]
+
+        rows = [("frame", self.frame_times)] + list(self.phase_times.items())
+        for i, (name, durations) in enumerate(rows):
+            mean, percentile, maximum = self.get_statistics(durations)
+            line_y = y + i * line_height
+
+            text = font.render(f"{name[:12]:<12} {mean:5.2f} {percentile:5.2f} {maximum:6.2f}", False, COLOR_DARK)
+            screen.blit(text, (x, line_y))
+
+            # Histogramme de l'étape, chaque barre est proportionnelle au nombre de frames dans sa colonne
+            histogram = self.get_histogram(durations)
+            total = max(1, len(durations))
+            for j, count in enumerate(histogram):
+                bar_height = max(1, int((line_height - 2) * count / total)) if count else 0
+                pygame.draw.rect(screen, COLOR_RED, (histogram_x + j * (bar_width + 1), line_y + line_height - 1 - bar_height, bar_width, bar_height))
+
+    def dump_csv(self) -> str:
+        """Sauvegarde le détail des dernières frames dans un fichier CSV
+
+        Returns:
+            str: chemin du fichier créé, None s'il n'y avait rien à sauvegarder
+        """
+        if not self.frames:
+            return None
+
+        file_location = os.path.join(get_profiles_location(), time.strftime("frames_%Y%m%d_%H%M%S.csv"))
+        phase_names = list(self.phase_times.keys())
+
+        with open(file_location, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["frame", "total_ms"] + [f"{name}_ms" for name in phase_names])
+
+            for frame_index, frame_time, phases in self.frames:
+                writer.writerow([frame_index, f"{frame_time:.4f}"] + [f"{phases.get(name, 0):.4f}" for name in phase_names])
+
+        print(f"Frame profile saved in '{os.path.abspath(file_location)}'")
+        return file_location
+
+# Classe qui enregistre une session de profilage démarrée et arrêtée avec une touche
+class ProfilingSession():
+    def __init__(self, hotkey: int = pygame.K_F9, sample_interval: float = 0.005):
+        """Crée une session de profilage, la touche est écoutée à travers UserInputStates
+
+        Args:
+            hotkey (int, optional): touche qui démarre et arrête la session. pygame.K_F9 par défaut
+            sample_interval (float, optional): temps en secondes entre deux échantillons de la pile d'appels. 0.005 par défaut
+        """
+        self.hotkey = hotkey
+        self.sample_interval = sample_interval
+
+        self.profile = None
+        self.sampler_thread = None
+        self.stop_sampling = threading.Event()
+        self.previous_switch_interval = sys.getswitchinterval()
+        # Nombre d'échantillons pour chaque pile d'appels, au format "collapsed" des flamegraphs
+        self.stack_samples = Counter()
+
+        UserInputStates.get_instance().add_method_to_be_processed(self.handle_event)
+
+    @property
+    def is_running(self) -> bool:
+        """Si une session est en cours"""
+        return self.profile is not None
+
+    def handle_event(self, event: pygame.event.Event):
+        """Démarre ou arrête la session quand la touche est pressée
+
+        Args:
+            event (pygame.event.Event): évènement de pygame
+        """
+        if event.type == pygame.KEYDOWN and event.key == self.hotkey:
+            if self.is_running:
+                self.stop()
+            else:
+                self.start()
+
+    def start(self):
+        """Démarre le profilage de la boucle du jeu et l'échantillonnage de sa pile d'appels
+        """
+        if self.is_running:
+            return
+
+        print("Profiling session started")
+        self.stack_samples.clear()
+        self.stop_sampling.clear()
+
+        # Le thread du jeu doit rendre la main assez souvent pour que l'échantillonneur puisse relever sa pile
+        self.previous_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.previous_switch_interval, self.sample_interval / 5))
+
+        # L'échantillonneur regarde la pile du thread qui fait tourner le jeu
+        self.sampler_thread = threading.Thread(target=self.sample_stacks, args=(threading.get_ident(),), daemon=True)
+        self.sampler_thread.start()
+
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def sample_stacks(self, thread_id: int):
+        """Relève régulièrement la pile d'appels du jeu, cette méthode tourne dans son propre thread
+
+        Args:
+            thread_id (int): identifiant du thread du jeu
+        """
+        while not self.stop_sampling.wait(self.sample_interval):
+            frame = sys._current_frames().get(thread_id)
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+
+            if stack:
+                self.stack_samples[";".join(reversed(stack))] += 1
+
+    def stop(self) -> tuple[str, str]:
+        """Arrête la session et sauvegarde le profil et les piles échantillonnées
+
+        Returns:
+            tuple[str, str]: chemins du fichier .prof et du fichier .collapsed, None si aucune session n'était en cours
+        """
+        if not self.is_running:
+            return None
+
+        self.profile.disable()
+        self.stop_sampling.set()
+        self.sampler_thread.join()
+        sys.setswitchinterval(self.previous_switch_interval)
+
+        file_name = os.path.join(get_profiles_location(), time.strftime("session_%Y%m%d_%H%M%S"))
+
+        # Le fichier .prof peut être ouvert avec pstats ou snakeviz
+        self.profile.dump_stats(f"{file_name}.prof")
+
+        # Le fichier .collapsed peut être donné à flamegraph.pl ou speedscope
+        with open(f"{file_name}.collapsed", 'w') as collapsedfile:
+            for stack, count in self.stack_samples.items():
+                collapsedfile.write(f"{stack} {count}\n")
+
+        self.profile = None
+        self.sampler_thread = None
+
+        print(f"Profiling session saved in '{os.path.abspath(file_name)}.prof'")
+        return f"{file_name}.prof", f"{file_name}.collapsed"
@@ -0,0 +1,71 @@
+import random, zlib
+
+# Classe qui fournit les générateurs de nombres aléatoires du jeu, un par sous-système
+class RandomService():
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        """Méthode pour donner une instance unique de la classe RandomService
+        """
+        if RandomService.__instance == None:
+            RandomService.__instance = RandomService()
+        return RandomService.__instance
+
+    def __init__(self):
+        """Crée le service avec une graine tirée au hasard
+        """
+        self.master_seed = random.randrange(2**32)
+        # Dictionnaire qui associe le nom d'un sous-système à son générateur
+        self.streams = {}
+
+    def get_stream_seed(self, name: str) -> int:
+        """Calcule la graine du générateur d'un sous-système à partir de la graine principale
+
+        Args:
+            name (str): nom du sous-système
+
+        Returns:
+            int: graine du générateur
+        """
+        # crc32 ne dépend pas de PYTHONHASHSEED, contrairement à hash
+        return (self.master_seed << 32) | zlib.crc32(name.encode())
+
+    def seed(self, master_seed: int):
+        """Change la graine principale et réinitialise tous les générateurs
+
+        Args:
+            master_seed (int): nouvelle graine principale
+        """
+        self.master_seed = master_seed
+        # Les générateurs déjà donnés sont réinitialisés sur place pour que les références gardées restent valides
+        for name, stream in self.streams.items():
+            stream.seed(self.get_stream_seed(name))
+
+    def get_stream(self, name: str) -> random.Random:
+        """Renvoie le générateur d'un sous-système, les tirages d'un sous-système ne changent pas ceux des autres
+
+        Args:
+            name (str): nom du sous-système
+
+        Returns:
+            random.Random: générateur du sous-système
+        """
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = random.Random(self.get_stream_seed(name))
+            self.streams[name] = stream
+        return stream
+
+    @staticmethod
+    def bernoulli(stream: random.Random, probability: float) -> bool:
+        """Tire un évènement qui a une probabilité donnée d'arriver
+
+        Args:
+            stream (random.Random): générateur utilisé
+            probability (float): probabilité que l'évènement arrive, entre 0 et 1
+
+        Returns:
+            bool: si l'évènement est arrivé
+        """
+        return stream.random() < probability
@@ -0,0 +1,187 @@
+import pygame
+import abc as abstract
+
+from constants import *
+
+# Classe de base des scènes du jeu, seule la scène en haut de la pile est mise à jour
+class Scene(abstract.ABC):
+    # Si la scène est affichée par-dessus l'image figée des scènes qui sont en dessous d'elle
+    is_overlay = False
+    # Si l'horloge de la simulation et ses évènements programmés avancent quand la scène est active
+    advances_simulation = False
+    # Si les animations avancent quand la scène est active
+    advances_animations = False
+    # Si rien ne bouge dans la scène sans action du joueur, le nombre d'images par seconde peut alors être réduit
+    is_static = False
+
+    def __init__(self):
+        """Crée une scène, elle n'est dans aucune pile tant qu'elle n'a pas été ajoutée
+        """
+        self.stack = None
+        # Couleur posée sur l'image figée pour l'assombrir, si elle est opaque les scènes en dessous ne sont pas affichées. None pour ne pas l'assombrir
+        self.frozen_background_color = None
+
+    def on_enter(self):
+        """Appelée quand la scène est ajoutée à la pile
+        """
+
+    def on_exit(self):
+        """Appelée quand la scène est enlevée de la pile
+        """
+
+    def on_pause(self):
+        """Appelée quand une autre scène est ajoutée par-dessus
+        """
+
+    def on_resume(self):
+        """Appelée quand la scène redevient celle du haut de la pile
+        """
+
+    @abstract.abstractmethod
+    def run(self, screen: pygame.Surface, inputs):
+        """Met à jour et affiche la scène pendant une frame, seulement quand elle est en haut de la pile
+
+        Args:
+            screen (pygame.Surface): écran sur lequel la scène est affichée
+            inputs (InputSnapshot): état des entrées de la frame
+        """
+
+    def draw_frozen(self, screen: pygame.Surface):
+        """Affiche la scène sans la mettre à jour, pour l'image figée utilisée par les scènes au-dessus, rien n'est affiché par défaut
+
+        Args:
+            screen (pygame.Surface): surface sur laquelle la scène est affichée
+        """
+
+# Classe qui gère la pile des scènes et les transitions entre elles
+class SceneStack():
+    def __init__(self, do_blur_frozen_background: bool = False):
+        """Crée une pile de scènes vide
+
+        Args:
+            do_blur_frozen_background (bool, optional): si l'image figée des scènes sous une scène affichée par-dessus est floutée. False par défaut
+        """
+        self.scenes = []
+        self.is_running = True
+        # Image figée des scènes sous celle du haut, recréée seulement quand la pile change
+        self.frozen_background = None
+        self.do_blur_frozen_background = do_blur_frozen_background
+
+    @property
+    def top(self) -> Scene:
+        """Scène active, None si la pile est vide"""
+        return self.scenes[-1] if self.scenes else None
+
+    def push(self, scene: Scene):
+        """Ajoute une scène par-dessus la scène active
+
+        Args:
+            scene (Scene): scène à ajouter
+        """
+        if self.scenes:
+            self.scenes[-1].on_pause()
+
+        scene.stack = self
+        self.scenes.append(scene)
+        self.frozen_background = None
+        scene.on_enter()
+
+    def pop(self) -> Scene:
+        """Enlève la scène active, la scène en dessous reprend
+
+        Returns:
+            Scene: scène enlevée
+        """
+        scene = self.scenes.pop()
+        scene.on_exit()
+        scene.stack = None
+        self.frozen_background = None
+
+        if self.scenes:
+            self.scenes[-1].on_resume()
+        else:
+            self.is_running = False
+        return scene
+
+    def replace(self, scene: Scene):
+        """Remplace la scène active par une autre
+
+        Args:
+            scene (Scene): nouvelle scène
+        """
+        old_scene = self.scenes.pop()
+        old_scene.on_exit()
+        old_scene.stack = None
+
+        scene.stack = self
+        self.scenes.append(scene)
+        self.frozen_background = None
+        scene.on_enter()
+
+    def quit(self):
+        """Demande l'arrêt du jeu, la boucle principale s'arrête à la fin de la frame
+        """
+        self.is_running = False
+
+    def render_frozen_background(self, screen: pygame.Surface) -> pygame.Surface:
+        """Affiche une seule fois les scènes sous la scène active dans une image, floutée et assombrie si besoin
+
+        Args:
+            screen (pygame.Surface): écran, l'image a la même taille et le même format
+
+        Returns:
+            pygame.Surface: image figée des scènes
+        """
+        background = screen.copy()
+        color = self.top.frozen_background_color
+
+        if color is not None:
+            color = pygame.Color(color)
+            if color.a == 255:
+                # Les scènes en dessous seraient entièrement cachées, elles ne sont pas affichées
+                background.fill(color)
+                return background
+
+        for scene in self.scenes[:-1]:
+            scene.draw_frozen(background)
+
+        if self.do_blur_frozen_background:
+            background = self.blur(background)
+
+        if color is not None:
+            dim_layer = pygame.Surface(background.get_size(), pygame.SRCALPHA)
+            dim_layer.fill(color)
+            background.blit(dim_layer, (0, 0))
+
+        return background
+
+    @staticmethod
+    def blur(surface: pygame.Surface, factor: int = FROZEN_BACKGROUND_BLUR_FACTOR) -> pygame.Surface:
+        """Floute une image en la réduisant puis en l'agrandissant
+
+        Args:
+            surface (pygame.Surface): image à flouter
+            factor (int, optional): facteur de réduction de l'image, plus il est grand, plus l'image est floue. FROZEN_BACKGROUND_BLUR_FACTOR par défaut
+
+        Returns:
+            pygame.Surface: image floutée
+        """
+        width, height = surface.get_size()
+        small_surface = pygame.transform.smoothscale(surface, (max(1, width // factor), max(1, height // factor)))
+        return pygame.transform.smoothscale(small_surface, (width, height))
+
+    def run(self, screen: pygame.Surface, inputs):
+        """Met à jour et affiche la scène active, les scènes en dessous ne sont pas mises à jour
+
+        Args:
+            screen (pygame.Surface): écran sur lequel les scènes sont affichées
+            inputs (InputSnapshot): état des entrées de la frame
+        """
+        scene = self.top
+
+        if scene.is_overlay:
+            if self.frozen_background is None:
+                self.frozen_background = self.render_frozen_background(screen)
+            screen.blit(self.frozen_background, (0, 0))
+
+        scene.run(screen, inputs)
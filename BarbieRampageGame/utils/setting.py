@@ -3,6 +3,7 @@ import os
 import json
 
 from constants import *
+from .action_map import ActionMap
 
 # Classe qui permet de gérer les paramètres modifiables du jeu
 class Settings():
@@ -13,13 +14,25 @@ class Settings():
         self.set_default_settings()
         
         self.load_settings()
+        # La table des actions est compilée une seule fois, après le chargement des touches
+        self.action_map = ActionMap(self.keybinds)
         self.assets = None
     
     def set_default_settings(self):
         """Initialise les paramètres par défaut
         """
         self.do_draw_game_time = False
+        self.do_draw_fps = False
         self.do_draw_hitboxes = False
+        self.do_profile_frames = False
+        self.do_record_inputs = False
+        self.replay_file = ""
+        
+        # Pour les performances
+        self.do_batch_bullets = False
+        
+        # Floute l'image figée du jeu derrière les menus de pause et d'inventaire
+        self.do_blur_paused_game = False
         
         self.screen_width = 700
         self.screen_height = int(self.screen_width * 0.8)
@@ -29,12 +42,18 @@ class Settings():
         self.set_default_keybinds()
     
     def set_default_keybinds(self):
-        """Défini la configuration des touches dans sa valeur par défaut
+        """Défini la configuration des touches dans sa valeur par défaut, une action peut avoir une liste de touches alternatives
         """
         self.keybinds = {}
         self.keybinds['move_left'] = pygame.K_q
         self.keybinds['move_right'] = pygame.K_d
         self.keybinds['move_jump'] = pygame.K_SPACE
+        self.keybinds['shoot'] = pygame.K_TAB
+        self.keybinds['swap_weapons'] = pygame.K_a
+        self.keybinds['interact'] = pygame.K_e
+        self.keybinds['inventory'] = pygame.K_i
+        self.keybinds['pause'] = pygame.K_ESCAPE
+        self.keybinds['confirm'] = pygame.K_RETURN
     
     
     def load_settings(self):
@@ -52,8 +71,8 @@ class Settings():
                 self.screen_width = settings_json['screensize']['width']
                 self.screen_height = settings_json['screensize']['height']
                 
-                # Les touches
-                self.keybinds = settings_json['keybinds']
+                # Les touches, les actions absentes du fichier gardent leur touche par défaut
+                self.keybinds.update(settings_json['keybinds'])
                 
                 # Les autres paramètres
                 self.volume = settings_json['sound']['volume']
@@ -61,6 +80,16 @@ class Settings():
                 # Pour debug
                 self.do_draw_game_time = settings_json['debug']['do_draw_game_time']
                 self.do_draw_hitboxes = settings_json['debug']['do_draw_hitboxes']
+                self.do_profile_frames = settings_json['debug']['do_profile_frames']
+                self.do_record_inputs = settings_json['debug']['do_record_inputs']
+                self.replay_file = settings_json['debug']['replay_file']
+                self.do_draw_fps = settings_json['debug']['do_draw_fps']
+                
+                # Pour les performances
+                self.do_batch_bullets = settings_json['performance']['do_batch_bullets']
+                
+                # Pour l'affichage
+                self.do_blur_paused_game = settings_json['graphics']['do_blur_paused_game']
                 print("Settings have been loaded")
             
             except KeyError:
@@ -94,7 +123,17 @@ class Settings():
         
         settings_dict['debug'] = {}
         settings_dict['debug']['do_draw_game_time'] = self.do_draw_game_time
+        settings_dict['debug']['do_draw_fps'] = self.do_draw_fps
         settings_dict['debug']['do_draw_hitboxes'] = self.do_draw_hitboxes
+        settings_dict['debug']['do_profile_frames'] = self.do_profile_frames
+        settings_dict['debug']['do_record_inputs'] = self.do_record_inputs
+        settings_dict['debug']['replay_file'] = self.replay_file
+        
+        settings_dict['performance'] = {}
+        settings_dict['performance']['do_batch_bullets'] = self.do_batch_bullets
+        
+        settings_dict['graphics'] = {}
+        settings_dict['graphics']['do_blur_paused_game'] = self.do_blur_paused_game
         
         # Transformation du dictionnaire en json
         settings_json = json.dumps(settings_dict, indent=4)
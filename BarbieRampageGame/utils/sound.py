@@ -0,0 +1,177 @@
+import pygame, itertools
+
+from constants import *
+
+# Classe qui décrit un effet sonore et la façon dont il doit être joué
+class SoundEffect():
+    __slots__ = ('sound', 'priority', 'max_instances', 'volume')
+
+    def __init__(self, sound: pygame.mixer.Sound, priority: int, max_instances: int, volume: float):
+        """Crée un effet sonore
+
+        Args:
+            sound (pygame.mixer.Sound): son à jouer
+            priority (int): priorité du son, un son peut prendre le canal d'un son de priorité inférieure ou égale
+            max_instances (int): nombre maximum de fois où le son peut être joué en même temps
+            volume (float): volume propre au son, multiplié par le volume du jeu
+        """
+        self.sound = sound
+        self.priority = priority
+        self.max_instances = max_instances
+        self.volume = volume
+
+# Classe qui joue les effets sonores sur des canaux réservés du mixer
+class SoundManager():
+    def __init__(self, screen_width: int, channel_count: int = SOUND_EFFECT_CHANNELS, volume: float = 1):
+        """Réserve les canaux des effets sonores
+
+        Args:
+            screen_width (int): largeur de l'écran, le son est entendu depuis le milieu de l'écran
+            channel_count (int, optional): nombre de canaux réservés aux effets sonores. SOUND_EFFECT_CHANNELS par défaut
+            volume (float, optional): volume des effets sonores. 1 par défaut
+        """
+        # Les canaux réservés ne sont jamais pris par Sound.play, seul le gestionnaire les utilise
+        if pygame.mixer.get_num_channels() < channel_count:
+            pygame.mixer.set_num_channels(channel_count)
+        pygame.mixer.set_reserved(channel_count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channel_count)]
+
+        # Ce qui est joué sur chaque canal : nom du son, priorité, ordre de lancement et volume gauche et droite avant le volume du jeu
+        self.channel_sounds = [None] * channel_count
+        self.channel_priorities = [0] * channel_count
+        self.channel_orders = [0] * channel_count
+        self.channel_gains = [(0, 0)] * channel_count
+        self.play_counter = itertools.count(1)
+
+        self.effects = {}
+
+        self.volume = volume
+        # Le volume demandé n'est appliqué qu'une fois par image, dans update
+        self.pending_volume = None
+
+        self.listener_x = screen_width / 2
+        # Au-delà de cette distance du milieu de l'écran, le son n'est plus entendu
+        self.hearing_distance = screen_width * SOUND_HEARING_DISTANCE_FACTOR
+
+    def add_sound(self, name: str, sound_location: str, priority: int = 0, max_instances: int = 1, volume: float = 1):
+        """Charge un effet sonore
+
+        Args:
+            name (str): nom de l'effet sonore
+            sound_location (str): chemin du fichier du son
+            priority (int, optional): priorité du son. 0 par défaut
+            max_instances (int, optional): nombre maximum de fois où le son peut être joué en même temps. 1 par défaut
+            volume (float, optional): volume propre au son. 1 par défaut
+        """
+        self.effects[name] = SoundEffect(pygame.mixer.Sound(sound_location), priority, max_instances, volume)
+
+    def get_gains(self, x: float) -> tuple[float, float]:
+        """Calcule le volume gauche et droite d'un son selon sa distance au milieu de l'écran
+
+        Args:
+            x (float): position du son sur l'axe horizontal de l'écran, None si le son n'a pas de position
+
+        Returns:
+            tuple[float, float]: volume du côté gauche et du côté droit
+        """
+        if x is None:
+            return 1, 1
+
+        distance = (x - self.listener_x) / self.hearing_distance
+        attenuation = 1 - min(abs(distance), 1)
+        # Le son est plus fort du côté où il se trouve
+        pan = max(-1, min(distance, 1))
+        return attenuation * min(1, 1 - pan), attenuation * min(1, 1 + pan)
+
+    def find_channel(self, name: str, effect: SoundEffect) -> int:
+        """Cherche le canal sur lequel jouer un son
+
+        Args:
+            name (str): nom de l'effet sonore
+            effect (SoundEffect): effet sonore à jouer
+
+        Returns:
+            int: index du canal, None si aucun canal ne peut être pris
+        """
+        free_index = None
+        oldest_instance_index = None
+        instance_count = 0
+        stealable_index = None
+
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                self.channel_sounds[i] = None
+                if free_index is None:
+                    free_index = i
+                continue
+
+            if self.channel_sounds[i] == name:
+                instance_count += 1
+                if (oldest_instance_index is None) or (self.channel_orders[i] < self.channel_orders[oldest_instance_index]):
+                    oldest_instance_index = i
+
+            # Le canal pris est celui du son le moins prioritaire, puis le plus ancien
+            if (self.channel_priorities[i] <= effect.priority) and ((stealable_index is None) or
+                    (self.channel_priorities[i], self.channel_orders[i]) < (self.channel_priorities[stealable_index], self.channel_orders[stealable_index])):
+                stealable_index = i
+
+        # Un son déjà joué trop de fois remplace sa plus ancienne instance
+        if instance_count >= effect.max_instances:
+            return oldest_instance_index
+        if free_index is not None:
+            return free_index
+        return stealable_index
+
+    def play(self, name: str, x: float = None) -> pygame.mixer.Channel:
+        """Joue un effet sonore
+
+        Args:
+            name (str): nom de l'effet sonore
+            x (float, optional): position du son sur l'axe horizontal de l'écran, None pour un son sans position. None par défaut
+
+        Returns:
+            pygame.mixer.Channel: canal sur lequel le son est joué, None si le son n'est pas joué
+        """
+        effect = self.effects[name]
+
+        left_gain, right_gain = self.get_gains(x)
+        if left_gain <= 0 and right_gain <= 0:
+            # Le son est trop loin pour être entendu, il ne prend pas de canal
+            return None
+
+        index = self.find_channel(name, effect)
+        if index is None:
+            return None
+
+        gains = (left_gain * effect.volume, right_gain * effect.volume)
+        self.channel_sounds[index] = name
+        self.channel_priorities[index] = effect.priority
+        self.channel_orders[index] = next(self.play_counter)
+        self.channel_gains[index] = gains
+
+        channel = self.channels[index]
+        channel.play(effect.sound)
+        # Le volume du canal est remis à zéro par play, il est donc changé après
+        channel.set_volume(gains[0] * self.volume, gains[1] * self.volume)
+        return channel
+
+    def set_volume(self, volume: float):
+        """Demande un changement du volume des effets sonores, il sera appliqué au prochain appel de update
+
+        Args:
+            volume (float): volume des effets sonores
+        """
+        self.pending_volume = volume
+
+    def update(self):
+        """Applique le dernier volume demandé aux sons en train d'être joués, appelée une fois par image
+        """
+        if self.pending_volume is None:
+            return
+
+        self.volume = self.pending_volume
+        self.pending_volume = None
+
+        for channel, name, gains in zip(self.channels, self.channel_sounds, self.channel_gains):
+            if (name is not None) and channel.get_busy():
+                channel.set_volume(gains[0] * self.volume, gains[1] * self.volume)
@@ -1,5 +1,59 @@
 import pygame, typing
 
+from .input_replay import KeyStates, InputRecorder, InputReplayer
+from .action_map import ActionMap
+
+# État des entrées d'une frame, il est créé une seule fois par frame et n'est plus modifié ensuite
+class InputSnapshot(typing.NamedTuple):
+    # Numéro de la frame
+    frame: int
+    # Actions des touches configurées qui sont maintenues
+    held_actions: frozenset
+    # Actions dont la touche vient d'être enfoncée pendant la frame
+    pressed_actions: frozenset
+    # Touches enfoncées pendant la frame, d'après les évènements KEYDOWN
+    pressed_keys: frozenset
+    # Position de la souris et état de ses trois boutons
+    mouse_pos: tuple[int, int]
+    mouse_buttons: tuple[bool, bool, bool]
+    # Si le clic gauche vient d'être enfoncé pendant la frame
+    mouse_clicked: bool
+    # Évènements de la frame
+    events: tuple
+
+    def is_held(self, action: str) -> bool:
+        """Renvoie si la touche d'une action est maintenue
+
+        Args:
+            action (str): nom de l'action, comme dans la table des actions
+
+        Returns:
+            bool: si la touche est maintenue
+        """
+        return action in self.held_actions
+
+    def was_pressed(self, action: str) -> bool:
+        """Renvoie si la touche d'une action vient d'être enfoncée
+
+        Args:
+            action (str): nom de l'action, comme dans la table des actions
+
+        Returns:
+            bool: si la touche vient d'être enfoncée
+        """
+        return action in self.pressed_actions
+
+    def was_key_pressed(self, key: int) -> bool:
+        """Renvoie si une touche a été enfoncée pendant la frame
+
+        Args:
+            key (int): constante de la touche de pygame
+
+        Returns:
+            bool: si la touche a été enfoncée
+        """
+        return key in self.pressed_keys
+
 class UserInputStates():
     __instance = None
 
@@ -14,10 +68,171 @@ class UserInputStates():
     def __init__(self):
         """Crée une instance de UserImputStates
         """
-        self.RESET_CLICKED_STATE_TIME = 20
-        self.update_time = pygame.time.get_ticks()
-        self._clicked = False
         self.methods_to_be_processed = []
+        
+        # Table des actions de chaque touche, donnée par les paramètres
+        self.action_map = ActionMap({})
+        
+        # Entrées de la frame en cours, lues une seule fois par frame
+        self.snapshot = InputSnapshot(0, frozenset(), frozenset(), frozenset(), (0, 0), (False, False, False), False, ())
+        # Entrées données par le code à la place de celles du joueur pour la prochaine frame, None s'il n'y en a pas
+        self.injected_frame = None
+        
+        # Enregistrement ou rediffusion des entrées, None s'il n'y en a pas
+        self.recorder = None
+        self.replayer = None
+    
+    def start_recording(self, tracked_keys: list[int], seed: int):
+        """Commence à enregistrer les entrées de chaque frame
+
+        Args:
+            tracked_keys (list[int]): touches dont l'état est enregistré
+            seed (int): graine principale des générateurs aléatoires utilisée pendant la partie
+        """
+        self.recorder = InputRecorder(tracked_keys, seed)
+    
+    def stop_recording(self) -> str:
+        """Arrête l'enregistrement et le sauvegarde
+
+        Returns:
+            str: chemin du fichier créé, None s'il n'y avait pas d'enregistrement
+        """
+        if self.recorder is None:
+            return None
+        
+        file_location = self.recorder.save()
+        self.recorder = None
+        return file_location
+    
+    def start_replay(self, file_location: str) -> int:
+        """Remplace les entrées du joueur par celles d'un enregistrement
+
+        Args:
+            file_location (str): chemin de l'enregistrement
+
+        Returns:
+            int: graine principale des générateurs aléatoires à utiliser pour refaire les mêmes tirages
+        """
+        self.replayer = InputReplayer(file_location)
+        return self.replayer.seed
+    
+    @property
+    def is_replaying(self) -> bool:
+        """Si les entrées viennent d'un enregistrement"""
+        return self.replayer is not None
+    
+    @property
+    def is_recording(self) -> bool:
+        """Si les entrées sont enregistrées"""
+        return self.recorder is not None
+    
+    def set_action_map(self, action_map: ActionMap):
+        """Change la table des actions utilisée pour lire l'état des entrées
+
+        Args:
+            action_map (ActionMap): table des actions, compilée par les paramètres
+        """
+        self.action_map = action_map
+    
+    def inject_frame(self, pressed_keys: set[int], events: list[pygame.event.Event] = (), mouse_pos: tuple[int, int] = None, mouse_buttons: tuple[bool, bool, bool] = None):
+        """Remplace les entrées du joueur de la prochaine frame, pour faire tourner le jeu sans clavier ni souris
+
+        Args:
+            pressed_keys (set[int]): touches maintenues
+            events (list[pygame.event.Event], optional): évènements de la frame. () par défaut
+            mouse_pos (tuple[int, int], optional): position de la souris, déduite des évènements si None. None par défaut
+            mouse_buttons (tuple[bool, bool, bool], optional): état des boutons de la souris, déduit des évènements si None. None par défaut
+        """
+        self.injected_frame = (KeyStates(set(pressed_keys)), list(events), mouse_pos, mouse_buttons)
+    
+    def begin_frame(self) -> InputSnapshot:
+        """Lit les entrées de la nouvelle frame, depuis pygame, depuis des entrées injectées ou depuis l'enregistrement rejoué
+
+        Returns:
+            InputSnapshot: état des entrées de la frame
+        """
+        events = pygame.event.get()
+        mouse_pos, mouse_buttons = None, None
+        
+        if self.injected_frame is not None:
+            key_states, frame_events, mouse_pos, mouse_buttons = self.injected_frame
+            self.injected_frame = None
+            # Seule la fermeture de la fenêtre est gardée
+            frame_events += [event for event in events if event.type == pygame.QUIT]
+        elif self.replayer is not None:
+            # Pendant une rediffusion, seule la fermeture de la fenêtre est gardée
+            key_states, frame_events = self.replayer.next_frame()
+            frame_events += [event for event in events if event.type == pygame.QUIT]
+        else:
+            key_states = pygame.key.get_pressed()
+            frame_events = events
+            mouse_pos = pygame.mouse.get_pos()
+            mouse_buttons = pygame.mouse.get_pressed()[:3]
+            
+            if self.recorder is not None:
+                self.recorder.record_frame(key_states, frame_events)
+        
+        if mouse_pos is None or mouse_buttons is None:
+            # La souris n'a pas été lue, elle est déduite des évènements
+            mouse_pos, mouse_buttons = self.get_mouse_from_events(frame_events, mouse_pos, mouse_buttons)
+        
+        self.snapshot = self.create_snapshot(key_states, frame_events, mouse_pos, tuple(bool(button) for button in mouse_buttons))
+        return self.snapshot
+    
+    def get_mouse_from_events(self, events: list[pygame.event.Event], mouse_pos: tuple[int, int] = None, mouse_buttons: tuple[bool, bool, bool] = None) -> tuple[tuple[int, int], tuple[bool, bool, bool]]:
+        """Déduit l'état de la souris de celui de la frame précédente et des évènements de la frame
+
+        Args:
+            events (list[pygame.event.Event]): évènements de la frame
+            mouse_pos (tuple[int, int], optional): position de la souris déjà connue. None par défaut
+            mouse_buttons (tuple[bool, bool, bool], optional): état des boutons déjà connu. None par défaut
+
+        Returns:
+            tuple[int, int]: position de la souris
+            tuple[bool, bool, bool]: état des boutons de la souris
+        """
+        position = self.snapshot.mouse_pos
+        buttons = list(self.snapshot.mouse_buttons)
+        
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                position = event.pos
+            elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                position = event.pos
+                if 1 <= event.button <= 3:
+                    buttons[event.button - 1] = event.type == pygame.MOUSEBUTTONDOWN
+        
+        return (mouse_pos if mouse_pos is not None else tuple(position)), (mouse_buttons if mouse_buttons is not None else tuple(buttons))
+    
+    def create_snapshot(self, key_states, events: list[pygame.event.Event], mouse_pos: tuple[int, int], mouse_buttons: tuple[bool, bool, bool]) -> InputSnapshot:
+        """Crée l'état des entrées de la frame, les actions sont résolues une seule fois ici
+
+        Args:
+            key_states (ScancodeWrapper | KeyStates): état des touches, indexé par les constantes des touches de pygame
+            events (list[pygame.event.Event]): évènements de la frame
+            mouse_pos (tuple[int, int]): position de la souris
+            mouse_buttons (tuple[bool, bool, bool]): état des boutons de la souris
+
+        Returns:
+            InputSnapshot: état des entrées de la frame
+        """
+        previous_snapshot = self.snapshot
+        
+        held_actions = self.action_map.get_held_actions(key_states)
+        pressed_keys = frozenset(event.key for event in events if event.type == pygame.KEYDOWN)
+        # Une action est déclenchée par l'évènement de sa touche ou quand sa touche commence à être maintenue
+        pressed_actions = self.action_map.get_pressed_actions(pressed_keys) | (held_actions - previous_snapshot.held_actions)
+        
+        return InputSnapshot(
+            previous_snapshot.frame + 1,
+            held_actions,
+            pressed_actions,
+            pressed_keys,
+            mouse_pos,
+            mouse_buttons,
+            mouse_buttons[0] and not previous_snapshot.mouse_buttons[0],
+            tuple(events)
+        )
     
     def add_method_to_be_processed(self, method: typing.Callable):
         """Ajoute une méthode qui sera exécutée lors de l'appel de la méthode process_events
@@ -38,21 +253,9 @@ class UserInputStates():
             method(event)
     
     def mouse_single_pressed(self) -> bool:
-        """Renvoie si la souris a cliqué
+        """Renvoie si la souris a cliqué pendant la frame
 
         Returns:
             bool: si la souris a cliqué
         """
-        # Reset l'update time si la souris a été clickée
-        if pygame.mouse.get_pressed()[0]:
-            self.update_time = pygame.time.get_ticks()
-        
-        if pygame.time.get_ticks() - self.update_time > self.RESET_CLICKED_STATE_TIME:
-            self._clicked = False
-        
-        if pygame.mouse.get_pressed()[0] and not self._clicked:
-            self._clicked = True
-            return True
-        
-        return False
-        
\ No newline at end of file
+        return self.snapshot.mouse_clicked
@@ -1,2 +1,4 @@
 # Initialisation du module
-from .weapons import Weapon, Arb4rb13, GunP450, GunP90
\ No newline at end of file
+from .weapons import Weapon, Arb4rb13, GunP450, GunP90
+from .bullet_batch import BulletBatch
+from .registry import WeaponRegistry, CRATE_WEAPONS
\ No newline at end of file
@@ -0,0 +1,314 @@
+import pygame
+
+from constants import *
+import utils
+from .bullets import Bullet
+
+# NumPy est optionnel, sans lui les balles restent des sprites classiques
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Classe qui simule toutes les balles en même temps avec des tableaux NumPy
+class BulletBatch():
+    def __init__(self, capacity: int = 64):
+        """Crée un groupe de balles simulées ensemble, chaque propriété des balles est stockée dans un tableau
+
+        Args:
+            capacity (int, optional): nombre de balles pour lequel la place est réservée au départ. 64 par défaut
+        """
+        assert BulletBatch.is_available(), "NumPy est nécessaire pour grouper les balles"
+
+        self.ANIMATION_COOLDOWN = 50
+        self.clock = utils.SimulationClock.get_instance()
+
+        # Les images de chaque type de balle, chargées une seule fois
+        self.bullet_types = []
+        self.bullet_type_indexes = {}
+        self.frame_counts = numpy.zeros(0, dtype=numpy.int32)
+
+        # La grille des obstacles du niveau
+        self.obstacle_grid = None
+        self.grid_source = None
+
+        self.allocate(capacity)
+
+    @staticmethod
+    def is_available() -> bool:
+        """Vérifie si les balles peuvent être groupées
+
+        Returns:
+            bool: si NumPy est installé
+        """
+        return numpy is not None
+
+    def allocate(self, capacity: int):
+        """Crée les tableaux vides qui contiennent les propriétés des balles
+
+        Args:
+            capacity (int): nombre de balles pour lequel la place est réservée
+        """
+        self.count = 0
+        self.x = numpy.zeros(capacity, dtype=numpy.float64)
+        self.y = numpy.zeros(capacity, dtype=numpy.float64)
+        self.velocity = numpy.zeros(capacity, dtype=numpy.float64)
+        self.initial_x = numpy.zeros(capacity, dtype=numpy.float64)
+        self.range = numpy.zeros(capacity, dtype=numpy.float64)
+        self.damage = numpy.zeros(capacity, dtype=numpy.int32)
+        self.width = numpy.zeros(capacity, dtype=numpy.int32)
+        self.height = numpy.zeros(capacity, dtype=numpy.int32)
+        self.type_index = numpy.zeros(capacity, dtype=numpy.int32)
+        self.spawn_time = numpy.zeros(capacity, dtype=numpy.int64)
+
+    def grow(self):
+        """Double la taille des tableaux quand ils sont pleins
+        """
+        for name in ('x', 'y', 'velocity', 'initial_x', 'range', 'damage', 'width', 'height', 'type_index', 'spawn_time'):
+            array = getattr(self, name)
+            setattr(self, name, numpy.concatenate((array, numpy.zeros_like(array))))
+
+    def get_bullet_type_index(self, bullet_type: str, size_factor: float, scale: float) -> int:
+        """Renvoie l'index du type de balle et charge ses images si ce n'est pas encore fait
+
+        Args:
+            bullet_type (str): nom du type de balle
+            size_factor (float): facteur de redimensionnement de la balle
+            scale (float): nombre par lequel la taille de la texture va être multiplié
+
+        Returns:
+            int: index du type de balle
+        """
+        key = (bullet_type, size_factor, scale)
+        if key not in self.bullet_type_indexes:
+            # Une balle modèle est créée une seule fois par type pour récupérer ses images
+            model_bullet = Bullet(size_factor, scale, 0, 0, 1, bullet_type=bullet_type)
+            frames = model_bullet.animator.clips[model_bullet.ANIMATION_TYPES[0]].frames
+
+            self.bullet_types.append({
+                'frames': frames,
+                'flipped_frames': [pygame.transform.flip(frame, True, False) for frame in frames],
+                'masks': [pygame.mask.from_surface(frame) for frame in frames],
+                'size': frames[0].get_size()
+            })
+            self.bullet_type_indexes[key] = len(self.bullet_types) - 1
+            self.frame_counts = numpy.array([len(bullet['frames']) for bullet in self.bullet_types], dtype=numpy.int32)
+
+        return self.bullet_type_indexes[key]
+
+    def spawn_bullet(self, size_factor: float, scale: float, x: int, y: int, direction: int, speed: int = 10, range: int = 400, damage: int = 20, bullet_type: str = "PinkBullet"):
+        """Ajoute une balle au groupe, les paramètres sont les mêmes que pour la classe Bullet
+
+        Args:
+            size_factor (float): facteur de redimensionnement de la balle
+            scale (float): nombre par lequel la taille de la texture va être multiplié
+            x (int): position du centre de la balle sur l'axe horizontal
+            y (int): position du centre de la balle sur l'axe vertical
+            direction (int): direction dans laquelle la balle va, 1 si c'est vers la droite et -1 si c'est vers la gauche
+            speed (int, optional): vitesse de la balle. 10 par défaut.
+            range (int, optional): distance maximale que la balle peut parcourir. 400 par défaut.
+            damage (int, optional): dégâts infligés par la balle. 20 par défaut.
+            bullet_type (str, optional): nom du type de balle. "PinkBullet" par défaut.
+        """
+        type_index = self.get_bullet_type_index(bullet_type, size_factor, scale)
+        width, height = self.bullet_types[type_index]['size']
+
+        if self.count >= len(self.x):
+            self.grow()
+
+        i = self.count
+        self.x[i] = x - width // 2
+        self.y[i] = y - height // 2
+        self.velocity[i] = speed * size_factor * direction
+        self.initial_x[i] = x
+        self.range[i] = abs(range) * size_factor
+        self.damage[i] = damage
+        self.width[i] = width
+        self.height[i] = height
+        self.type_index[i] = type_index
+        self.spawn_time[i] = int(self.clock.time)
+        self.count += 1
+
+    def load_obstacle_grid(self, world):
+        """Copie la grille des obstacles du monde dans un tableau NumPy, elle n'est recréée que si le niveau change
+
+        Args:
+            world (World): monde dans lequel les balles se trouvent
+        """
+        if self.grid_source is world.tile_grid:
+            return
+
+        self.obstacle_grid = numpy.array(world.tile_grid.solid, dtype=bool).reshape(world.tile_grid.columns, world.tile_grid.rows)
+        self.grid_source = world.tile_grid
+
+    def hits_obstacles(self, left, top, right, bottom, world):
+        """Teste en une seule fois si les rectangles des balles touchent une tuile
+
+        Args:
+            left (numpy.ndarray): bord gauche des rectangles à l'écran
+            top (numpy.ndarray): bord haut des rectangles
+            right (numpy.ndarray): bord droit des rectangles à l'écran
+            bottom (numpy.ndarray): bord bas des rectangles
+            world (World): monde dans lequel les balles se trouvent
+
+        Returns:
+            numpy.ndarray: pour chaque balle, si elle touche une tuile
+        """
+        self.load_obstacle_grid(world)
+        columns, rows = self.obstacle_grid.shape
+        tile_size = world.tile_size
+
+        # Passe en coordonnées du monde pour retrouver les cases de la grille, dans le repère où les tuiles ont été placées
+        first_column = numpy.floor((left + world.tiles_scroll) / tile_size).astype(numpy.int64)
+        last_column = numpy.floor((right - 1 + world.tiles_scroll) / tile_size).astype(numpy.int64)
+        first_row = numpy.floor(top / tile_size).astype(numpy.int64)
+        last_row = numpy.floor((bottom - 1) / tile_size).astype(numpy.int64)
+
+        hit = numpy.zeros(len(left), dtype=bool)
+        # Les zones balayées par les balles sont petites, il n'y a donc que quelques cases à tester par balle
+        column_span = int((last_column - first_column).max(initial=0))
+        row_span = int((last_row - first_row).max(initial=0))
+        for column_step in range(column_span + 1):
+            column = numpy.minimum(first_column + column_step, last_column)
+            for row_step in range(row_span + 1):
+                row = numpy.minimum(first_row + row_step, last_row)
+                inside = (column >= 0) & (column < columns) & (row >= 0) & (row < rows)
+                hit[inside] |= self.obstacle_grid[column[inside], row[inside]]
+
+        return hit
+
+    def get_touched_sprites(self, sprites: list, left, top, right, bottom) -> list[tuple[int, pygame.sprite.Sprite]]:
+        """Teste les rectangles de toutes les balles contre ceux des sprites en une seule fois, puis vérifie les masques des paires trouvées
+
+        Args:
+            sprites (list): sprites à tester
+            left (numpy.ndarray): bord gauche des rectangles des balles
+            top (numpy.ndarray): bord haut des rectangles des balles
+            right (numpy.ndarray): bord droit des rectangles des balles
+            bottom (numpy.ndarray): bord bas des rectangles des balles
+
+        Returns:
+            list[tuple[int, pygame.sprite.Sprite]]: index de la balle et sprite touché
+        """
+        if not sprites:
+            return []
+
+        rects = numpy.array([tuple(sprite.rect) for sprite in sprites], dtype=numpy.float64)
+        sprites_left = rects[:, 0]
+        sprites_top = rects[:, 1]
+        sprites_right = sprites_left + rects[:, 2]
+        sprites_bottom = sprites_top + rects[:, 3]
+
+        # Matrice balles x sprites des rectangles qui se touchent
+        overlap = (left[:, None] < sprites_right[None, :]) & (right[:, None] > sprites_left[None, :]) \
+            & (top[:, None] < sprites_bottom[None, :]) & (bottom[:, None] > sprites_top[None, :])
+
+        touched = []
+        frame_indexes = self.get_frame_indexes()
+        for bullet_index, sprite_index in zip(*numpy.nonzero(overlap)):
+            sprite = sprites[sprite_index]
+            bullet_mask = self.bullet_types[self.type_index[bullet_index]]['masks'][frame_indexes[bullet_index]]
+            offset = (sprite.rect.x - int(left[bullet_index]), sprite.rect.y - int(top[bullet_index]))
+            if bullet_mask.overlap(sprite.mask, offset):
+                touched.append((int(bullet_index), sprite))
+
+        return touched
+
+    def get_frame_indexes(self):
+        """Calcule l'image de l'animation de chaque balle
+
+        Returns:
+            numpy.ndarray: index de l'image à afficher pour chaque balle
+        """
+        n = self.count
+        # Le temps de la simulation peut avancer d'un pas non entier, les index sont donc convertis en entiers
+        elapsed_frames = ((self.clock.time - self.spawn_time[:n]) // self.ANIMATION_COOLDOWN).astype(numpy.int64)
+        return elapsed_frames % self.frame_counts[self.type_index[:n]]
+
+    def update(self, world):
+        """Fait avancer toutes les balles d'une frame
+
+        Args:
+            world (World): monde dans lequel les balles se trouvent
+        """
+        if self.count == 0:
+            return
+
+        # Les balles suivent le défilement du monde
+        self.initial_x[:self.count] += world.scroll.screen_scroll
+
+        # Enlève les balles qui ont parcouru leur distance maximale
+        centers = self.x[:self.count] + self.width[:self.count] / 2
+        self.compact(numpy.abs(centers - self.initial_x[:self.count]) <= self.range[:self.count])
+
+        n = self.count
+        if n == 0:
+            return
+
+        left = self.x[:n]
+        top = self.y[:n]
+        right = left + self.width[:n]
+        bottom = top + self.height[:n]
+
+        dx = self.velocity[:n] + world.scroll.screen_scroll
+
+        # Les balles qui touchent une tuile sur toute la zone balayée pendant la frame s'arrêtent, même une balle rapide ne peut pas traverser un mur fin
+        scrolled_left = left + world.scroll.screen_scroll
+        keep = ~self.hits_obstacles(numpy.minimum(scrolled_left, left + dx), top, numpy.maximum(scrolled_left + self.width[:n], right + dx), bottom, world)
+
+        # Collisions avec les ennemis et le joueur à la position actuelle
+        for bullet_index, enemy in self.get_touched_sprites(list(world.enemy_group), left, top, right, bottom):
+            enemy.health -= int(self.damage[bullet_index])
+            keep[bullet_index] = False
+
+        if world.player is not None:
+            for bullet_index, player in self.get_touched_sprites([world.player], left, top, right, bottom):
+                player.health -= int(self.damage[bullet_index])
+                keep[bullet_index] = False
+
+        self.x[:n] += dx
+
+        self.compact(keep)
+
+    def compact(self, keep):
+        """Enlève les balles qui doivent disparaître en gardant les autres au début des tableaux
+
+        Args:
+            keep (numpy.ndarray): pour chaque balle, si elle doit être gardée
+        """
+        kept = int(keep.sum())
+        if kept == self.count:
+            return
+
+        for name in ('x', 'y', 'velocity', 'initial_x', 'range', 'damage', 'width', 'height', 'type_index', 'spawn_time'):
+            array = getattr(self, name)
+            array[:kept] = array[:self.count][keep]
+
+        self.count = kept
+
+    def draw(self, screen: pygame.Surface):
+        """Affiche toutes les balles en un seul appel
+
+        Args:
+            screen (pygame.Surface): écran sur lequel les balles vont être affichées
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        frame_indexes = self.get_frame_indexes()
+        blit_sequence = []
+        for i in range(n):
+            bullet_type = self.bullet_types[self.type_index[i]]
+            frames = bullet_type['flipped_frames'] if self.velocity[i] < 0 else bullet_type['frames']
+            blit_sequence.append((frames[frame_indexes[i]], (int(self.x[i]), int(self.y[i]))))
+
+        screen.blits(blit_sequence, False)
+
+    def empty(self):
+        """Enlève toutes les balles
+        """
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
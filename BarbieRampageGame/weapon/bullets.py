@@ -1,9 +1,13 @@
-import pygame, os
+import pygame
 
 from constants import *
+import utils
 
 # Classe pour les balles
 class Bullet(pygame.sprite.Sprite):
+    # Animations déjà chargées, partagées par toutes les balles du même type et de la même taille
+    animation_clips_cache = {}
+    
     def __init__(self, size_factor: float, scale: float, x: int, y: int, direction: int, speed: int = 10, range: int = 400, damage: int = 20, bullet_type: str = "PinkBullet"):
         """Crée une nouvelle balle
 
@@ -19,6 +23,9 @@ class Bullet(pygame.sprite.Sprite):
         """
         super().__init__()
         
+        # Horloge de la simulation, utilisée pour l'animation
+        self.clock = utils.SimulationClock.get_instance()
+        
         self.size_factor = size_factor
         
         self.direction = direction
@@ -30,11 +37,13 @@ class Bullet(pygame.sprite.Sprite):
         
         self.ANIMATION_TYPES = ["bullet_start", "bullet_end"]
         
-        self.animation = self.load_animation(self.ANIMATION_TYPES, f"{TEXTURES_ROOT}bullets/{bullet_type}", scale)
-        self.frame_index = 0
-        
-        # Valeur du temps pour l'animation de la balle
-        self.update_time = pygame.time.get_ticks()
+        key = (bullet_type, scale, self.size_factor)
+        if key not in Bullet.animation_clips_cache:
+            texture_location = f"{TEXTURES_ROOT}bullets/{bullet_type}"
+            animation_dict = self.load_animation(self.ANIMATION_TYPES, texture_location, scale)
+            # L'animation de fin reste sur sa dernière image
+            Bullet.animation_clips_cache[key] = {name: utils.Assets.create_animation_clip(frames, f"{texture_location}/{name}", name != self.ANIMATION_TYPES[1])
+                                                 for name, frames in animation_dict.items()}
         
         self.is_stopping = False
         self.continue_move = True
@@ -42,14 +51,14 @@ class Bullet(pygame.sprite.Sprite):
         self.relative_initial_x = x
     
         # Met la balle en position start
-        self.action = self.ANIMATION_TYPES[self.frame_index]
+        self.animator = utils.Animator(Bullet.animation_clips_cache[key], self.ANIMATION_TYPES[0], 50)
         # Met l'image correspondant à son action
-        self.image = self.animation[self.action][self.frame_index]
+        self.image = self.animator.image
         # Crée le rectangle de la balle
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         # Crée la hitbox de la balle
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = self.animator.mask
         
         self.width = self.image.get_width()
         self.height = self.image.get_height()
@@ -67,14 +76,14 @@ class Bullet(pygame.sprite.Sprite):
             dict[str, list[pygame.Surface]]: dictionnaire de listes de frames
         """
         animation_dict = {}
+        manifest = utils.AnimationManifest.get_instance()
         
         for animation in animation_types:
             animation_dict[animation] = []
-			# Compte le nombre d'images qu'il y a dans le dossier
-            number_of_frames = len(os.listdir(f"{texture_location}/{animation}"))
-            for i in range(number_of_frames):
+            # Le manifeste donne les images de l'animation sans parcourir son dossier
+            for frame_location in manifest.get_frame_locations(f"{texture_location}/{animation}"):
                 # Charge l'image dans la mémoire
-                img = pygame.image.load(f"{texture_location}/{animation}/{i:02}.png").convert_alpha()
+                img = pygame.image.load(frame_location).convert_alpha()
                 # Converti l'image pour qu'elle soit de la taille voulue
                 img = pygame.transform.scale(img, (int(img.get_width() * scale * self.size_factor), int(img.get_height() * scale * self.size_factor)))
                 animation_dict[animation].append(img)
@@ -118,13 +127,13 @@ class Bullet(pygame.sprite.Sprite):
         Returns:
             int: distance de déplacement sur l'axe horizontal ajustée en fonction des collisions avec les tuiles
         """
-        for tile in world.obstacle_list:
-            next_x_position = self.rect.x + dx
-            
-            # Vérifie les collisions sur l'axe horizontal
-            if tile.rect.colliderect(next_x_position, self.rect.y, self.rect.width, self.rect.height):
-                self.finish_animation()
-                dx = next_x_position - tile.rect.x
+        # La balle est d'abord replacée dans le repère des tuiles, puis son déplacement est balayé pour qu'elle ne traverse pas les murs fins
+        screen_scroll = world.scroll.screen_scroll
+        contact = world.sweep_rect(self.rect.move(screen_scroll, 0), dx - screen_scroll, 0)
+        
+        if contact.has_hit:
+            self.finish_animation()
+            dx = screen_scroll + contact.delta_x
             
         return dx
     
@@ -140,16 +149,12 @@ class Bullet(pygame.sprite.Sprite):
         # Cette méthode vérifie d'abord si la balle touche le rectangle du sprite puis si elle touche son masque pour éviter les faux positifs
         # On ne vérifie pas directement les masques car cela peut être très coûteux en ressources
         
-        # Vérifie si la balle touche le rectangle de l'ennemi
-        possibly_collided_enemies_list = pygame.sprite.spritecollide(self, world.enemy_group, False)
+        # Vérifie si la balle touche le rectangle d'un ennemi proche, la grille de hachage spatial du monde évite de tester tous les ennemis
+        possibly_collided_enemies_list = world.get_enemies_near(self.rect)
         
         # Si la balle touche le rectangle ennemi, on vérifie si elle touche le masque de l'ennemi
-        if possibly_collided_enemies_list:
-            possibly_collided_enemies_group = pygame.sprite.Group(possibly_collided_enemies_list)
-            
-            touched_enemies = pygame.sprite.spritecollide(self, possibly_collided_enemies_group, False, pygame.sprite.collide_mask)
-        
-            for enemy in touched_enemies:
+        for enemy in possibly_collided_enemies_list:
+            if pygame.sprite.collide_mask(self, enemy):
                 enemy.health -= self.damage
                 self.finish_animation()
                 dx = 0
@@ -166,9 +171,8 @@ class Bullet(pygame.sprite.Sprite):
     def finish_animation(self):
         """Met la balle en position end
         """
-        #self.action = self.ANIMATION_TYPES[1]
-        #self.frame_index = 0
-        #self.image = self.animation[self.action][self.frame_index]
+        #self.animator.play(self.ANIMATION_TYPES[1])
+        #self.image = self.animator.image
         #self.is_stopping = True
         self.continue_move = False
     
@@ -193,24 +197,13 @@ class Bullet(pygame.sprite.Sprite):
             self.move(world)
     
     def update_animation(self):
-        """Met à jour l'animation de la balle en fonction du temps
+        """Met à jour l'image de la balle, l'animation est avancée par le système d'animation
         """
-        ANIMATION_COOLDOWN = 50
-        # Met à jour l'image en fonction de la frame actuelle
-        self.image = self.animation[self.action][self.frame_index]
-        
-        # Vérifie si assez de temps est passé depuis la dernière mise à jour
-        if pygame.time.get_ticks() - self.update_time > ANIMATION_COOLDOWN:
-            self.update_time = pygame.time.get_ticks()
-            self.frame_index += 1
-
-	    # Si l'animation est terminée, remise de la première image
-        if self.frame_index >= len(self.animation[self.action]):
-            if self.action == self.ANIMATION_TYPES[1]:
-                self.frame_index = len(self.animation[self.action]) - 1
-                self.continue_move = False
-            else:
-                self.frame_index = 0
+        self.image = self.animator.image
+        
+        # La balle s'arrête quand son animation de fin est terminée
+        if (self.animator.clip_name == self.ANIMATION_TYPES[1]) and self.animator.is_finished:
+            self.continue_move = False
     
     def draw(self, screen: pygame.Surface):
         """Affiche la balle
@@ -0,0 +1,45 @@
+from .weapons import Weapon, Arb4rb13, GunP450, GunP90
+import utils
+
+# Armes qui peuvent être trouvées dans les caisses d'armes
+CRATE_WEAPONS = [Arb4rb13, GunP450, GunP90]
+
+# Classe qui garde un modèle de chaque arme pour en créer de nouvelles sans recharger leurs textures
+class WeaponRegistry():
+    def __init__(self):
+        """Crée un registre d'armes vide
+        """
+        # Dictionnaire qui associe une classe d'arme à son modèle déjà chargé
+        self.prefabs = {}
+        self.tile_size = None
+        self.scale = None
+    
+    def preload(self, assets: utils.Assets, tile_size: int, scale: float = 1, weapon_classes: list[type] = CRATE_WEAPONS):
+        """Charge les modèles des armes, leur texture, leur texture retournée, les positions du canon et de la poignée et leurs sons.
+        Les modèles déjà chargés à la même taille sont gardés
+
+        Args:
+            assets (utils.Assets): classe des assets
+            tile_size (int): taille des tuiles
+            scale (float, optional): facteur de redimensionnement. 1 par défaut
+            weapon_classes (list[type], optional): classes des armes à charger. CRATE_WEAPONS par défaut
+        """
+        if (tile_size != self.tile_size) or (scale != self.scale):
+            self.prefabs = {}
+            self.tile_size = tile_size
+            self.scale = scale
+        
+        for weapon_class in weapon_classes:
+            if weapon_class not in self.prefabs:
+                self.prefabs[weapon_class] = weapon_class(assets, tile_size, scale)
+    
+    def create(self, weapon_class: type) -> Weapon:
+        """Crée une arme à partir de son modèle, sans charger d'image
+
+        Args:
+            weapon_class (type): classe de l'arme, elle doit avoir été chargée avec preload
+
+        Returns:
+            Weapon: nouvelle arme
+        """
+        return self.prefabs[weapon_class].copy()
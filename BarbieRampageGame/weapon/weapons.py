@@ -1,9 +1,10 @@
 #Création des différentes armes du jeu
 
-import pygame
+import pygame, copy
 import abc as abstract
 
 from .bullets import Bullet 
+from .bullet_batch import BulletBatch
 from constants import *
 import utils
 
@@ -23,7 +24,9 @@ class Weapon(abstract.ABC):
             y (int): position sur l'axe vertical
         """
         self.size_factor = tile_size * SPRITE_SCALING
-        self.last_shoot_time = pygame.time.get_ticks()
+        # Horloge de la simulation, utilisée pour les délais entre les tirs
+        self.clock = utils.SimulationClock.get_instance()
+        self.last_shoot_time = self.clock.time
         self.shoot_cooldown = shoot_cooldown
         
         self.bullets_consuming = 1
@@ -33,14 +36,17 @@ class Weapon(abstract.ABC):
         self.is_grab = False
         self.flip = False
         self.weapon_texture = self.init_texture(weapon_name, texture_path, assets, scale)
+        # La texture retournée est gardée pour ne pas la recréer à chaque affichage
+        self.flipped_weapon_texture = pygame.transform.flip(self.weapon_texture, True, False)
         self.rect = self.weapon_texture.get_rect()
         
         self.shoot_position_right, self.shoot_position_left = self.get_shoot_coordinates()
         
         self.handle_position_right, self.handle_position_left = self.get_handle_position()
         
-        self.shoot_sound = assets.blaster_sound
-        self.empy_sound = assets.weapon_cross_sound
+        self.sound_manager = assets.sound_manager
+        self.shoot_sound = "blaster"
+        self.empy_sound = "weapon_cross"
     
     @abstract.abstractmethod
     def get_shoot_coordinates(self) -> tuple[tuple[int, int], tuple[int, int]]:
@@ -95,7 +101,21 @@ class Weapon(abstract.ABC):
         Args:
             screen (pygame.Surface): écran
         """
-        screen.blit(pygame.transform.flip(self.weapon_texture, self.flip, False), self.rect) 
+        screen.blit(self.flipped_weapon_texture if self.flip else self.weapon_texture, self.rect)
+    
+    def copy(self):
+        """Crée une nouvelle arme du même type qui partage les textures, les positions et les sons de celle-ci
+
+        Returns:
+            Weapon: nouvelle arme, prête à être tenue
+        """
+        new_weapon = copy.copy(self)
+        new_weapon.rect = self.rect.copy()
+        new_weapon.last_shoot_time = self.clock.time
+        new_weapon.is_grab = False
+        new_weapon.flip = False
+        
+        return new_weapon
     
     def shoot(self, direction: int, bullet_group: pygame.sprite.Group) -> int:
         """Tire une munition
@@ -107,10 +127,10 @@ class Weapon(abstract.ABC):
         Returns:
             int: nombre de munitions consommées
         """
-        if (pygame.time.get_ticks() - self.last_shoot_time) < self.shoot_cooldown:
+        if (self.clock.time - self.last_shoot_time) < self.shoot_cooldown:
             return 0
         
-        self.last_shoot_time = pygame.time.get_ticks()
+        self.last_shoot_time = self.clock.time
         self.send_bullet(direction, bullet_group)
         
         return self.bullets_consuming
@@ -118,25 +138,33 @@ class Weapon(abstract.ABC):
     def play_empty_sound(self):
         """Joue le son de l'arme vide
         """
-        self.empy_sound.play()
+        self.sound_manager.play(self.empy_sound, self.rect.centerx)
 
     def update(self):
         """Met à jour l'arme
         """
     
+    def drop(self):
+        """Arrête les évènements programmés par l'arme quand elle n'est plus tenue
+        """
+    
     def send_bullet(self, direction: int, bullet_group: pygame.sprite.Group):
         """Envoie une balle
 
         Args:
             direction (int): direction dans laquelle la balle va, 1 si c'est vers la droite et -1 si c'est vers la gauche
-            bullet_group (pygame.sprite.Group): groupe dans lequel la balle va être ajoutée
+            bullet_group (pygame.sprite.Group or BulletBatch): groupe dans lequel la balle va être ajoutée
         """
         relative_shoot_position = self.shoot_position_right if direction == 1 else self.shoot_position_left
         absolute_shoot_position = (self.rect.x + relative_shoot_position[0], self.rect.y + relative_shoot_position[1])
         
-        bullet = Bullet(self.size_factor, 1, absolute_shoot_position[0], absolute_shoot_position[1], direction, bullet_type=self.bullet_type)
-        self.shoot_sound.play()
-        bullet_group.add(bullet)
+        if isinstance(bullet_group, BulletBatch):
+            # Les balles groupées sont simulées ensemble, aucun sprite n'est créé
+            bullet_group.spawn_bullet(self.size_factor, 1, absolute_shoot_position[0], absolute_shoot_position[1], direction, bullet_type=self.bullet_type)
+        else:
+            bullet = Bullet(self.size_factor, 1, absolute_shoot_position[0], absolute_shoot_position[1], direction, bullet_type=self.bullet_type)
+            bullet_group.add(bullet)
+        self.sound_manager.play(self.shoot_sound, absolute_shoot_position[0])
         self.bullet_group = bullet_group
 
 class Arb4rb13(Weapon):
@@ -153,19 +181,44 @@ class Arb4rb13(Weapon):
         super().__init__("AR-B4RB13", WEAPONS_TEXTURES_LOCATION + "AR_B4RB13.png", assets, tile_size, scale, 400)
         self.bullets_consuming = 2
         
-        self.last_burst_shot = pygame.time.get_ticks()
+        # Temps entre deux tirs d'une rafale en millisecondes
+        self.BURST_DELAY = 100
         self.burst_current_shoot = 0
+        # Prochain tir de la rafale programmé sur l'horloge de la simulation
+        self.burst_timer = None
     
-    def update(self):
-        """Met à jour l'arme
+    def copy(self):
+        """Crée une nouvelle arme du même type qui partage les textures, les positions et les sons de celle-ci
+
+        Returns:
+            Arb4rb13: nouvelle arme, prête à être tenue
         """
-        if (self.burst_current_shoot > 0) and ((pygame.time.get_ticks() - self.last_burst_shot) > 100):
-            
-            direction = -1 if self.flip else 1
-            
-            self.send_bullet(direction, self.bullet_group)
-            self.burst_current_shoot -= 1
-            self.last_burst_shot = pygame.time.get_ticks()
+        new_weapon = super().copy()
+        new_weapon.burst_current_shoot = 0
+        new_weapon.burst_timer = None
+        
+        return new_weapon
+    
+    def drop(self):
+        """Arrête la rafale en cours quand l'arme n'est plus tenue
+        """
+        if self.burst_timer is not None:
+            self.burst_timer.cancel()
+            self.burst_timer = None
+        self.burst_current_shoot = 0
+    
+    def send_burst_shot(self):
+        """Tire la balle suivante de la rafale et programme la suivante, cette méthode est appelée par l'horloge de la simulation
+        """
+        direction = -1 if self.flip else 1
+        
+        self.send_bullet(direction, self.bullet_group)
+        self.burst_current_shoot -= 1
+        
+        if self.burst_current_shoot > 0:
+            self.burst_timer = self.clock.call_later(self.BURST_DELAY, self.send_burst_shot)
+        else:
+            self.burst_timer = None
     
     def shoot(self, direction: int, bullet_group: pygame.sprite.Group) -> int:
         """Tire une munition
@@ -177,13 +230,17 @@ class Arb4rb13(Weapon):
         Returns:
             int: nombre de munitions consommées
         """
-        if (pygame.time.get_ticks() - self.last_shoot_time) < self.shoot_cooldown:
+        if (self.clock.time - self.last_shoot_time) < self.shoot_cooldown:
             return 0
         
-        self.last_shoot_time = pygame.time.get_ticks()
-        self.burst_current_shoot = 3
+        self.last_shoot_time = self.clock.time
         self.send_bullet(direction, bullet_group)
         
+        # Les trois autres balles de la rafale sont tirées par l'horloge de la simulation
+        self.drop()
+        self.burst_current_shoot = 3
+        self.burst_timer = self.clock.call_later(self.BURST_DELAY, self.send_burst_shot)
+        
         return self.bullets_consuming
     
     def get_shoot_coordinates(self) -> tuple[tuple[int, int], tuple[int, int]]:
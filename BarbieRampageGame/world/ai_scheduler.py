@@ -0,0 +1,64 @@
+import time
+
+# Classe qui répartit la réflexion des ennemis sur plusieurs frames
+class AIScheduler():
+    def __init__(self, frame_budget: float, frame_think_count: int):
+        """Initialise l'ordonnanceur de l'intelligence des ennemis
+
+        Args:
+            frame_budget (float): temps maximal en secondes passé à faire réfléchir les ennemis à chaque frame
+            frame_think_count (int): nombre d'ennemis qui réfléchissent à chaque frame quand la réflexion doit être reproductible
+        """
+        self.frame_budget = frame_budget
+        self.frame_think_count = frame_think_count
+        # Index du prochain ennemi qui va réfléchir
+        self.next_index = 0
+
+    def think(self, enemies: list, world, is_deterministic: bool = False):
+        """Fait réfléchir les ennemis chacun leur tour jusqu'à ce que le temps de la frame soit écoulé.
+        Au moins un ennemi réfléchit à chaque frame et aucun ne réfléchit deux fois dans la même frame
+
+        Args:
+            enemies (list): ennemis du monde
+            world (World): monde dans lequel les ennemis se trouvent
+            is_deterministic (bool, optional): si un nombre fixe d'ennemis réfléchit au lieu de dépendre du temps écoulé,
+                pour qu'une rediffusion refasse les mêmes tirages aléatoires. False par défaut
+        """
+        enemies_count = len(enemies)
+        if enemies_count == 0:
+            return
+
+        start_time = time.perf_counter()
+        self.next_index %= enemies_count
+
+        for thought_count in range(1, enemies_count + 1):
+            enemy = enemies[self.next_index]
+            self.next_index = (self.next_index + 1) % enemies_count
+
+            if enemy.is_alive:
+                enemy.think(world)
+
+            if is_deterministic:
+                if thought_count >= self.frame_think_count:
+                    break
+            elif (time.perf_counter() - start_time) >= self.frame_budget:
+                break
+
+    def update(self, enemies: list, world, is_deterministic: bool = False):
+        """Fait réfléchir une partie des ennemis puis fait agir tous les ennemis
+
+        Args:
+            enemies (list): ennemis du monde
+            world (World): monde dans lequel les ennemis se trouvent
+            is_deterministic (bool, optional): si un nombre fixe d'ennemis réfléchit au lieu de dépendre du temps écoulé. False par défaut
+        """
+        self.think(enemies, world, is_deterministic)
+
+        # Les déplacements sont peu coûteux, ils sont faits à chaque frame pour que les ennemis restent fluides
+        for enemy in enemies:
+            enemy.act(world)
+
+    def reset(self):
+        """Recommence la réflexion depuis le premier ennemi, par exemple au chargement d'un niveau
+        """
+        self.next_index = 0
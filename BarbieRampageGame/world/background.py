@@ -0,0 +1,108 @@
+import pygame
+
+from _common import ColorValue
+
+# Classe qui représente une couche de l'arrière-plan
+class ParallaxLayer():
+    def __init__(self, image: pygame.Surface, screen_width: int, screen_height: int, scroll_factor: float, fill_color: ColorValue = None):
+        """Crée une couche de l'arrière-plan en pré-assemblant l'image dans une bande qui boucle sur elle-même
+
+        Args:
+            image (pygame.Surface): image de la couche
+            screen_width (int): largeur de l'écran
+            screen_height (int): hauteur de l'écran
+            scroll_factor (float): vitesse de défilement de la couche par rapport au défilement du monde
+            fill_color (ColorValue, optional): couleur sur laquelle l'image est collée, la bande devient alors opaque et fait toute la hauteur de l'écran. None par défaut
+        """
+        self.scroll_factor = scroll_factor
+        self.screen_width = screen_width
+
+        self.strip = self.build_strip(image, screen_width, screen_height, fill_color)
+        self.strip_width = self.strip.get_width()
+        self.strip_height = self.strip.get_height()
+
+    def build_strip(self, image: pygame.Surface, screen_width: int, screen_height: int, fill_color: ColorValue = None) -> pygame.Surface:
+        """Crée la bande qui contient l'image répétée assez de fois pour couvrir tout l'écran
+
+        Args:
+            image (pygame.Surface): image à répéter
+            screen_width (int): largeur de l'écran
+            screen_height (int): hauteur de l'écran
+            fill_color (ColorValue, optional): couleur de fond de la bande. None par défaut
+
+        Returns:
+            pygame.Surface: bande qui boucle sur elle-même
+        """
+        image_width = image.get_width()
+        # Nombre d'images nécessaires pour que la bande soit au moins aussi large que l'écran
+        repetitions = max(1, -(-screen_width // image_width))
+
+        if fill_color is None:
+            strip = pygame.Surface((image_width * repetitions, image.get_height()), pygame.SRCALPHA)
+        else:
+            strip = pygame.Surface((image_width * repetitions, max(screen_height, image.get_height())))
+            strip.fill(fill_color)
+
+        for i in range(repetitions):
+            strip.blit(image, (i * image_width, 0))
+
+        # Converti la bande dans le format de l'écran pour que l'affichage soit plus rapide
+        if fill_color is None:
+            return strip.convert_alpha()
+        return strip.convert()
+
+    def draw(self, screen: pygame.Surface, bg_scroll: float):
+        """Affiche la couche, au maximum deux morceaux de la bande sont affichés
+
+        Args:
+            screen (pygame.Surface): écran sur lequel la couche doit être affichée
+            bg_scroll (float): défilement global du monde
+        """
+        offset = int(bg_scroll * self.scroll_factor) % self.strip_width
+
+        # Morceau qui va du décalage jusqu'à la fin de la bande
+        first_width = min(self.strip_width - offset, self.screen_width)
+        screen.blit(self.strip, (0, 0), (offset, 0, first_width, self.strip_height))
+
+        # Si la fin de la bande est atteinte, on recommence depuis son début
+        if first_width < self.screen_width:
+            screen.blit(self.strip, (first_width, 0), (0, 0, self.screen_width - first_width, self.strip_height))
+
+# Classe qui gère l'arrière-plan composé de plusieurs couches
+class ParallaxBackground():
+    def __init__(self, fill_color: ColorValue):
+        """Initialise l'arrière-plan
+
+        Args:
+            fill_color (ColorValue): couleur affichée derrière toutes les couches
+        """
+        self.fill_color = fill_color
+        self.layers = []
+
+    def load_layers(self, images: list[pygame.Surface], scroll_factors: list[float], screen_width: int, screen_height: int):
+        """Crée les couches de l'arrière-plan, cette méthode doit être appelée une fois par niveau
+
+        Args:
+            images (list[pygame.Surface]): images des couches, de la plus éloignée à la plus proche
+            scroll_factors (list[float]): vitesse de défilement de chaque couche
+            screen_width (int): largeur de l'écran
+            screen_height (int): hauteur de l'écran
+        """
+        self.layers = []
+        for i, image in enumerate(images):
+            # La couche la plus éloignée est collée sur la couleur de fond pour ne pas avoir à remplir l'écran à chaque frame
+            fill_color = self.fill_color if i == 0 else None
+            self.layers.append(ParallaxLayer(image, screen_width, screen_height, scroll_factors[i], fill_color))
+
+    def draw(self, screen: pygame.Surface, bg_scroll: float):
+        """Affiche toutes les couches de l'arrière-plan
+
+        Args:
+            screen (pygame.Surface): écran sur lequel l'arrière-plan doit être affiché
+            bg_scroll (float): défilement global du monde
+        """
+        if not self.layers or self.layers[0].strip_height < screen.get_height():
+            screen.fill(self.fill_color)
+
+        for layer in self.layers:
+            layer.draw(screen, bg_scroll)
@@ -0,0 +1,252 @@
+import pygame
+
+from constants import *
+
+# Classe qui contient le résultat d'un déplacement testé contre les tuiles
+class SweepResult():
+    def __init__(self, delta_x: float, delta_y: float, time_x: float = 1, time_y: float = 1, normal_x: int = 0, normal_y: int = 0):
+        """Crée le résultat d'un déplacement balayé
+
+        Args:
+            delta_x (float): déplacement autorisé sur l'axe horizontal
+            delta_y (float): déplacement autorisé sur l'axe vertical
+            time_x (float, optional): moment du contact sur l'axe horizontal entre 0 et 1, 1 s'il n'y a pas de contact. 1 par défaut
+            time_y (float, optional): moment du contact sur l'axe vertical entre 0 et 1, 1 s'il n'y a pas de contact. 1 par défaut
+            normal_x (int, optional): normale du contact horizontal, -1 pour un mur à droite et 1 pour un mur à gauche. 0 par défaut
+            normal_y (int, optional): normale du contact vertical, -1 pour le sol et 1 pour un plafond. 0 par défaut
+        """
+        self.delta_x = delta_x
+        self.delta_y = delta_y
+        self.time_x = time_x
+        self.time_y = time_y
+        self.normal_x = normal_x
+        self.normal_y = normal_y
+
+    @property
+    def time(self) -> float:
+        """Moment du premier contact entre 0 et 1, 1 s'il n'y a pas eu de contact"""
+        return min(self.time_x, self.time_y)
+
+    @property
+    def normal(self) -> tuple[int, int]:
+        """Normale du premier contact, (0, 0) s'il n'y a pas eu de contact"""
+        if self.time_x <= self.time_y:
+            return self.normal_x, 0
+        return 0, self.normal_y
+
+    @property
+    def has_hit(self) -> bool:
+        """Si le déplacement a été arrêté par une tuile"""
+        return (self.normal_x != 0) or (self.normal_y != 0)
+
+# Classe qui représente les obstacles du niveau sous forme de grille
+class TileGrid():
+    def __init__(self, world_data: list[list[str]], tile_size: int):
+        """Crée la grille des obstacles à partir des données du niveau
+
+        Args:
+            world_data (list[list[str]]): types des tuiles, rangés par colonne puis par ligne
+            tile_size (int): taille des tuiles en pixel
+        """
+        self.tile_size = tile_size
+        self.columns = len(world_data)
+        self.rows = len(world_data[0]) if world_data else 0
+
+        # Grille qui indique pour chaque case si c'est un obstacle
+        self.solid = [[tile in OBSTACLES_TILE_TYPES for tile in column] for column in world_data]
+
+    def is_solid(self, column: int, row: int) -> bool:
+        """Vérifie si une case est un obstacle, les cases en dehors du niveau sont vides
+
+        Args:
+            column (int): colonne de la case
+            row (int): ligne de la case
+
+        Returns:
+            bool: si la case est un obstacle
+        """
+        return (0 <= column < self.columns) and (0 <= row < self.rows) and self.solid[column][row]
+
+    def get_tile_x(self, column: int, x_offset: float) -> int:
+        """Renvoie la position à l'écran du bord gauche d'une colonne, arrondie comme celle des tuiles affichées
+
+        Args:
+            column (int): colonne
+            x_offset (float): défilement utilisé pour placer les tuiles
+
+        Returns:
+            int: position du bord gauche de la colonne à l'écran
+        """
+        return round(column * self.tile_size - x_offset)
+
+    def get_columns(self, left: float, right: float, x_offset: float) -> range:
+        """Renvoie les colonnes qui peuvent toucher l'intervalle donné, avec une colonne de marge de chaque côté pour les arrondis
+
+        Args:
+            left (float): bord gauche à l'écran
+            right (float): bord droit à l'écran
+            x_offset (float): défilement utilisé pour placer les tuiles
+
+        Returns:
+            range: colonnes à tester
+        """
+        return range(int((left + x_offset) // self.tile_size) - 1, int((right + x_offset) // self.tile_size) + 2)
+
+    def get_rows(self, top: float, bottom: float) -> range:
+        """Renvoie les lignes couvertes par l'intervalle donné
+
+        Args:
+            top (float): bord haut
+            bottom (float): bord bas (exclu)
+
+        Returns:
+            range: lignes à tester
+        """
+        return range(int(top // self.tile_size), int((bottom - 1) // self.tile_size) + 1)
+
+    def get_overlapping_columns(self, left: float, right: float, x_offset: float) -> list[int]:
+        """Renvoie les colonnes qui touchent réellement l'intervalle donné, en utilisant la position arrondie des tuiles
+
+        Args:
+            left (float): bord gauche à l'écran
+            right (float): bord droit à l'écran (exclu)
+            x_offset (float): défilement utilisé pour placer les tuiles
+
+        Returns:
+            list[int]: colonnes qui touchent l'intervalle
+        """
+        return [column for column in self.get_columns(left, right, x_offset)
+                if self.get_tile_x(column, x_offset) < right and self.get_tile_x(column, x_offset) + self.tile_size > left]
+
+    def column_is_blocking(self, column: int, rows: range) -> bool:
+        """Vérifie si une colonne contient un obstacle sur les lignes données
+
+        Args:
+            column (int): colonne à tester
+            rows (range): lignes à tester
+
+        Returns:
+            bool: si un obstacle se trouve dans la colonne
+        """
+        for row in rows:
+            if self.is_solid(column, row):
+                return True
+        return False
+
+    def is_line_clear(self, start_cell: tuple[int, int], end_cell: tuple[int, int]) -> bool:
+        """Vérifie qu'aucun obstacle ne coupe la ligne entre les centres de deux cases, en parcourant les cases traversées une par une (DDA)
+
+        Args:
+            start_cell (tuple[int, int]): case de départ
+            end_cell (tuple[int, int]): case d'arrivée
+
+        Returns:
+            bool: si la ligne ne traverse aucun obstacle, les cases de départ et d'arrivée ne sont pas testées
+        """
+        column, row = start_cell
+        end_column, end_row = end_cell
+        delta_column = end_column - column
+        delta_row = end_row - row
+
+        step_column = 1 if delta_column > 0 else -1
+        step_row = 1 if delta_row > 0 else -1
+
+        # Moment où la ligne passe la prochaine frontière de chaque axe, la ligne va de 0 à 1
+        time_delta_column = 1 / abs(delta_column) if delta_column != 0 else float('inf')
+        time_delta_row = 1 / abs(delta_row) if delta_row != 0 else float('inf')
+        time_column = time_delta_column / 2
+        time_row = time_delta_row / 2
+
+        for _ in range(abs(delta_column) + abs(delta_row)):
+            # Quand la ligne passe exactement par un coin, les deux cases voisines sont testées
+            if time_column <= time_row:
+                column += step_column
+                time_column += time_delta_column
+            else:
+                row += step_row
+                time_row += time_delta_row
+
+            if (column, row) != (end_column, end_row) and self.is_solid(column, row):
+                return False
+
+        return True
+
+    def sweep_x(self, rect: pygame.Rect, delta_x: float, x_offset: float) -> tuple[float, float, int]:
+        """Déplace un rectangle sur l'axe horizontal jusqu'à la première tuile rencontrée
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran
+            delta_x (float): déplacement voulu
+            x_offset (float): défilement utilisé pour placer les tuiles
+
+        Returns:
+            tuple[float, float, int]: déplacement autorisé, moment du contact et normale du contact
+        """
+        if delta_x == 0:
+            return delta_x, 1, 0
+
+        rows = self.get_rows(rect.top, rect.bottom)
+
+        if delta_x > 0:
+            # Les colonnes sont parcourues de la plus proche à la plus éloignée
+            for column in self.get_columns(rect.right, rect.right + delta_x, x_offset):
+                tile_x = self.get_tile_x(column, x_offset)
+                distance = tile_x - rect.right
+                # Les tuiles déjà traversées par le rectangle sont ignorées pour qu'il puisse en sortir
+                if 0 <= distance < delta_x and self.column_is_blocking(column, rows):
+                    return distance, distance / delta_x, -1
+        else:
+            for column in reversed(self.get_columns(rect.left + delta_x, rect.left, x_offset)):
+                tile_right = self.get_tile_x(column, x_offset) + self.tile_size
+                distance = tile_right - rect.left
+                if delta_x < distance <= 0 and self.column_is_blocking(column, rows):
+                    return distance, distance / delta_x, 1
+
+        return delta_x, 1, 0
+
+    def sweep_y(self, rect: pygame.Rect, delta_y: float, x_offset: float) -> tuple[float, float, int]:
+        """Déplace un rectangle sur l'axe vertical jusqu'à la première tuile rencontrée
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran
+            delta_y (float): déplacement voulu
+            x_offset (float): défilement utilisé pour placer les tuiles
+
+        Returns:
+            tuple[float, float, int]: déplacement autorisé, moment du contact et normale du contact
+        """
+        if delta_y == 0:
+            return delta_y, 1, 0
+
+        columns = self.get_overlapping_columns(rect.left, rect.right, x_offset)
+
+        if delta_y > 0:
+            for row in self.get_rows(rect.bottom, rect.bottom + delta_y + 1):
+                distance = row * self.tile_size - rect.bottom
+                if 0 <= distance < delta_y and any(self.is_solid(column, row) for column in columns):
+                    return distance, distance / delta_y, -1
+        else:
+            for row in reversed(self.get_rows(rect.top + delta_y, rect.top)):
+                distance = (row + 1) * self.tile_size - rect.top
+                if delta_y < distance <= 0 and any(self.is_solid(column, row) for column in columns):
+                    return distance, distance / delta_y, 1
+
+        return delta_y, 1, 0
+
+    def sweep(self, rect: pygame.Rect, delta_x: float, delta_y: float, x_offset: float) -> SweepResult:
+        """Déplace un rectangle contre les tuiles, d'abord sur l'axe horizontal puis sur l'axe vertical.
+        Toutes les cases traversées sont testées, un déplacement rapide ne peut donc pas passer à travers une plateforme fine
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran
+            delta_x (float): déplacement voulu sur l'axe horizontal
+            delta_y (float): déplacement voulu sur l'axe vertical
+            x_offset (float): défilement utilisé pour placer les tuiles
+
+        Returns:
+            SweepResult: déplacement autorisé, moments et normales des contacts
+        """
+        delta_x, time_x, normal_x = self.sweep_x(rect, delta_x, x_offset)
+        delta_y, time_y, normal_y = self.sweep_y(rect.move(round(delta_x), 0), delta_y, x_offset)
+
+        return SweepResult(delta_x, delta_y, time_x, time_y, normal_x, normal_y)
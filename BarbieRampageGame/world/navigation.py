@@ -0,0 +1,226 @@
+import heapq
+
+from .walkability import WalkabilityMap
+
+# Classe qui représente une plateforme sur laquelle on peut marcher d'un bout à l'autre
+class PlatformSegment():
+    def __init__(self, index: int, row: int, first_column: int, last_column: int):
+        """Crée une plateforme du graphe de navigation
+
+        Args:
+            index (int): index de la plateforme dans le graphe
+            row (int): ligne du sol de la plateforme
+            first_column (int): première colonne de la plateforme
+            last_column (int): dernière colonne de la plateforme, incluse
+        """
+        self.index = index
+        self.row = row
+        self.first_column = first_column
+        self.last_column = last_column
+        self.links = []
+
+# Classe qui représente un saut ou une chute d'une plateforme à une autre
+class NavigationLink():
+    def __init__(self, kind: str, from_segment: int, from_column: int, to_segment: int, to_column: int, cost: float):
+        """Crée un lien entre deux plateformes
+
+        Args:
+            kind (str): type du lien, "jump" pour un saut et "fall" pour une chute
+            from_segment (int): index de la plateforme de départ
+            from_column (int): colonne d'où il faut partir
+            to_segment (int): index de la plateforme d'arrivée
+            to_column (int): colonne où l'on arrive
+            cost (float): coût du lien, en plus de la distance marchée pour l'atteindre
+        """
+        self.kind = kind
+        self.from_segment = from_segment
+        self.from_column = from_column
+        self.to_segment = to_segment
+        self.to_column = to_column
+        self.cost = cost
+        # Direction dans laquelle il faut aller pour prendre le lien
+        self.direction = 1 if to_column >= from_column else -1
+
+# Classe qui permet aux ennemis de trouver un chemin d'une plateforme à une autre
+class NavigationGraph():
+    def __init__(self, walkability: WalkabilityMap, max_jump_rows: int, max_jump_columns: int, max_fall_rows: int, cache_size: int = 256):
+        """Construit le graphe des plateformes du niveau et des sauts et chutes possibles entre elles
+
+        Args:
+            walkability (WalkabilityMap): sols et murs précalculés du niveau
+            max_jump_rows (int): nombre de lignes qu'un saut permet de monter
+            max_jump_columns (int): nombre de colonnes de vide qu'un saut permet de franchir
+            max_fall_rows (int): nombre de lignes dont on peut tomber
+            cache_size (int, optional): nombre de chemins gardés en mémoire. 256 par défaut
+        """
+        self.walkability = walkability
+        self.max_jump_rows = max_jump_rows
+        self.max_jump_columns = max_jump_columns
+        self.max_fall_rows = max_fall_rows
+
+        self.segments = []
+        # Dictionnaire qui associe une case de sol à sa plateforme
+        self.cell_segments = {}
+
+        # Chemins déjà calculés, rangés par case de départ et d'arrivée
+        self.cache_size = cache_size
+        self.path_cache = {}
+
+        self.build_segments()
+        self.build_links()
+
+    def build_segments(self):
+        """Découpe les sols du niveau en plateformes continues
+        """
+        for row in range(self.walkability.rows):
+            segment = None
+            for column in range(self.walkability.columns):
+                if not self.walkability.is_surface(column, row):
+                    segment = None
+                    continue
+
+                if segment is None:
+                    segment = PlatformSegment(len(self.segments), row, column, column)
+                    self.segments.append(segment)
+                else:
+                    segment.last_column = column
+
+                self.cell_segments[(column, row)] = segment
+
+    def build_links(self):
+        """Ajoute les chutes depuis les bords des plateformes et les sauts entre les plateformes assez proches
+        """
+        for segment in self.segments:
+            # Chutes depuis les deux bords de la plateforme
+            for direction, edge_column in ((-1, segment.first_column), (1, segment.last_column)):
+                next_column = edge_column + direction
+                if self.walkability.tile_grid.is_solid(next_column, segment.row):
+                    continue
+
+                ground_row = self.walkability.get_ground_row(next_column, segment.row)
+                if (ground_row is None) or (ground_row - segment.row > self.max_fall_rows):
+                    continue
+
+                target = self.cell_segments[(next_column, ground_row)]
+                segment.links.append(NavigationLink("fall", segment.index, edge_column, target.index, next_column, 1 + (ground_row - segment.row) / 2))
+
+            # Sauts vers les plateformes voisines
+            for target in self.segments:
+                if (target is segment) or (target.row < segment.row - self.max_jump_rows) or (target.row > segment.row + self.max_fall_rows):
+                    continue
+
+                if target.first_column > segment.last_column:
+                    gap = target.first_column - segment.last_column - 1
+                    from_column, to_column = segment.last_column, target.first_column
+                elif target.last_column < segment.first_column:
+                    gap = segment.first_column - target.last_column - 1
+                    from_column, to_column = segment.first_column, target.last_column
+                else:
+                    # Les plateformes l'une au-dessus de l'autre ne sont reliées que par les chutes
+                    continue
+
+                if gap <= self.max_jump_columns:
+                    segment.links.append(NavigationLink("jump", segment.index, from_column, target.index, to_column, 2 + gap + abs(target.row - segment.row)))
+
+    def get_segment(self, column: int, row: int) -> PlatformSegment:
+        """Renvoie la plateforme d'une case de sol
+
+        Args:
+            column (int): colonne de la case
+            row (int): ligne de la case
+
+        Returns:
+            PlatformSegment: plateforme de la case, None si la case n'est pas un sol
+        """
+        return self.cell_segments.get((column, row))
+
+    def find_path(self, start_cell: tuple[int, int], goal_cell: tuple[int, int]) -> list[NavigationLink]:
+        """Renvoie les sauts et chutes à faire pour aller d'une case de sol à une autre, le résultat est gardé en mémoire
+
+        Args:
+            start_cell (tuple[int, int]): case de sol de départ
+            goal_cell (tuple[int, int]): case de sol d'arrivée
+
+        Returns:
+            list[NavigationLink]: liens à suivre dans l'ordre, vide si les deux cases sont sur la même plateforme et None s'il n'y a pas de chemin
+        """
+        key = (start_cell, goal_cell)
+        if key in self.path_cache:
+            return self.path_cache[key]
+
+        path = self.search_path(start_cell, goal_cell)
+
+        if len(self.path_cache) >= self.cache_size:
+            self.path_cache.clear()
+        self.path_cache[key] = path
+
+        return path
+
+    def search_path(self, start_cell: tuple[int, int], goal_cell: tuple[int, int]) -> list[NavigationLink]:
+        """Cherche le chemin le plus court entre deux cases de sol avec l'algorithme A*
+
+        Args:
+            start_cell (tuple[int, int]): case de sol de départ
+            goal_cell (tuple[int, int]): case de sol d'arrivée
+
+        Returns:
+            list[NavigationLink]: liens à suivre dans l'ordre, None s'il n'y a pas de chemin
+        """
+        start_segment = self.get_segment(*start_cell)
+        goal_segment = self.get_segment(*goal_cell)
+
+        if (start_segment is None) or (goal_segment is None):
+            return None
+        if start_segment is goal_segment:
+            return []
+
+        goal_column = goal_cell[0]
+
+        # Un état est une plateforme et la colonne où l'on se trouve dessus
+        start_state = (start_segment.index, start_cell[0])
+        best_costs = {start_state: 0}
+        came_from = {}
+
+        # Le compteur départage les états de même coût sans avoir à comparer les liens
+        counter = 0
+        open_states = [(abs(start_cell[0] - goal_column), 0, counter, start_state)]
+
+        while open_states:
+            _, cost, _, state = heapq.heappop(open_states)
+            segment_index, column = state
+
+            if segment_index == goal_segment.index:
+                return self.rebuild_path(came_from, state)
+
+            if cost > best_costs[state]:
+                continue
+
+            for link in self.segments[segment_index].links:
+                next_state = (link.to_segment, link.to_column)
+                next_cost = cost + abs(column - link.from_column) + link.cost
+
+                if next_cost < best_costs.get(next_state, float('inf')):
+                    best_costs[next_state] = next_cost
+                    came_from[next_state] = (state, link)
+                    counter += 1
+                    heapq.heappush(open_states, (next_cost + abs(link.to_column - goal_column), next_cost, counter, next_state))
+
+        return None
+
+    def rebuild_path(self, came_from: dict, state: tuple[int, int]) -> list[NavigationLink]:
+        """Reconstruit la liste des liens qui mènent à un état
+
+        Args:
+            came_from (dict): état précédent et lien emprunté pour chaque état atteint
+            state (tuple[int, int]): état d'arrivée
+
+        Returns:
+            list[NavigationLink]: liens à suivre dans l'ordre
+        """
+        path = []
+        while state in came_from:
+            state, link = came_from[state]
+            path.append(link)
+
+        path.reverse()
+        return path
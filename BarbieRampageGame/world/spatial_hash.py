@@ -0,0 +1,108 @@
+import pygame
+
+# Classe qui range les sprites dans une grille pour ne tester que ceux qui sont proches
+class SpatialHash():
+    def __init__(self, cell_size: int):
+        """Initialise la grille de hachage spatial
+
+        Args:
+            cell_size (int): taille d'une case de la grille en pixel
+        """
+        self.cell_size = max(1, int(cell_size))
+        # Dictionnaire qui associe une case à l'ensemble des sprites qui la touchent
+        self.cells = {}
+        # Dictionnaire qui associe un sprite aux cases qu'il occupe
+        self.sprite_cells = {}
+
+    def get_cells(self, rect: pygame.Rect, x_offset: float = 0) -> tuple[int, int, int, int]:
+        """Renvoie les cases couvertes par un rectangle
+
+        Args:
+            rect (pygame.Rect): rectangle à placer dans la grille
+            x_offset (float, optional): décalage à ajouter sur l'axe horizontal pour passer en coordonnées du monde. 0 par défaut
+
+        Returns:
+            tuple[int, int, int, int]: première colonne, première ligne, dernière colonne et dernière ligne couvertes
+        """
+        left = int((rect.left + x_offset) // self.cell_size)
+        top = rect.top // self.cell_size
+        right = int((rect.right - 1 + x_offset) // self.cell_size)
+        bottom = (rect.bottom - 1) // self.cell_size
+
+        return left, top, max(left, right), max(top, bottom)
+
+    def update(self, sprite: pygame.sprite.Sprite, x_offset: float = 0):
+        """Ajoute un sprite à la grille ou met à jour sa position, rien n'est fait s'il n'a pas changé de case
+
+        Args:
+            sprite (pygame.sprite.Sprite): sprite à placer
+            x_offset (float, optional): décalage à ajouter sur l'axe horizontal pour passer en coordonnées du monde. 0 par défaut
+        """
+        new_cells = self.get_cells(sprite.rect, x_offset)
+        old_cells = self.sprite_cells.get(sprite)
+
+        if old_cells == new_cells:
+            return
+
+        if old_cells is not None:
+            self.remove_from_cells(sprite, old_cells)
+
+        left, top, right, bottom = new_cells
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                self.cells.setdefault((x, y), set()).add(sprite)
+
+        self.sprite_cells[sprite] = new_cells
+
+    def remove(self, sprite: pygame.sprite.Sprite):
+        """Enlève un sprite de la grille
+
+        Args:
+            sprite (pygame.sprite.Sprite): sprite à enlever
+        """
+        old_cells = self.sprite_cells.pop(sprite, None)
+        if old_cells is not None:
+            self.remove_from_cells(sprite, old_cells)
+
+    def remove_from_cells(self, sprite: pygame.sprite.Sprite, cells: tuple[int, int, int, int]):
+        """Enlève un sprite des cases données
+
+        Args:
+            sprite (pygame.sprite.Sprite): sprite à enlever
+            cells (tuple[int, int, int, int]): cases dans lesquelles le sprite se trouvait
+        """
+        left, top, right, bottom = cells
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self.cells.get((x, y))
+                if cell is not None:
+                    cell.discard(sprite)
+                    if not cell:
+                        del self.cells[(x, y)]
+
+    def query(self, rect: pygame.Rect, x_offset: float = 0) -> list[pygame.sprite.Sprite]:
+        """Renvoie les sprites qui se trouvent dans les cases couvertes par le rectangle (phase large)
+
+        Args:
+            rect (pygame.Rect): zone de recherche
+            x_offset (float, optional): décalage à ajouter sur l'axe horizontal pour passer en coordonnées du monde. 0 par défaut
+
+        Returns:
+            list[pygame.sprite.Sprite]: sprites proches du rectangle, sans doublons
+        """
+        left, top, right, bottom = self.get_cells(rect, x_offset)
+
+        found_sprites = set()
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self.cells.get((x, y))
+                if cell:
+                    found_sprites.update(cell)
+
+        return list(found_sprites)
+
+    def clear(self):
+        """Vide la grille
+        """
+        self.cells.clear()
+        self.sprite_cells.clear()
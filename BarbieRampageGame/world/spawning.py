@@ -0,0 +1,120 @@
+# Classe qui garde les informations d'un ennemi ou d'un objet du niveau sans créer son sprite
+class SpawnRecord():
+    # Les enregistrements existent pour tout le niveau, __slots__ les garde légers
+    __slots__ = ('tile_type', 'x', 'y', 'column', 'sprite', 'state', 'is_alive', 'collected')
+    
+    def __init__(self, tile_type: str, x: int, y: int, tile_size: int):
+        """Crée l'enregistrement d'un sprite du niveau
+
+        Args:
+            tile_type (str): type de la tuile qui a créé le sprite
+            x (int): position de création du sprite sur l'axe horizontal, en coordonnées du monde
+            y (int): position de création du sprite sur l'axe vertical
+            tile_size (int): taille des tuiles
+        """
+        self.tile_type = tile_type
+        self.x = x
+        self.y = y
+        self.column = int(x // tile_size)
+
+        # Sprite créé à partir de l'enregistrement, None tant qu'il est loin de la caméra
+        self.sprite = None
+        # État du sprite sauvegardé quand il a été retiré, pour le recréer à l'identique
+        self.state = {}
+
+        # Les ennemis morts et les objets ramassés restent comptés même quand leur sprite n'existe plus
+        self.is_alive = True
+        self.collected = False
+
+# Classe qui crée et retire les sprites du niveau en fonction de la position de la caméra
+class SpawnStreamer():
+    def __init__(self, tile_size: int, spawn_margin: int, despawn_margin: int):
+        """Initialise le gestionnaire d'apparition des sprites
+
+        Args:
+            tile_size (int): taille des tuiles
+            spawn_margin (int): nombre de colonnes en dehors de l'écran où les sprites sont créés
+            despawn_margin (int): nombre de colonnes en dehors de l'écran au-delà desquelles les sprites sont retirés, plus grand que spawn_margin pour éviter qu'un sprite apparaisse et disparaisse en boucle
+        """
+        self.tile_size = tile_size
+        self.spawn_margin = spawn_margin
+        self.despawn_margin = max(despawn_margin, spawn_margin + 1)
+
+        self.records = []
+        # Dictionnaire qui associe une colonne aux enregistrements dont le sprite n'existe pas
+        self.sleeping_columns = {}
+        # Enregistrements dont le sprite existe
+        self.active_records = []
+
+    def add_record(self, record: SpawnRecord):
+        """Ajoute un enregistrement, son sprite sera créé quand la caméra s'en approchera
+
+        Args:
+            record (SpawnRecord): enregistrement à ajouter
+        """
+        self.records.append(record)
+        self.sleeping_columns.setdefault(record.column, []).append(record)
+
+    def get_column_range(self, bg_scroll: float, screen_width: int, margin: int) -> tuple[int, int]:
+        """Renvoie les colonnes vues par la caméra, avec une marge de chaque côté
+
+        Args:
+            bg_scroll (float): défilement global du monde
+            screen_width (int): largeur de l'écran
+            margin (int): nombre de colonnes à ajouter de chaque côté
+
+        Returns:
+            tuple[int, int]: première et dernière colonne, incluses
+        """
+        first_column = int(bg_scroll // self.tile_size) - margin
+        last_column = int((bg_scroll + screen_width) // self.tile_size) + margin
+
+        return first_column, last_column
+
+    def get_records_to_spawn(self, bg_scroll: float, screen_width: int) -> list[SpawnRecord]:
+        """Enlève des colonnes endormies les enregistrements proches de la caméra et les renvoie
+
+        Args:
+            bg_scroll (float): défilement global du monde
+            screen_width (int): largeur de l'écran
+
+        Returns:
+            list[SpawnRecord]: enregistrements dont le sprite doit être créé
+        """
+        first_column, last_column = self.get_column_range(bg_scroll, screen_width, self.spawn_margin)
+
+        records = []
+        for column in range(first_column, last_column + 1):
+            column_records = self.sleeping_columns.pop(column, None)
+            if column_records:
+                records.extend(column_records)
+
+        self.active_records.extend(records)
+        return records
+
+    def get_records_to_despawn(self, bg_scroll: float, screen_width: int, get_column) -> list[SpawnRecord]:
+        """Renvoie les enregistrements dont le sprite est trop loin de la caméra et les remet dans les colonnes endormies
+
+        Args:
+            bg_scroll (float): défilement global du monde
+            screen_width (int): largeur de l'écran
+            get_column (function): fonction qui renvoie la colonne actuelle du sprite d'un enregistrement
+
+        Returns:
+            list[SpawnRecord]: enregistrements dont le sprite doit être retiré
+        """
+        first_column, last_column = self.get_column_range(bg_scroll, screen_width, self.despawn_margin)
+
+        records = []
+        still_active_records = []
+        for record in self.active_records:
+            column = get_column(record)
+            if first_column <= column <= last_column:
+                still_active_records.append(record)
+            else:
+                record.column = column
+                self.sleeping_columns.setdefault(column, []).append(record)
+                records.append(record)
+
+        self.active_records = still_active_records
+        return records
@@ -0,0 +1,106 @@
+from .collision import TileGrid
+
+# Classe qui précalcule où les entités peuvent marcher dans le niveau
+class WalkabilityMap():
+    def __init__(self, tile_grid: TileGrid):
+        """Précalcule les sols, les bords de plateformes et les murs du niveau pour que les ennemis n'aient plus à parcourir toutes les tuiles
+
+        Args:
+            tile_grid (TileGrid): grille des obstacles du niveau
+        """
+        self.tile_grid = tile_grid
+        self.columns = tile_grid.columns
+        self.rows = tile_grid.rows
+
+        solid = tile_grid.solid
+
+        # Nombre d'obstacles au-dessus de chaque ligne, pour compter les obstacles d'une partie de colonne en une soustraction
+        self.solid_counts = []
+        # Première ligne de sol à partir de chaque ligne en descendant, None s'il n'y a que du vide en dessous
+        self.ground_rows = []
+
+        for column in range(self.columns):
+            counts = [0]
+            for row in range(self.rows):
+                counts.append(counts[-1] + solid[column][row])
+            self.solid_counts.append(counts)
+
+            ground_rows = [None] * self.rows
+            next_ground = None
+            for row in reversed(range(self.rows)):
+                if self.is_surface(column, row):
+                    next_ground = row
+                ground_rows[row] = next_ground
+            self.ground_rows.append(ground_rows)
+
+        # Bords des plateformes, associés aux directions dans lesquelles le sol s'arrête
+        self.ledges = {}
+
+        for column in range(self.columns):
+            for row in range(self.rows):
+                if self.is_surface(column, row):
+                    open_directions = tuple(direction for direction in (-1, 1) if not self.is_surface(column + direction, row))
+                    if open_directions:
+                        self.ledges[(column, row)] = open_directions
+
+    def is_surface(self, column: int, row: int) -> bool:
+        """Vérifie si une case est un sol sur lequel on peut marcher, c'est-à-dire un obstacle sans obstacle au-dessus
+
+        Args:
+            column (int): colonne de la case
+            row (int): ligne de la case
+
+        Returns:
+            bool: si la case est un sol
+        """
+        return self.tile_grid.is_solid(column, row) and not self.tile_grid.is_solid(column, row - 1)
+
+    def count_solids(self, column: int, first_row: int, last_row: int) -> int:
+        """Compte les obstacles d'une partie de colonne
+
+        Args:
+            column (int): colonne
+            first_row (int): première ligne, incluse
+            last_row (int): dernière ligne, incluse
+
+        Returns:
+            int: nombre d'obstacles entre les deux lignes
+        """
+        if not (0 <= column < self.columns):
+            return 0
+
+        first_row = max(first_row, 0)
+        last_row = min(last_row, self.rows - 1)
+        if first_row > last_row:
+            return 0
+
+        counts = self.solid_counts[column]
+        return counts[last_row + 1] - counts[first_row]
+
+    def get_ground_row(self, column: int, row: int) -> int:
+        """Renvoie la ligne du premier sol sous une case, la case elle-même comprise
+
+        Args:
+            column (int): colonne
+            row (int): ligne à partir de laquelle chercher
+
+        Returns:
+            int: ligne du sol, None s'il n'y a que du vide en dessous
+        """
+        if not (0 <= column < self.columns) or row >= self.rows:
+            return None
+
+        return self.ground_rows[column][max(row, 0)]
+
+    def is_ledge(self, column: int, row: int, direction: int) -> bool:
+        """Vérifie si un sol s'arrête dans une direction donnée
+
+        Args:
+            column (int): colonne du sol
+            row (int): ligne du sol
+            direction (int): direction, 1 vers la droite et -1 vers la gauche
+
+        Returns:
+            bool: si le sol s'arrête dans cette direction
+        """
+        return direction in self.ledges.get((column, row), ())
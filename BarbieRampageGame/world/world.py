@@ -2,7 +2,14 @@ import pygame
 import json
 
 from constants import *
-import sprites, utils, inventory
+import sprites, utils, inventory, weapon
+from .background import ParallaxBackground
+from .spatial_hash import SpatialHash
+from .collision import SweepResult, TileGrid
+from .ai_scheduler import AIScheduler
+from .walkability import WalkabilityMap
+from .navigation import NavigationGraph
+from .spawning import SpawnRecord, SpawnStreamer
 
 # Classe qui permet de gérer le scrolling de l'écran
 class Scroll():
@@ -30,15 +37,18 @@ class Scroll():
 
 # Classe qui permet de créer les tuiles
 class Tile():
+    # Un niveau contient des milliers de tuiles, __slots__ évite de créer un dictionnaire par tuile
+    __slots__ = ('image', 'rect', 'initial_x_coordinate')
+    
     def __init__(self, image: pygame.Surface, tile_rect: pygame.Rect):
-        """Initialise une tuile de niveau
+        """Initialise une tuile de niveau, l'image est partagée par toutes les tuiles du même type
+        et les collisions passent par la grille du monde, la tuile n'a donc pas de masque
 
         Args:
             image (pygame.Surface): image de la tuile
             tile_rect (pygame.Rect): rectangle de la tuile
         """
         self.image = image
-        self.mask = pygame.mask.from_surface(self.image)
         self.rect = tile_rect
         self.initial_x_coordinate = self.rect.x
     
@@ -66,14 +76,39 @@ class World():
         self.current_level_index = 0
         self.world_data = []
         self.obstacle_list = []
+        self.tile_grid = None
+        self.walkability = None
+        # Graphes de navigation du niveau, rangés par limites de saut et de chute
+        self.navigation_graphs = {}
+        
+        # Visibilité du joueur déjà calculée depuis chaque case, valable tant que le joueur ne change pas de case
+        self.player_visibility = {}
+        self.visibility_player_cell = None
+        # Défilement utilisé pour placer les tuiles lors du dernier affichage, les collisions sont calculées dans ce repère
+        self.tiles_scroll = 0
         self.img_dict = {}
         self.killed = 0
         
         self.player = None
         self.scroll = None
         
+        # Ennemis et objets du niveau, leurs sprites ne sont créés que près de la caméra
+        self.spawn_streamer = None
+        self.assets = None
+        self.screen_width = 0
+        
+        # Modèles des armes chargés au début du niveau, pour que ramasser une arme ne charge aucune image
+        self.weapon_registry = weapon.WeaponRegistry()
+        
         self.load_sprite_groups()
         
+        self.ai_scheduler = AIScheduler(AI_FRAME_BUDGET, AI_FRAME_THINK_COUNT)
+        
+        self.background = ParallaxBackground(COLOR_SKY_BLUE)
+        
+        # Groupe de balles simulées ensemble avec NumPy, None si les balles sont des sprites classiques
+        self.bullet_batch = None
+        
         self.display_debug = False
     
     def load_sprite_groups(self):
@@ -87,6 +122,17 @@ class World():
         self.collectible_group = pygame.sprite.Group()
         self.enemy_group = pygame.sprite.Group()
         self.bullet_group = pygame.sprite.Group()
+        
+        self.load_spatial_hashes(1)
+    
+    def load_spatial_hashes(self, cell_size: int):
+        """Crée les grilles de hachage spatial des sprites qui bougent, elles sont en coordonnées du monde pour ne pas dépendre du défilement
+
+        Args:
+            cell_size (int): taille d'une case des grilles en pixel
+        """
+        self.enemy_hash = SpatialHash(cell_size)
+        self.collectible_hash = SpatialHash(cell_size)
     
     def empty_sprite_groups(self):
         """Vide les groupes de sprites
@@ -96,6 +142,38 @@ class World():
         self.collectible_group.empty()
         self.enemy_group.empty()
         self.bullet_group.empty()
+        
+        self.enemy_hash.clear()
+        self.collectible_hash.clear()
+        
+        if self.bullet_batch is not None:
+            self.bullet_batch.empty()
+    
+    def set_bullet_batching(self, do_batch_bullets: bool):
+        """Active ou désactive la simulation groupée des balles
+
+        Args:
+            do_batch_bullets (bool): si les balles doivent être simulées ensemble avec NumPy
+        """
+        if do_batch_bullets and not weapon.BulletBatch.is_available():
+            print("NumPy is not installed, bullets will not be batched")
+            do_batch_bullets = False
+        
+        if do_batch_bullets:
+            if self.bullet_batch is None:
+                self.bullet_batch = weapon.BulletBatch()
+        else:
+            self.bullet_batch = None
+    
+    def get_bullet_container(self):
+        """Renvoie l'endroit où les nouvelles balles doivent être ajoutées
+
+        Returns:
+            pygame.sprite.Group or BulletBatch: groupe de balles utilisé par le monde
+        """
+        if self.bullet_batch is not None:
+            return self.bullet_batch
+        return self.bullet_group
     
     def load_tiles_images(self, tile_size: int):
         """Charge les images des tuiles
@@ -174,6 +252,8 @@ class World():
         
         self.load_tiles_images(self.tile_size)
         
+        self.screen_width = settings.screen_width
+        
         # Initialise le scrolling du niveau
         if self.scroll == None:
             self.scroll = Scroll(self.tile_size)
@@ -186,6 +266,13 @@ class World():
         for image_name in background_image_names:
             self.background_images.append(assets.get_image(image_name, f"{BACKGROUND_TEXTURES_LOCATION}{image_name}.png", settings.screen_width, 0))
         
+        # Vitesse de défilement de chaque couche, les couches les plus proches défilent plus vite
+        default_scroll_factors = [BACKGROUND_SCROLL_FACTOR * (i + 1) for i in range(len(self.background_images))]
+        background_scroll_factors = self.world_json['attributes'].get('background_scroll_factors', default_scroll_factors)
+        
+        # Pré-assemble les couches de l'arrière-plan une seule fois pour tout le niveau
+        self.background.load_layers(self.background_images, background_scroll_factors, settings.screen_width, settings.screen_height)
+        
         for col in range(self.world_json['attributes']['level_size']):
             r = ['air'] * self.world_json['attributes']['level_height']
             self.world_data.append(r)
@@ -193,6 +280,14 @@ class World():
         # Ajout de toutes les tuiles dans le monde
         for tile in self.world_json['tiles']:
             self.world_data[tile['x']][tile['y']] = tile['type']
+        
+        # Grille des obstacles utilisée pour les collisions
+        self.tile_grid = TileGrid(self.world_data, self.tile_size)
+        # Sols, bords et murs précalculés pour les déplacements des ennemis
+        self.walkability = WalkabilityMap(self.tile_grid)
+        self.navigation_graphs = {}
+        self.player_visibility = {}
+        self.visibility_player_cell = None
 
 
     def process_data(self, assets: utils.Assets, player_inventory: inventory.Inventory = None) -> sprites.Player:
@@ -205,12 +300,22 @@ class World():
             Player: joueur créé dans le monde
         """
         self.empty_sprite_groups()
+        self.load_spatial_hashes(self.tile_size * 2)
+        self.ai_scheduler.reset()
+        # Les évènements programmés appartiennent aux sprites du niveau précédent
+        utils.SimulationClock.get_instance().clear_timers()
         
         self.scroll.bg_scroll = 0
+        self.tiles_scroll = 0
         self.obstacle_list = []
         
         self.level_length = self.world_json['attributes']['level_size']
         self.enemies = 0
+        self.killed = 0
+        
+        self.assets = assets
+        self.weapon_registry.preload(assets, self.tile_size)
+        self.spawn_streamer = SpawnStreamer(self.tile_size, SPAWN_MARGIN_COLUMNS, DESPAWN_MARGIN_COLUMNS)
         
         if player_inventory == None:
             player_inventory = inventory.Inventory()
@@ -221,50 +326,382 @@ class World():
                 # Si c'est un obstacle
                 if tile in OBSTACLES_TILE_TYPES:
                     img = self.img_dict[tile]
-                    img_rect = img.get_rect()
-                    img_rect.x = x * self.tile_size
-                    img_rect.y = y * self.tile_size
-                    if tile in OBSTACLES_TILE_TYPES:
-                        tile_data = Tile(img, img_rect)
-                        self.obstacle_list.append(tile_data)
+                    img_rect = pygame.Rect(x * self.tile_size, y * self.tile_size, img.get_width(), img.get_height())
+                    self.obstacle_list.append(Tile(img, img_rect))
                 
-                elif tile in ENTITY_TILE_TYPES:
-                    if tile in COLLECTIBLES_TILE_TYPES:
-                        # Si c'est une Ammo box
-                        if tile == COLLECTIBLES_TILE_TYPES[0]:
-                            box = sprites.AmmoBox(x * self.tile_size, y * self.tile_size, assets, self.tile_size)
-                            self.collectible_group.add(box)
-                        # Si c'est une Health Box
-                        elif tile == COLLECTIBLES_TILE_TYPES[1]:
-                            box = sprites.HealthBox(x * self.tile_size, y * self.tile_size, assets, self.tile_size)
-                            self.collectible_group.add(box)
-                        # Si c'est une Weapon Crate
-                        elif tile == COLLECTIBLES_TILE_TYPES[2]:
-                            box = sprites.WeaponCrate(x * self.tile_size, y * self.tile_size, assets, self.tile_size)
-                            self.collectible_group.add(box)
-                        # Si c'est un drapeau de fin de niveau
-                        elif tile == COLLECTIBLES_TILE_TYPES[3]:
-                            finish_flag = sprites.FinishLevelFlag(x * self.tile_size, y * self.tile_size, assets, self.tile_size)
-                            self.collectible_group.add(finish_flag)
-                    
-                # Si c'est un personnage comme le joueur ou un ennemi
-                elif tile in PLAYER_AND_ENEMIES_TILE_TYPES:
-                    # Si c'est le point de spawn du joueur
-                    if tile == PLAYER_AND_ENEMIES_TILE_TYPES[0]:
-                        self.player = sprites.Player(x * self.tile_size, y * self.tile_size, self.tile_size, assets, player_inventory)
-                        self.player_group.add(self.player)
-                    # Si c'est un dummy
-                    elif tile == PLAYER_AND_ENEMIES_TILE_TYPES[1]:
-                        dummy = sprites.Dummy(x * self.tile_size, y * self.tile_size, self.tile_size, 2, assets)
-                        self.enemy_group.add(dummy)
-                        self.enemies += 1
-                    elif tile == PLAYER_AND_ENEMIES_TILE_TYPES[2]:
-                        ken = sprites.KenEnemy(x * self.tile_size, y * self.tile_size, self.tile_size, 2, assets)
-                        self.enemy_group.add(ken)
+                # Si c'est le point de spawn du joueur
+                elif tile == PLAYER_AND_ENEMIES_TILE_TYPES[0]:
+                    self.player = sprites.Player(x * self.tile_size, y * self.tile_size, self.tile_size, assets, player_inventory)
+                    self.player_group.add(self.player)
+                
+                # Si c'est un objet ou un ennemi, seul son enregistrement est créé
+                elif (tile in ENTITY_TILE_TYPES) or (tile in PLAYER_AND_ENEMIES_TILE_TYPES):
+                    self.spawn_streamer.add_record(SpawnRecord(tile, x * self.tile_size, y * self.tile_size, self.tile_size))
+                    if tile in PLAYER_AND_ENEMIES_TILE_TYPES:
                         self.enemies += 1
         
+        self.load_navigation_graphs()
+        
+        # Crée les sprites qui sont près de la caméra au début du niveau
+        self.stream_spawns()
+        
         return self.player
     
+    def load_navigation_graphs(self):
+        """Construit au chargement du niveau les graphes de navigation des ennemis du niveau, pour qu'aucun ne soit construit pendant la partie
+        """
+        loaded_tile_types = set()
+        
+        for record in self.spawn_streamer.records:
+            if (record.tile_type not in PLAYER_AND_ENEMIES_TILE_TYPES) or (record.tile_type in loaded_tile_types):
+                continue
+            loaded_tile_types.add(record.tile_type)
+            
+            # Un ennemi de chaque type est créé sans être ajouté au monde, seulement pour connaître ses limites de saut et de chute
+            navigation_limits = getattr(self.create_record_sprite(record), 'navigation_limits', None)
+            if navigation_limits is not None:
+                self.get_navigation_graph(*navigation_limits)
+    
+    def create_record_sprite(self, record: SpawnRecord) -> pygame.sprite.Sprite:
+        """Crée le sprite d'un enregistrement à sa position actuelle
+
+        Args:
+            record (SpawnRecord): enregistrement de l'ennemi ou de l'objet
+
+        Returns:
+            pygame.sprite.Sprite: sprite créé
+        """
+        x = record.x - self.scroll.bg_scroll
+        
+        # Si c'est une Ammo box
+        if record.tile_type == COLLECTIBLES_TILE_TYPES[0]:
+            return sprites.AmmoBox(record.x, record.y, self.assets, self.tile_size)
+        # Si c'est une Health Box
+        elif record.tile_type == COLLECTIBLES_TILE_TYPES[1]:
+            return sprites.HealthBox(record.x, record.y, self.assets, self.tile_size)
+        # Si c'est une Weapon Crate
+        elif record.tile_type == COLLECTIBLES_TILE_TYPES[2]:
+            return sprites.WeaponCrate(record.x, record.y, self.assets, self.tile_size, self.weapon_registry)
+        # Si c'est un drapeau de fin de niveau
+        elif record.tile_type == COLLECTIBLES_TILE_TYPES[3]:
+            return sprites.FinishLevelFlag(record.x, record.y, self.assets, self.tile_size)
+        # Si c'est un dummy
+        elif record.tile_type == PLAYER_AND_ENEMIES_TILE_TYPES[1]:
+            return sprites.Dummy(x, record.y, self.tile_size, 2, self.assets)
+        elif record.tile_type == PLAYER_AND_ENEMIES_TILE_TYPES[2]:
+            return sprites.KenEnemy(x, record.y, self.tile_size, 2, self.assets)
+    
+    def spawn_record(self, record: SpawnRecord):
+        """Crée le sprite d'un enregistrement, lui redonne son état sauvegardé et l'ajoute au monde
+
+        Args:
+            record (SpawnRecord): enregistrement de l'ennemi ou de l'objet
+        """
+        sprite = self.create_record_sprite(record)
+        record.sprite = sprite
+        
+        if record.tile_type in PLAYER_AND_ENEMIES_TILE_TYPES:
+            if record.state:
+                sprite.relative_initial_x = record.state['patrol_x'] - self.scroll.bg_scroll
+                sprite.health = record.state['health']
+                sprite.flip = record.state['flip']
+            sprite.display_debug = self.display_debug
+            self.enemy_group.add(sprite)
+            self.update_enemy_position(sprite)
+        else:
+            # Place l'objet à l'écran avant qu'il soit rangé dans la grille
+            sprite.scroll(self)
+            if record.state:
+                sprite.rect.y = record.state['y']
+                sprite.is_sleeping = record.state['is_sleeping']
+            if record.collected:
+                sprite.set_collected()
+            self.collectible_group.add(sprite)
+            self.update_collectible_position(sprite)
+    
+    def despawn_record(self, record: SpawnRecord):
+        """Sauvegarde l'état du sprite d'un enregistrement puis le retire du monde
+
+        Args:
+            record (SpawnRecord): enregistrement de l'ennemi ou de l'objet
+        """
+        sprite = record.sprite
+        
+        if record.tile_type in PLAYER_AND_ENEMIES_TILE_TYPES:
+            # Les ennemis seront recréés là où ils se trouvent
+            record.x = sprite.rect.centerx + self.scroll.bg_scroll
+            record.y = sprite.rect.centery
+            record.state = {'patrol_x': sprite.relative_initial_x + self.scroll.bg_scroll, 'health': sprite.health, 'flip': sprite.flip}
+            self.update_record_alive(record)
+            self.enemy_hash.remove(sprite)
+        else:
+            record.state = {'y': sprite.rect.y, 'is_sleeping': sprite.is_sleeping}
+            record.collected = sprite.collected
+            self.collectible_hash.remove(sprite)
+        
+        sprite.kill()
+        record.sprite = None
+    
+    def stream_spawns(self):
+        """Crée les sprites qui s'approchent de la caméra et retire ceux qui s'en sont trop éloignés
+        """
+        bg_scroll = self.scroll.bg_scroll
+        
+        for record in self.spawn_streamer.get_records_to_despawn(bg_scroll, self.screen_width, self.get_record_column):
+            self.despawn_record(record)
+        
+        for record in self.spawn_streamer.get_records_to_spawn(bg_scroll, self.screen_width):
+            self.spawn_record(record)
+    
+    def get_record_column(self, record: SpawnRecord) -> int:
+        """Renvoie la colonne où se trouve actuellement le sprite d'un enregistrement
+
+        Args:
+            record (SpawnRecord): enregistrement dont le sprite existe
+
+        Returns:
+            int: colonne du milieu du sprite
+        """
+        return int((record.sprite.rect.centerx + self.scroll.bg_scroll) // self.tile_size)
+    
+    def update_record_alive(self, record: SpawnRecord):
+        """Sauvegarde la mort du sprite d'un ennemi dans son enregistrement, l'ennemi n'est compté qu'une seule fois
+
+        Args:
+            record (SpawnRecord): enregistrement de l'ennemi dont le sprite existe
+        """
+        if record.is_alive and not record.sprite.is_alive:
+            record.is_alive = False
+            self.killed += 1
+    
+    def update_killed_enemies(self):
+        """Compte les ennemis morts pendant la frame, seuls les enregistrements dont le sprite existe sont parcourus
+        """
+        for record in self.spawn_streamer.active_records:
+            if record.tile_type in PLAYER_AND_ENEMIES_TILE_TYPES:
+                self.update_record_alive(record)
+    
+    def update_enemy_position(self, enemy: pygame.sprite.Sprite):
+        """Met à jour la position d'un ennemi dans la grille de hachage spatial
+
+        Args:
+            enemy (pygame.sprite.Sprite): ennemi qui a bougé
+        """
+        self.enemy_hash.update(enemy, self.scroll.bg_scroll)
+    
+    def update_collectible_position(self, collectible: pygame.sprite.Sprite):
+        """Met à jour la position d'un objet collectible dans la grille de hachage spatial
+
+        Args:
+            collectible (pygame.sprite.Sprite): objet qui a bougé
+        """
+        self.collectible_hash.update(collectible, self.scroll.bg_scroll)
+    
+    def get_sprites_near(self, spatial_hash: SpatialHash, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Renvoie les sprites d'une grille de hachage spatial dont le rectangle touche celui donné
+
+        Args:
+            spatial_hash (SpatialHash): grille dans laquelle chercher
+            rect (pygame.Rect): rectangle à l'écran
+
+        Returns:
+            list[pygame.sprite.Sprite]: sprites qui touchent le rectangle
+        """
+        return [sprite for sprite in spatial_hash.query(rect, self.scroll.bg_scroll) if rect.colliderect(sprite.rect)]
+    
+    def get_enemies_near(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Renvoie les ennemis dont le rectangle touche celui donné
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran
+
+        Returns:
+            list[pygame.sprite.Sprite]: ennemis qui touchent le rectangle
+        """
+        return self.get_sprites_near(self.enemy_hash, rect)
+    
+    def get_collectibles_near(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Renvoie les objets collectibles dont le rectangle touche celui donné
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran
+
+        Returns:
+            list[pygame.sprite.Sprite]: objets qui touchent le rectangle
+        """
+        return self.get_sprites_near(self.collectible_hash, rect)
+    
+    def sweep_rect(self, rect: pygame.Rect, delta_x: float, delta_y: float) -> SweepResult:
+        """Déplace un rectangle contre les tuiles du monde sans qu'il puisse passer à travers, même s'il va très vite
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran
+            delta_x (float): déplacement voulu sur l'axe horizontal
+            delta_y (float): déplacement voulu sur l'axe vertical
+
+        Returns:
+            SweepResult: déplacement autorisé, moments et normales des contacts
+        """
+        return self.tile_grid.sweep(rect, delta_x, delta_y, self.tiles_scroll)
+    
+    def get_rect_tiles(self, rect: pygame.Rect) -> tuple[list[int], int, int]:
+        """Renvoie les cases de la grille couvertes par un rectangle
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran
+
+        Returns:
+            tuple[list[int], int, int]: colonnes couvertes, première et dernière ligne couvertes
+        """
+        columns = self.tile_grid.get_overlapping_columns(rect.left, rect.right, self.tiles_scroll)
+        return columns, rect.top // self.tile_size, (rect.bottom - 1) // self.tile_size
+    
+    def rect_hits_obstacle(self, rect: pygame.Rect) -> bool:
+        """Vérifie si un rectangle touche une tuile du monde
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran
+
+        Returns:
+            bool: si le rectangle touche une tuile
+        """
+        columns, first_row, last_row = self.get_rect_tiles(rect)
+        
+        for column in columns:
+            if self.walkability.count_solids(column, first_row, last_row) > 0:
+                return True
+        return False
+    
+    def rect_has_ground(self, rect: pygame.Rect) -> bool:
+        """Vérifie si un sol se trouve dans la hauteur d'un rectangle, sous au moins une de ses colonnes
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran
+
+        Returns:
+            bool: si un sol se trouve dans le rectangle
+        """
+        columns, first_row, last_row = self.get_rect_tiles(rect)
+        
+        for column in columns:
+            ground_row = self.walkability.get_ground_row(column, first_row)
+            if (ground_row is not None) and (ground_row <= last_row):
+                return True
+        return False
+    
+    def get_column(self, x: float) -> int:
+        """Renvoie la colonne de la grille qui contient une position à l'écran
+
+        Args:
+            x (float): position sur l'axe horizontal à l'écran
+
+        Returns:
+            int: colonne de la grille
+        """
+        return int((x + self.tiles_scroll) // self.tile_size)
+    
+    def get_standing_cell(self, rect: pygame.Rect) -> tuple[int, int]:
+        """Renvoie la case de sol sur laquelle se tient un rectangle
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran, généralement une hitbox
+
+        Returns:
+            tuple[int, int]: case de sol sous le milieu du rectangle, None s'il n'est pas posé sur un sol
+        """
+        column = self.get_column(rect.centerx)
+        row = rect.bottom // self.tile_size
+        
+        if self.walkability.is_surface(column, row):
+            return column, row
+        return None
+    
+    def is_ledge_ahead(self, rect: pygame.Rect, direction: int) -> bool:
+        """Vérifie si le sol sur lequel se tient un rectangle s'arrête dans une direction, à l'aide des bords de plateformes précalculés
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran, généralement une hitbox
+            direction (int): direction, 1 vers la droite et -1 vers la gauche
+
+        Returns:
+            bool: si le sol s'arrête dans cette direction, True aussi si le rectangle n'est pas posé sur un sol
+        """
+        cell = self.get_standing_cell(rect)
+        
+        if cell is None:
+            return True
+        return self.walkability.is_ledge(cell[0], cell[1], direction)
+    
+    def get_ground_cell(self, rect: pygame.Rect) -> tuple[int, int]:
+        """Renvoie la première case de sol sous un rectangle, même s'il est en l'air
+
+        Args:
+            rect (pygame.Rect): rectangle à l'écran, généralement une hitbox
+
+        Returns:
+            tuple[int, int]: case de sol sous le milieu du rectangle, None s'il n'y a que du vide en dessous
+        """
+        column = self.get_column(rect.centerx)
+        row = self.walkability.get_ground_row(column, rect.bottom // self.tile_size)
+        
+        if row is None:
+            return None
+        return column, row
+    
+    def get_cell(self, x: float, y: float) -> tuple[int, int]:
+        """Renvoie la case de la grille qui contient un point à l'écran
+
+        Args:
+            x (float): position sur l'axe horizontal à l'écran
+            y (float): position sur l'axe vertical
+
+        Returns:
+            tuple[int, int]: colonne et ligne de la case
+        """
+        return self.get_column(x), int(y // self.tile_size)
+    
+    def is_player_visible_from(self, x: float, y: float) -> bool:
+        """Vérifie si le joueur est visible depuis un point. Le résultat est partagé par tous les ennemis qui regardent depuis la même case
+        et il est oublié dès que le joueur change de case
+
+        Args:
+            x (float): position du regard sur l'axe horizontal à l'écran
+            y (float): position du regard sur l'axe vertical
+
+        Returns:
+            bool: si aucune tuile ne se trouve entre le point et la tête du joueur
+        """
+        player_cell = self.get_cell(self.player.rect.centerx, self.player.get_head_y())
+        
+        if player_cell != self.visibility_player_cell:
+            self.player_visibility.clear()
+            self.visibility_player_cell = player_cell
+        
+        source_cell = self.get_cell(x, y)
+        
+        if source_cell not in self.player_visibility:
+            self.player_visibility[source_cell] = self.tile_grid.is_line_clear(source_cell, player_cell)
+        
+        return self.player_visibility[source_cell]
+    
+    def get_navigation_graph(self, max_jump_rows: int, max_jump_columns: int, max_fall_rows: int) -> NavigationGraph:
+        """Renvoie le graphe de navigation qui correspond à des limites de saut et de chute, les graphes des ennemis du niveau sont construits à son chargement
+
+        Args:
+            max_jump_rows (int): nombre de lignes qu'un saut permet de monter
+            max_jump_columns (int): nombre de colonnes de vide qu'un saut permet de franchir
+            max_fall_rows (int): nombre de lignes dont on peut tomber
+
+        Returns:
+            NavigationGraph: graphe de navigation du niveau
+        """
+        key = (max_jump_rows, max_jump_columns, max_fall_rows)
+        
+        if key not in self.navigation_graphs:
+            self.navigation_graphs[key] = NavigationGraph(self.walkability, max_jump_rows, max_jump_columns, max_fall_rows)
+        
+        return self.navigation_graphs[key]
+    
     def draw(self, screen: pygame.Surface):
         """Méthode qui permet d'afficher le monde
 
@@ -273,6 +710,7 @@ class World():
         """
         self.draw_background(screen)
         
+        self.tiles_scroll = self.scroll.bg_scroll
         for tile in self.obstacle_list:
             tile.scroll_tile(self.scroll.bg_scroll)
             tile.draw(screen)
@@ -283,10 +721,7 @@ class World():
         Args:
             screen (pygame.Surface): écran sur lequel le background doit être affiché
         """
-        screen.fill(COLOR_SKY_BLUE)
-        width = self.background_images[0].get_width()
-        for x in range(5):
-            screen.blit(self.background_images[0], ((x * width) - self.scroll.bg_scroll * 0.2, 0))
+        self.background.draw(screen, self.scroll.bg_scroll)
     
     def draw_sprite_groups(self, screen: pygame.Surface):
         """Méthode qui permet d'afficher les groupes de sprites
@@ -297,6 +732,9 @@ class World():
         for bullet in self.bullet_group:
             bullet.draw(screen)
         
+        if self.bullet_batch is not None:
+            self.bullet_batch.draw(screen)
+        
         for enemy in self.enemy_group:
             enemy.draw(screen)
             
@@ -306,14 +744,25 @@ class World():
     def update_groups(self):
         """Met à jour les groupes de sprites
         """
+        self.stream_spawns()
+        
         self.bullet_group.update(self)
-        self.killed = 0
+        if self.bullet_batch is not None:
+            self.bullet_batch.update(self)
         for enemy in self.enemy_group :
             enemy.update()
-            if not enemy.is_alive:
-                self.killed += 1
+        self.update_killed_enemies()
         self.collectible_group.update(self)
         
+    def update_enemies_ai(self):
+        """Fait réfléchir et déplacer les ennemis, la réflexion est répartie sur plusieurs frames par l'ordonnanceur
+        """
+        # Pendant un enregistrement ou une rediffusion, les ennemis qui réfléchissent ne doivent pas dépendre de la vitesse de la machine
+        user_inputs = utils.UserInputStates.get_instance()
+        is_deterministic = user_inputs.is_recording or user_inputs.is_replaying
+        
+        self.ai_scheduler.update(list(self.enemy_group), self, is_deterministic)
+    
     def set_debug_display(self, display: bool):
         """Méthode qui permet d'afficher les hitboxes et les lignes de vision des ennemis
 